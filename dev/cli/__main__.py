@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import cyclopts
 
-from . import ai, docs
+from . import ai, bench, docs
 from .build import build
 from .publish import publish
 
 app = cyclopts.App(
-    help="Development commands for docs, skills, builds, and publishing."
+    help="Development commands for docs, skills, benchmarks, builds, and publishing."
 )
 app.command(docs.app, name="docs")
 app.command(ai.app, name="ai")
+app.command(bench.app, name="bench")
 app.command(build)
 app.command(publish)
 
@@ -0,0 +1,604 @@
+"""Benchmark commands for dictify internals."""
+
+from __future__ import annotations
+
+import pickle
+import re
+import subprocess
+import sys
+import tempfile
+import timeit
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import cyclopts
+
+from dictify import Field, Model
+
+from .common import ROOT
+
+app = cyclopts.App(help="Run dictify performance benchmarks.")
+
+
+class Item(Model):
+    sku: str = Field(required=True).verify(lambda value: len(value) <= 32)
+    price: float = Field(default=0.0)
+    quantity: int = Field(default=1)
+
+
+class TrustedItem(Item, pickle_validate=False):
+    pass
+
+
+class CompactItem(Item, compact=True):
+    pass
+
+
+def parse_bool(value: str) -> bool:
+    return {"true": True, "false": False}[value.lower()]
+
+
+# String fields parsed by hand-written validators, as written before
+# ``coerce=True`` existed. The parsers run once to validate and once more
+# to convert.
+PARSERS = {
+    "count": int,
+    "price": float,
+    "active": parse_bool,
+    "amount": Decimal,
+    "token": uuid.UUID,
+    "created": datetime.fromisoformat,
+}
+
+
+class ParsedRow(Model):
+    count: str = Field(required=True).func(int)
+    price: str = Field(required=True).func(float)
+    active: str = Field(required=True).func(parse_bool)
+    amount: str = Field(required=True).func(Decimal)
+    token: str = Field(required=True).func(uuid.UUID)
+    created: str = Field(required=True).func(datetime.fromisoformat)
+
+
+class CoercedRow(Model, coerce=True):
+    count: int = Field(required=True)
+    price: float = Field(required=True)
+    active: bool = Field(required=True)
+    amount: Decimal = Field(required=True)
+    token: uuid.UUID = Field(required=True)
+    created: datetime = Field(required=True)
+
+
+class OrderLine(Model):
+    sku: str = Field(required=True).max_len(32)
+    quantity: int = Field(default=1).min(1)
+
+
+class Order(Model):
+    id: int = Field(required=True)
+    lines: list[OrderLine] = Field(default=list)
+    note: str | None = Field(default=None)
+
+
+MODEL_TEMPLATE = """
+class Model{index}(Model{options}):
+    id: int = Field(required=True)
+    name: str = Field(default="")
+    tags: list[str] = Field(default=list)
+    score: int | float = Field(default=0)
+"""
+
+
+def write_models_module(path: Path, count: int, lazy: bool) -> None:
+    """Write a module declaring ``count`` Model classes."""
+
+    options = ", lazy=True" if lazy else ""
+    lines = [
+        "from __future__ import annotations",
+        "",
+        "from dictify import Field, Model",
+    ]
+    lines.extend(
+        MODEL_TEMPLATE.format(index=index, options=options) for index in range(count)
+    )
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def measure_import_us(directory: Path, module: str, cache: Path | None = None) -> int:
+    """Return the cumulative ``-X importtime`` microseconds for ``module``."""
+
+    setup = "import dictify"
+    if cache is not None:
+        setup += f"; dictify.Model.load_schema_cache({str(cache)!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{setup}; import {module}"],
+        cwd=directory,
+        env={"PYTHONPATH": f"{directory}:{ROOT / 'src'}"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, _, columns = line.partition("import time:")
+        fields = [field.strip() for field in columns.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"import time for {module} not found")
+
+
+@app.command(name="import-time")
+def import_time(*, models: int = 1500, repeat: int = 5) -> None:
+    """Compare module import time for eager, cached, and ``lazy=True`` models."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_models_module(directory / "eager_models.py", models, lazy=False)
+        write_models_module(directory / "lazy_models.py", models, lazy=True)
+
+        cache = directory / "schema.cache"
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import dictify, eager_models; "
+                f"dictify.Model.save_schema_cache({str(cache)!r})",
+            ],
+            cwd=directory,
+            env={"PYTHONPATH": f"{directory}:{ROOT / 'src'}"},
+            check=True,
+        )
+
+        eager = min(measure_import_us(directory, "eager_models") for _ in range(repeat))
+        cached = min(
+            measure_import_us(directory, "eager_models", cache) for _ in range(repeat)
+        )
+        lazy = min(measure_import_us(directory, "lazy_models") for _ in range(repeat))
+
+    print(f"models: {models}, best of {repeat}")
+    print(f"eager:  {eager / 1000:10.1f} ms")
+    print(f"cached: {cached / 1000:10.1f} ms  ({eager / cached:.1f}x faster)")
+    print(f"lazy:   {lazy / 1000:10.1f} ms  ({eager / lazy:.1f}x faster)")
+
+
+@app.command(name="pickle")
+def pickle_size(*, count: int = 10_000) -> None:
+    """Report pickle payload size and round-trip time for Model instances."""
+
+    data = {"sku": "sku-1", "price": 9.5, "quantity": 3}
+    items = [Item(data) for _ in range(count)]
+    trusted = [TrustedItem(data) for _ in range(count)]
+
+    print(f"instances: {count}")
+    print(f"dict payload:  {len(pickle.dumps([dict(item) for item in items])):>9} B")
+    for label, values in (("validated", items), ("trusted", trusted)):
+        payload = pickle.dumps(values)
+        seconds = timeit.timeit(lambda: pickle.loads(payload), number=3) / 3
+        print(
+            f"{label:<9} payload: {len(payload):>9} B  loads: {seconds * 1000:8.1f} ms"
+        )
+
+
+@app.command(name="threads")
+def threads(*, records: int = 20_000, max_threads: int = 8) -> None:
+    """Report Model construction throughput for increasing thread counts.
+
+    Scaling above one thread is only expected on free-threaded CPython builds.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+    from time import perf_counter
+
+    data = {"sku": "sku-1", "price": 9.5, "quantity": 3}
+
+    def build(count: int) -> None:
+        for _ in range(count):
+            Item(data)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python: {sys.version.split()[0]}, GIL enabled: {gil}")
+    baseline = None
+    workers = 1
+    while workers <= max_threads:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            start = perf_counter()
+            list(pool.map(build, [records // workers] * workers))
+            elapsed = perf_counter() - start
+        rate = records / elapsed
+        baseline = baseline or rate
+        print(f"threads: {workers:>3}  {rate:12,.0f} ops/s  {rate / baseline:5.2f}x")
+        workers *= 2
+
+
+@app.command(name="memory")
+def memory(*, count: int = 100_000) -> None:
+    """Compare memory per instance of the default and ``compact=True`` layouts."""
+
+    import tracemalloc
+
+    data = [{"sku": f"sku-{index}", "price": 9.5} for index in range(count)]
+    results = {}
+    for label, cls in (("default", Item), ("compact", CompactItem)):
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        items = [cls(values) for values in data]
+        results[label] = (tracemalloc.get_traced_memory()[0] - start) / len(items)
+        tracemalloc.stop()
+        del items
+
+    print(f"instances: {count}")
+    print(f"default: {results['default']:8.1f} B/instance")
+    print(
+        f"compact: {results['compact']:8.1f} B/instance  "
+        f"({results['default'] / results['compact']:.1f}x smaller)"
+    )
+
+
+@app.command(name="defaults")
+def defaults(*, fields: int = 100, count: int = 20_000) -> None:
+    """Report construction time of a wide model from sparse input.
+
+    Half of the fields use a ``list`` default factory and half an ``int``
+    literal default, and each record sets only three of them.
+    """
+
+    namespace = {
+        f"field_{index}": Field(default=list if index % 2 else 0)
+        for index in range(fields)
+    }
+    namespace["__annotations__"] = {
+        f"field_{index}": list if index % 2 else int for index in range(fields)
+    }
+    Wide = type("Wide", (Model,), namespace)
+    data = {"field_0": 1, "field_1": [2], "field_2": 3}
+
+    seconds = timeit.timeit(lambda: Wide(data), number=count)
+    print(f"fields: {fields}, set per record: {len(data)}")
+    print(f"construct: {seconds / count * 1e6:8.1f} us")
+
+
+@app.command(name="coerce")
+def coerce(*, count: int = 20_000) -> None:
+    """Compare ``coerce=True`` with hand-written parsing validators."""
+
+    row = {
+        "count": "12",
+        "price": "9.5",
+        "active": "true",
+        "amount": "10.25",
+        "token": str(uuid.uuid4()),
+        "created": "2024-05-01T12:30:00",
+    }
+
+    def parsed():
+        data = ParsedRow(row)
+        return {key: PARSERS[key](value) for key, value in data.items()}
+
+    assert parsed() == CoercedRow(row)
+    results = {
+        "validators": timeit.timeit(parsed, number=count) / count,
+        "coerce": timeit.timeit(lambda: CoercedRow(row), number=count) / count,
+    }
+    print(f"fields: {len(row)}, records: {count}")
+    for label, seconds in results.items():
+        speedup = results["validators"] / seconds
+        print(f"{label:<10} {seconds * 1e6:8.1f} us  ({speedup:.1f}x)")
+
+
+@app.command(name="constraints")
+def constraints(*, count: int = 100_000) -> None:
+    """Compare declarative validators with equivalent ``verify()`` lambdas."""
+
+    tags = ["a", "b", "c"]
+    cases = {
+        "number": (
+            Field().instance(int).verify(lambda v: v >= 0).verify(lambda v: v <= 100),
+            Field().instance(int).min(0).max(100),
+            42,
+        ),
+        "text": (
+            Field()
+            .instance(str)
+            .verify(lambda v: len(v) > 0)
+            .verify(lambda v: len(v) <= 16)
+            .verify(lambda v: v not in ("admin", "root")),
+            Field().instance(str).nonempty().max_len(16).noneof(["admin", "root"]),
+            "user-1",
+        ),
+        "list": (
+            Field()
+            .instance(list)
+            .verify(lambda v: len(v) <= 8)
+            .verify(lambda v: len(set(v)) == len(v)),
+            Field().instance(list).max_len(8).unique_items(),
+            tags,
+        ),
+    }
+    print(f"validations: {count}")
+    for label, (lambdas, declarative, value) in cases.items():
+        before = timeit.timeit(lambda: lambdas.validate(value), number=count)
+        after = timeit.timeit(lambda: declarative.validate(value), number=count)
+        print(
+            f"{label:<7} lambdas: {before / count * 1e9:7.0f} ns  "
+            f"declarative: {after / count * 1e9:7.0f} ns  ({before / after:.1f}x)"
+        )
+
+
+@app.command(name="adaptive")
+def adaptive(*, count: int = 50_000, invalid: float = 0.9) -> None:
+    """Compare fixed and ``adaptive=True`` validator order on mostly invalid input.
+
+    A costly regular expression search is declared before a cheap length
+    check that rejects most values.
+    """
+
+    words = " ".join(f"word{index}" for index in range(300))
+    valid = "short message"
+    spam = f"{words} free casino bonus"
+    values = [spam if index % 100 < invalid * 100 else valid for index in range(count)]
+
+    def check(field: Field) -> int:
+        rejected = 0
+        for value in values:
+            try:
+                field.validate(value)
+            except Field.VerifyError:
+                rejected += 1
+        return rejected
+
+    results = {}
+    for label, flag in (("fixed", False), ("adaptive", True)):
+        field = (
+            Field(adaptive=flag)
+            .instance(str)
+            .verify(lambda value: not re.search(r"(?i)\b(?:lottery|bitcoin)\b", value))
+            .max_len(280)
+        )
+        check(field)
+        results[label] = timeit.timeit(lambda: check(field), number=1)
+    print(f"values: {count}, invalid: {invalid:.0%}")
+    for label, seconds in results.items():
+        speedup = results["fixed"] / seconds
+        print(f"{label:<9} {seconds / count * 1e9:7.0f} ns/value  ({speedup:.1f}x)")
+
+
+@app.command(name="stream")
+def stream(*, count: int = 50_000, sample_rate: float = 0.01) -> None:
+    """Compare full validation with ``Model.from_stream()`` sampling."""
+
+    record = {"id": 1, "lines": [{"sku": "sku-1", "quantity": 2}] * 3, "note": None}
+    records = [record] * count
+    full = timeit.timeit(lambda: [Order(data) for data in records], number=1)
+    sampled = timeit.timeit(
+        lambda: list(Order.from_stream(records, sample_rate)), number=1
+    )
+    print(f"records: {count}, sample rate: {sample_rate}")
+    print(f"full:    {full / count * 1e6:8.1f} us/record")
+    print(f"sampled: {sampled / count * 1e6:8.1f} us/record  ({full / sampled:.1f}x)")
+
+
+@app.command(name="metrics")
+def metrics(*, count: int = 100_000) -> None:
+    """Report Model construction time with metrics recording off and on."""
+
+    from dictify import Metrics, set_metrics
+
+    data = {"sku": "sku-1", "price": 9.5, "quantity": 3}
+    results = {}
+    for label, recorder in (("off", None), ("on", Metrics())):
+        previous = set_metrics(recorder)
+        try:
+            seconds = timeit.timeit(lambda: Item(data), number=count)
+        finally:
+            set_metrics(previous)
+        results[label] = seconds / count
+    print(f"instances: {count}")
+    for label, seconds in results.items():
+        overhead = seconds - results["off"]
+        print(f"metrics {label:<3} {seconds * 1e6:8.2f} us  ({overhead * 1e9:+.0f} ns)")
+
+
+@app.command(name="reuse")
+def reuse(*, count: int = 100_000, rounds: int = 5) -> None:
+    """Compare a new instance per record with ``Model.reuse()``.
+
+    Reports the best time per record over ``rounds``, memory still allocated
+    after each call while its result is alive, and garbage collections during
+    the loops.
+    """
+
+    import gc
+    import time
+    import tracemalloc
+
+    records = [
+        {"sku": f"sku-{index}", "price": 9.5} if index % 2 else {"sku": f"sku-{index}"}
+        for index in range(count)
+    ]
+    item = Item(records[0])
+
+    def new(data) -> Item:
+        return Item(data)
+
+    def reused(data) -> Item:
+        return Item.reuse(item, data)
+
+    builds = (("new", new), ("reuse", reused))
+    seconds = {label: float("inf") for label, _ in builds}
+    collections = {label: 0 for label, _ in builds}
+    # Alternate the loops and keep the best round, so drift in machine load
+    # does not favor either. timeit turns the collector off, so time the
+    # loops directly.
+    for _ in range(rounds):
+        for label, build in builds:
+            gc.collect()
+            before = sum(stats["collections"] for stats in gc.get_stats())
+            start = time.perf_counter()
+            for data in records:
+                build(data)
+            seconds[label] = min(seconds[label], time.perf_counter() - start)
+            collections[label] += (
+                sum(stats["collections"] for stats in gc.get_stats()) - before
+            )
+    print(f"records: {count}, rounds: {rounds}")
+    for label, build in builds:
+        tracemalloc.start()
+        allocated = 0
+        for data in records[:1000]:
+            before = tracemalloc.get_traced_memory()[0]
+            result = build(data)
+            allocated += tracemalloc.get_traced_memory()[0] - before
+            del result
+        tracemalloc.stop()
+        print(
+            f"{label:<6} {seconds[label] / count * 1e6:6.2f} us/record  "
+            f"{allocated / 1000:7.1f} B/record  gc runs {collections[label]}"
+        )
+
+
+@app.command(name="attributes")
+def attributes(*, count: int = 2_000_000) -> None:
+    """Compare declared-field attribute reads with plain instance attributes."""
+
+    class Plain:
+        def __init__(self):
+            self.sku = "sku-1"
+
+    data = {"sku": "sku-1"}
+    cases = (
+        ("plain object", Plain(), "obj.sku"),
+        ("model attribute", Item(data), "obj.sku"),
+        ("model key", Item(data), "obj['sku']"),
+        ("compact attribute", CompactItem(data), "obj.sku"),
+    )
+    baseline = None
+    for label, obj, statement in cases:
+        seconds = min(
+            timeit.repeat(statement, globals={"obj": obj}, number=count, repeat=5)
+        )
+        baseline = baseline or seconds
+        print(
+            f"{label:<18} {seconds / count * 1e9:7.1f} ns  ({seconds / baseline:.1f}x)"
+        )
+
+
+@app.command(name="paths")
+def paths(*, count: int = 200_000) -> None:
+    """Compare nested reads and writes by chained indexing and by path."""
+
+    order = Order({"id": 1, "lines": [{"sku": f"sku-{index}"} for index in range(5)]})
+    cases = (
+        ("get chained", "order['lines'][3]['quantity']"),
+        ("get_path", "order.get_path('lines.3.quantity')"),
+        ("set chained", "order['lines'][3]['quantity'] = 2"),
+        ("set_path", "order.set_path('lines.3.quantity', 2)"),
+    )
+    print(f"operations: {count}")
+    for label, statement in cases:
+        seconds = min(
+            timeit.repeat(statement, globals={"order": order}, number=count, repeat=3)
+        )
+        print(f"{label:<12} {seconds / count * 1e9:8.0f} ns")
+
+
+@app.command(name="project")
+def project(*, fields: int = 150, count: int = 20_000) -> None:
+    """Compare building a wide model with building a three-field projection.
+
+    Every record sets all fields, and each field checks its value.
+    """
+
+    namespace = {
+        f"field_{index}": Field(default=0).verify(lambda value: value >= 0)
+        for index in range(fields)
+    }
+    namespace["__annotations__"] = {f"field_{index}": int for index in range(fields)}
+    Wide = type("Wide", (Model,), namespace)
+    Narrow = Wide.project("field_0", "field_1", "field_2")
+    data = {f"field_{index}": index for index in range(fields)}
+
+    print(f"fields: {fields}, projected: {len(Narrow.__fields__)}")
+    for label, cls in (("full", Wide), ("project", Narrow)):
+        seconds = timeit.timeit(lambda cls=cls: cls(data), number=count)
+        print(f"{label:<8} {seconds / count * 1e6:8.1f} us")
+
+
+@app.command(name="deferred")
+def deferred(*, count: int = 100_000) -> None:
+    """Compare storing audit records eagerly and with ``deferred=True``.
+
+    Reports time per record to build instances, to build them and read one
+    field, and to copy the input dict for reference.
+    """
+
+    import time
+
+    class Audit(Model):
+        actor: str = Field(required=True).verify(lambda value: len(value) <= 64)
+        action: str = Field(required=True).anyof(["create", "update", "delete"])
+        target: str = Field(required=True)
+        at: datetime = Field(required=True)
+        changes: dict = Field(default=dict)
+        tags: list[str] = Field(default=list)
+
+    class DeferredAudit(Audit, deferred=True):
+        pass
+
+    now = datetime.now()
+    records = [
+        {
+            "actor": f"user-{index}",
+            "action": "update",
+            "target": f"order-{index}",
+            "at": now,
+            "changes": {"status": ["new", "paid"]},
+            "tags": ["api", "billing"],
+        }
+        for index in range(count)
+    ]
+    cases = (
+        ("dict copy", dict),
+        ("eager", Audit),
+        ("deferred", DeferredAudit),
+        ("deferred + read", lambda data: DeferredAudit(data).actor),
+    )
+    print(f"records: {count}")
+    for label, build in cases:
+        # timeit turns the collector off, so time the loop directly.
+        start = time.perf_counter()
+        kept = [build(data) for data in records]
+        seconds = time.perf_counter() - start
+        del kept
+        print(f"{label:<16} {seconds / count * 1e6:6.2f} us/record")
+
+
+@app.command(name="dataclasses")
+def dataclasses_(*, count: int = 100_000) -> None:
+    """Compare generated dataclass converters with going through ``dict``."""
+
+    import dataclasses
+
+    Row = Order.dataclass_type()
+    order = Order({"id": 1, "lines": [{"sku": "sku-1"}], "note": "gift"})
+    row = order.to_dataclass(Row)
+    cases = (
+        ("Row(**dict(order))", "Row(**dict(order))"),
+        ("to_dataclass", "order.to_dataclass(Row)"),
+        ("Order(asdict(row))", "Order(asdict(row))"),
+        ("from_dataclass", "Order.from_dataclass(row)"),
+        ("trusted", "Order.from_dataclass(row, trusted=True)"),
+    )
+    namespace = {
+        "Order": Order,
+        "Row": Row,
+        "order": order,
+        "row": row,
+        "asdict": dataclasses.asdict,
+    }
+    print(f"conversions: {count}")
+    for label, statement in cases:
+        seconds = min(
+            timeit.repeat(statement, globals=namespace, number=count, repeat=3)
+        )
+        print(f"{label:<20} {seconds / count * 1e6:6.2f} us")
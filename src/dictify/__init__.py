@@ -1,7 +1,9 @@
 """dictify provides lightweight schema and validation helpers for dict data."""
 
+from ._errors import ErrorRecord
 from ._field import Field, ListOf
+from ._metrics import Metrics, set_metrics
 from ._model import Model
 from ._sentinel import UNDEF
 
-__all__ = ["UNDEF", "Field", "ListOf", "Model"]
+__all__ = ["UNDEF", "ErrorRecord", "Field", "ListOf", "Metrics", "Model", "set_metrics"]
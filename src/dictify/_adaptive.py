@@ -0,0 +1,110 @@
+"""Runtime ordering of validator chains for ``Field(adaptive=True)``."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+#: Checks between two reorderings of a chain. Orders only change at these
+#: count-based checkpoints, never in the middle of a check.
+CHECKPOINT = 1024
+
+#: Every ``TIMING_SAMPLE``-th check is timed to estimate validator cost.
+TIMING_SAMPLE = 8
+
+
+class AdaptiveOrder:
+    """Validator order learned from measured cost and rejection counts.
+
+    For independent fail-fast filters, running them by ascending
+    ``cost / rejection rate`` minimizes the expected cost of a check. At each
+    checkpoint the order is recomputed with a stable sort, so validators
+    without rejections keep their declaration order, and the counts are
+    halved so the order follows changes in traffic.
+
+    ``pinned`` validators, which replace the value for later validators,
+    never move. Other validators only move between pinned ones.
+    """
+
+    __slots__ = (
+        "functions",
+        "pinned",
+        "order",
+        "checks",
+        "calls",
+        "rejections",
+        "timed",
+        "nanoseconds",
+    )
+
+    def __init__(self, functions: Sequence[Any], pinned: Sequence[bool]):
+        self.functions = tuple(functions)
+        self.pinned = tuple(pinned)
+        self.order = tuple(range(len(functions)))
+        self.checks = 0
+        self.calls = [0] * len(functions)
+        self.rejections = [0] * len(functions)
+        self.timed = [0] * len(functions)
+        self.nanoseconds = [0] * len(functions)
+
+    def start(self) -> tuple[tuple[int, ...], bool]:
+        """Count a check and return the order to use and whether to time it."""
+
+        self.checks += 1
+        if self.checks % CHECKPOINT == 0:
+            self.reorder()
+        return self.order, self.checks % TIMING_SAMPLE == 0
+
+    def count(self, index: int, rejected: bool, nanoseconds: int | None):
+        """Record one call of validator ``index``."""
+
+        self.calls[index] += 1
+        if rejected:
+            self.rejections[index] += 1
+        if nanoseconds is not None:
+            self.timed[index] += 1
+            self.nanoseconds[index] += nanoseconds
+
+    def score(self, index: int) -> float:
+        """Return the expected cost of validator ``index`` per rejection."""
+
+        if not self.rejections[index] or not self.timed[index]:
+            return math.inf
+        cost = self.nanoseconds[index] / self.timed[index]
+        return cost / (self.rejections[index] / self.calls[index])
+
+    def reorder(self):
+        """Sort validators between pinned ones by score, then decay counts."""
+
+        order: list[int] = []
+        segment: list[int] = []
+        for index in range(len(self.functions)):
+            if self.pinned[index]:
+                order.extend(sorted(segment, key=self.score))
+                order.append(index)
+                segment = []
+            else:
+                segment.append(index)
+        order.extend(sorted(segment, key=self.score))
+        self.order = tuple(order)
+        for counts in (self.calls, self.rejections, self.timed, self.nanoseconds):
+            for index, value in enumerate(counts):
+                counts[index] = value // 2
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-validator counts in the current order."""
+
+        return [
+            {
+                "validator": self.functions[index].name,
+                "calls": self.calls[index],
+                "rejections": self.rejections[index],
+                "mean_ns": (
+                    self.nanoseconds[index] // self.timed[index]
+                    if self.timed[index]
+                    else None
+                ),
+            }
+            for index in self.order
+        ]
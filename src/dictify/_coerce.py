@@ -0,0 +1,126 @@
+"""Conversion of string input to the runtime type of a field."""
+
+from __future__ import annotations
+
+import types
+from collections.abc import Callable
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Union, get_args, get_origin
+from uuid import UUID
+
+from ._errors import ErrorPath, ErrorRecord
+from ._sentinel import UNDEF
+
+#: Converts a string to a value of the target type or raises ``ValueError``.
+Converter = Callable[[str], Any]
+
+_BOOLEANS = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+
+
+def _to_bool(value: str) -> bool:
+    try:
+        return _BOOLEANS[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"invalid boolean: {value!r}") from None
+
+
+def _to_decimal(value: str) -> Decimal:
+    try:
+        return Decimal(value.strip())
+    except ArithmeticError:
+        raise ValueError(f"invalid decimal: {value!r}") from None
+
+
+#: String converters by target type. Builtin constructors are used directly
+#: where they parse strings themselves.
+CONVERTERS: dict[type, Converter] = {
+    int: int,
+    float: float,
+    bool: _to_bool,
+    Decimal: _to_decimal,
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+}
+
+# Converters compiled per runtime type spec. ``None`` marks specs that take
+# strings as they are.
+_compiled: dict[Any, Converter | None] = {}
+
+
+def converter_for(type_spec: Any) -> Converter | None:
+    """Return the string converter for a runtime type spec, or ``None``.
+
+    Unions and type tuples try the converters of their members in order.
+    Specs that accept ``str`` or ``Any`` never convert.
+    """
+
+    try:
+        return _compiled[type_spec]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable spec, compile it on every call.
+        return _compile(type_spec)
+    converter = _compiled[type_spec] = _compile(type_spec)
+    return converter
+
+
+def _compile(type_spec: Any) -> Converter | None:
+    if isinstance(type_spec, tuple):
+        members = type_spec
+    elif get_origin(type_spec) in (Union, types.UnionType):
+        members = get_args(type_spec)
+    else:
+        members = (type_spec,)
+    if any(member is str or member is Any or member is UNDEF for member in members):
+        return None
+    converters = [CONVERTERS[member] for member in members if member in CONVERTERS]
+    if not converters:
+        return None
+    if len(converters) == 1:
+        return converters[0]
+
+    def convert(value: str):
+        for converter in converters[:-1]:
+            try:
+                return converter(value)
+            except ValueError:
+                pass
+        return converters[-1](value)
+
+    return convert
+
+
+def coerce(
+    converter: Converter,
+    value: str,
+    type_spec: Any,
+    path: ErrorPath,
+    records: list[ErrorRecord],
+):
+    """Return ``value`` converted by ``converter``, or ``UNDEF`` on failure.
+
+    A failed conversion appends a ``"coerce"`` record to ``records``.
+    """
+
+    try:
+        return converter(value)
+    except ValueError:
+        records.append(
+            ErrorRecord(
+                path, "coerce", "Cannot convert {0!r} to {1!r}", (value, type_spec)
+            )
+        )
+        return UNDEF
@@ -0,0 +1,102 @@
+"""Compact per-instance storage for ``compact=True`` model classes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+from ._sentinel import UNDEF
+from ._types import KeyIndex
+
+
+class CompactData(MutableMapping[str, Any]):
+    """Model data stored as one list slot per declared field.
+
+    All instances of a class share ``index``, which maps field names to list
+    positions, so an instance only owns a list of values. ``UNDEF`` marks an
+    unset field. Undeclared keys of ``strict=False`` models spill over into a
+    separate dict that is created on first use.
+
+    Iteration yields set fields in declaration order, then extra keys.
+    """
+
+    __slots__ = ("_index", "_values", "_extra")
+
+    def __init__(self, index: KeyIndex, values: Mapping[str, Any] | None = None):
+        self._index = index
+        self._values = [UNDEF] * len(index)
+        self._extra: dict[str, Any] | None = None
+        if values:
+            for key, value in values.items():
+                self[key] = value
+
+    def reset(self, values: Mapping[str, Any]):
+        """Unset every key, then store ``values``, reusing the value list."""
+
+        slots = self._values
+        for position in range(len(slots)):
+            slots[position] = UNDEF
+        self._extra = None
+        for key, value in values.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        position = self._index.get(key)
+        if position is not None:
+            value = self._values[position]
+            if value is not UNDEF:
+                return value
+        elif self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        position = self._index.get(key)
+        if position is not None:
+            self._values[position] = value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        position = self._index.get(key)
+        if position is not None:
+            if self._values[position] is UNDEF:
+                raise KeyError(key)
+            self._values[position] = UNDEF
+        elif self._extra is not None:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        position = self._index.get(key)
+        if position is not None:
+            return self._values[position] is not UNDEF
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key, value in zip(self._index, self._values):
+            if value is not UNDEF:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        count = sum(value is not UNDEF for value in self._values)
+        if self._extra is not None:
+            count += len(self._extra)
+        return count
+
+    def get(self, key, default=None):
+        position = self._index.get(key)
+        if position is not None:
+            value = self._values[position]
+            return default if value is UNDEF else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
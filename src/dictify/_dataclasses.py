@@ -0,0 +1,165 @@
+"""Generated converters between models and dataclasses."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
+from weakref import WeakKeyDictionary
+
+from ._sampling import _stream_plan
+from ._sentinel import UNDEF
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+# Per model class: dataclass -> converter of model data into the dataclass.
+_to_converters: WeakKeyDictionary[type, dict[type, Callable[[Any], Any]]] = (
+    WeakKeyDictionary()
+)
+# Per model class: dataclass -> reader of dataclass instances into a dict.
+_from_converters: WeakKeyDictionary[type, dict[type, Callable[[Any], Any]]] = (
+    WeakKeyDictionary()
+)
+
+
+def to_dataclass(model: Model, target: type) -> Any:
+    """Return an instance of dataclass ``target`` with the values of ``model``."""
+
+    converters = _to_converters.get(model.__class__)
+    if converters is None:
+        converters = _to_converters[model.__class__] = {}
+    convert = converters.get(target)
+    if convert is None:
+        convert = converters[target] = _compile_to(model.__class__, target)
+    model.validate_all()
+    with model._lock:
+        return convert(model._data)
+
+
+def from_dataclass[M: Model](cls: type[M], obj: Any, trusted: bool) -> M:
+    """Return an instance of ``cls`` with the fields of dataclass ``obj``."""
+
+    target = type(obj)
+    converters = _from_converters.get(cls)
+    if converters is None:
+        converters = _from_converters[cls] = {}
+    read = converters.get(target)
+    if read is None:
+        read = converters[target] = _compile_from(cls, target)
+    data = read(obj)
+    if not trusted:
+        return cls(data)
+    for key, (_, _, build) in _stream_plan(cls).items():
+        if build is not None and key in data:
+            data[key] = build(data[key])
+    return cls._from_trusted(data)
+
+
+def derive_dataclass(cls: type[Model], frozen: bool) -> type:
+    """Return a slotted dataclass with the fields of ``cls``.
+
+    Fields without a default come first as positional fields, in declaration
+    order. Fields with a default, and optional fields, which default to
+    ``UNDEF``, are keyword-only.
+    """
+
+    if not cls.__prepared__:
+        cls._prepare()
+    fields: list[tuple[str, Any, dataclasses.Field]] = []
+    for key, field in cls.__fields__.items():
+        if field.has_default:
+            default = field.get_default()
+            if field.has_default_factory or type(default).__hash__ is None:
+                spec = dataclasses.field(default_factory=field.get_default)
+            else:
+                spec = dataclasses.field(default=default)
+            spec.kw_only = True
+        elif field.required:
+            spec = dataclasses.field()
+        else:
+            # Stubs type ``field(default=...)`` as the default, for class bodies.
+            spec = cast(
+                dataclasses.Field, dataclasses.field(default=UNDEF, kw_only=True)
+            )
+        fields.append((key, cls.__field_types__.get(key, Any), spec))
+    derived = dataclasses.make_dataclass(
+        f"{cls.__name__}Data",
+        fields,
+        frozen=frozen,
+        slots=True,
+        module=cls.__module__,
+    )
+    derived.__qualname__ = f"{cls.__qualname__}Data"
+    return derived
+
+
+def _init_fields(target: type) -> tuple[dataclasses.Field, ...]:
+    if not (isinstance(target, type) and dataclasses.is_dataclass(target)):
+        raise TypeError(f"{target!r} is not a dataclass")
+    return dataclasses.fields(target)
+
+
+def _compile_to(cls: type[Model], target: type) -> Callable[[Any], Any]:
+    """Return a function building ``target`` from the storage of ``cls``.
+
+    Fields that every instance has are passed positionally, in the order of
+    the dataclass, until the first keyword-only, missing, or optional one.
+    The rest are passed by keyword, and optional ones only when set.
+    """
+
+    model_fields = cls.__fields__
+    arguments: list[str] = []
+    optional: list[str] = []
+    positional = True
+    for field in _init_fields(target):
+        if not field.init:
+            continue
+        key = field.name
+        definition = model_fields.get(key)
+        if definition is None:
+            positional = False
+            continue
+        if not (definition.required or definition.has_default):
+            optional.append(key)
+            positional = False
+            continue
+        positional = positional and not field.kw_only
+        arguments.append(f"data[{key!r}]" if positional else f"{key}=data[{key!r}]")
+    if optional:
+        arguments.append(
+            f"**{{key: data[key] for key in {tuple(optional)!r} if key in data}}"
+        )
+    # Keys are identifiers declared on both classes, so their reprs are safe
+    # to eval.
+    return eval(
+        f"lambda data: target({', '.join(arguments)})",
+        {"target": target},
+    )
+
+
+def _compile_from(cls: type[Model], target: type) -> Callable[[Any], Any]:
+    """Return a function reading the fields of ``cls`` from ``target``.
+
+    Optional fields holding ``UNDEF``, as in dataclasses from
+    ``derive_dataclass()``, are left out.
+    """
+
+    model_fields = cls.__fields__
+    keys = [field.name for field in _init_fields(target) if field.name in model_fields]
+    optional = [
+        key
+        for key in keys
+        if not (model_fields[key].required or model_fields[key].has_default)
+    ]
+    lines = [
+        "def read(obj):",
+        "    data = {" + ", ".join(f"{key!r}: obj.{key}" for key in keys) + "}",
+    ]
+    for key in optional:
+        lines.append(f"    if data[{key!r}] is UNDEF:")
+        lines.append(f"        del data[{key!r}]")
+    lines.append("    return data")
+    namespace: dict[str, Any] = {"UNDEF": UNDEF}
+    exec("\n".join(lines), namespace)
+    return namespace["read"]
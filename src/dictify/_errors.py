@@ -0,0 +1,139 @@
+"""Structured validation error records shared by fields and models."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+#: Path of keys and list indexes from the validated root to a value.
+ErrorPath = tuple[str | int, ...]
+
+
+class ErrorRecord:
+    """One validation failure at ``path``.
+
+    Records are plain data collected while validating, so a failed document
+    costs one small object per problem instead of a raised exception. The
+    human readable ``message`` is only formatted when it is read.
+
+    Parameters
+    ----------
+    path:
+        Keys and list indexes from the validated root to the failing value.
+    code:
+        Short machine readable reason such as ``"required"``, ``"type"`` or
+        the name of the failing validator.
+    template:
+        ``str.format`` template for the message.
+    args:
+        Positional arguments for ``template``.
+    """
+
+    __slots__ = ("path", "code", "template", "args")
+
+    def __init__(self, path: ErrorPath, code: str, template: str, args: tuple = ()):
+        self.path = path
+        self.code = code
+        self.template = template
+        self.args = args
+
+    @property
+    def location(self) -> str:
+        """Return the dotted path, for example ``items.3.price``."""
+
+        return ".".join(str(key) for key in self.path)
+
+    @property
+    def message(self) -> str:
+        """Return the formatted error message."""
+
+        return self.template.format(*self.args) or self.code
+
+    def prefixed(self, path: ErrorPath) -> ErrorRecord:
+        """Return a copy of the record located below ``path``."""
+
+        return ErrorRecord(path + self.path, self.code, self.template, self.args)
+
+    def __eq__(self, other):
+        if not isinstance(other, ErrorRecord):
+            return NotImplemented
+        return (self.path, self.code, self.message) == (
+            other.path,
+            other.code,
+            other.message,
+        )
+
+    def __repr__(self):
+        return f"ErrorRecord({self.location!r}, {self.code!r}, {self.message!r})"
+
+
+class RecordedError(Exception):
+    """Base for validation exceptions that carry ``ErrorRecord`` entries."""
+
+    @property
+    def records(self) -> list[ErrorRecord]:
+        """Return all error records with paths from the validated root."""
+
+        if not self.args:
+            return []
+        return error_records(self.args[0])
+
+    def flatten(self) -> dict[str, list[str]]:
+        """Return error messages grouped by dotted path."""
+
+        result: dict[str, list[str]] = {}
+        for record in self.records:
+            result.setdefault(record.location, []).append(record.message)
+        return result
+
+
+def group_records(records: Iterable[ErrorRecord]) -> dict[str | int, list[ErrorRecord]]:
+    """Group records by the first key of their path."""
+
+    grouped: dict[str | int, list[ErrorRecord]] = {}
+    for record in records:
+        key = record.path[0] if record.path else ""
+        grouped.setdefault(key, []).append(record)
+    return grouped
+
+
+def records_from_error(error: BaseException, path: ErrorPath = ()) -> list[ErrorRecord]:
+    """Convert an exception raised by a validator into error records."""
+
+    from ._field import Field
+
+    if isinstance(error, RecordedError):
+        return [record.prefixed(path) for record in error.records]
+    if isinstance(error, KeyError):
+        return [ErrorRecord(path, "undefined", "Field is not defined")]
+    if isinstance(error, Field.RequiredError):
+        return [ErrorRecord(path, "required", "Field is required")]
+    return [ErrorRecord(path, "invalid", "{0}", (error,))]
+
+
+def error_records(errors: Any) -> list[ErrorRecord]:
+    """Return records for the first argument of ``Model.Error`` or ``VerifyError``.
+
+    Besides record lists, this accepts mappings of keys to records or
+    exceptions, as raised by ``Model.Error({...})`` in user code.
+    """
+
+    if isinstance(errors, ErrorRecord):
+        return [errors]
+    if isinstance(errors, Mapping):
+        records = []
+        for key, value in errors.items():
+            if isinstance(value, list) and all(
+                isinstance(item, ErrorRecord) for item in value
+            ):
+                records.extend(value)
+            elif isinstance(value, BaseException):
+                records.extend(records_from_error(value, (key,)))
+            else:
+                records.append(ErrorRecord((key,), "invalid", "{0}", (value,)))
+        return records
+    if isinstance(errors, list) and all(
+        isinstance(item, ErrorRecord) for item in errors
+    ):
+        return list(errors)
+    return [ErrorRecord((), "invalid", "{0}", (errors,))]
@@ -2,13 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import operator
 import re
-from functools import wraps
+from collections.abc import Mapping
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    nullcontext,
+)
+from functools import partial, wraps
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Self, cast, overload
 
+from . import _metrics
+from ._adaptive import AdaptiveOrder
+from ._coerce import coerce, converter_for
+from ._compact import CompactData
+from ._errors import ErrorPath, ErrorRecord, RecordedError, records_from_error
 from ._sentinel import UNDEF
-from ._types import DefaultFactory, T, Validator
-from ._utils import _validate_type_spec
+from ._types import DefaultFactory, ItemList, T, Validator
+from ._utils import (
+    _check_type_spec,
+    _run_steps,
+    _same_value,
+    _type_steps,
+    _validate_type_spec,
+)
 
 if TYPE_CHECKING:
     from ._model import Model
@@ -25,35 +45,129 @@ class Function:
     def __call__(self, field, value):
         return self.func(field, value, *self.args, **self.kw)
 
+    @property
+    def name(self) -> str:
+        """Return the validator name used as ``ErrorRecord.code``."""
+
+        return getattr(self.func, "__name__", type(self.func).__name__).lstrip("_")
+
     def __repr__(self):
         return f"{self.func.__name__}{self.args}{self.kw}"
 
 
+class Constraint(Function):
+    """Declarative validator such as ``min(0)`` or ``anyof([...])``.
+
+    A constraint is plain data: ``name`` and ``args`` describe the check, and
+    ``expression`` is a Python expression template over ``value`` with
+    ``{0}``, ``{1}``... for the arguments. Consecutive constraints of a field
+    are compiled into one expression, see ``_ConstraintGroup``, and ``func``
+    only runs to report which constraint failed.
+    """
+
+    def __init__(self, func, expression: str, *args):
+        super().__init__(func, *args)
+        self.expression = expression
+
+    @property
+    def spec(self) -> tuple[str, tuple]:
+        """Return ``(name, args)``, for example ``("between", (0, 10))``."""
+
+        return self.name, self.args
+
+
+class _ConstraintGroup:
+    """Consecutive constraints of a field checked by one compiled expression."""
+
+    def __init__(self, constraints: list[Constraint]):
+        self.constraints = constraints
+        namespace: dict[str, Any] = {"len": len, "set": set}
+        terms = []
+        for index, constraint in enumerate(constraints):
+            names = []
+            for position, arg in enumerate(constraint.args):
+                name = f"arg_{index}_{position}"
+                namespace[name] = _membership(arg)
+                names.append(name)
+            terms.append(f"({constraint.expression.format(*names)})")
+        self.test = eval(f"lambda value: {' and '.join(terms)}", namespace)
+
+    @property
+    def name(self) -> str:
+        return "+".join(constraint.name for constraint in self.constraints)
+
+    def __call__(self, field, value):
+        try:
+            if self.test(value):
+                return
+        except Exception:
+            pass
+        records = []
+        for constraint in self.constraints:
+            try:
+                constraint(field, value)
+            except Exception as error:
+                records.append(ErrorRecord((), constraint.name, "{0}", (error,)))
+        if records:
+            raise Field.VerifyError(records)
+
+
+def _membership(arg):
+    """Return a set for hashable member collections, else ``arg``."""
+
+    if isinstance(arg, (list, tuple, set)):
+        try:
+            return frozenset(arg)
+        except TypeError:
+            pass
+    return arg
+
+
+def _plan_functions(functions: list[Function]) -> list:
+    """Return ``functions`` with runs of several constraints grouped."""
+
+    plan: list = []
+    run: list[Constraint] = []
+    for function in [*functions, None]:
+        if isinstance(function, Constraint):
+            run.append(function)
+            continue
+        if len(run) > 1:
+            plan.append(_ConstraintGroup(run))
+        else:
+            plan.extend(run)
+        run = []
+        if function is not None:
+            plan.append(function)
+    return plan
+
+
 def function(func: Validator):
     """Decorator used in Field class to add methods in validation chain"""
 
     @wraps(func)
     def wrapper(self, *args, **kw):
-        # Test default value.
-        if self.has_default:
-            default = self.get_default()
-            try:
-                func(self, default, *args, **kw)
-            except Exception as error:
-                func_name = getattr(func, "__name__", type(func).__name__)
-                raise Field.DefineError(
-                    f"Field(default={default}) conflict with ",
-                    f"{func_name}(*{args}, **{kw})",
-                    error,
-                )
-
-        # Keep function in chain.
-        self._functions.append(Function(func, *args, **kw))
-        return self
+        return self._add_function(Function(func, *args, **kw))
 
     return wrapper
 
 
+def constraint(expression: str):
+    """Decorator for Field methods that add a ``Constraint``.
+
+    ``expression`` is the fused form of the check, see ``Constraint``.
+    """
+
+    def decorator(func: Validator):
+        @wraps(func)
+        def wrapper(self, *args):
+            return self._add_function(Constraint(func, expression, *args))
+
+        return wrapper
+
+    return decorator
+
+
 class ListOf(list):
     """Modified list which check it's members instance.
 
@@ -68,6 +182,18 @@ class ListOf(list):
     class ValueError(Exception):
         pass
 
+    # Lists built by ``_tracked_list()`` skip ``__init__`` and keep these.
+    types: tuple = (UNDEF,)
+    validate_func: Validator | None = None
+
+    # Replaced by the owning model's lock for ``threadsafe=True`` models.
+    _lock: AbstractContextManager = nullcontext()
+
+    # Original items of indexes changed since creation or ``mark_clean()``.
+    _changes: dict[int, Any] | None = None
+    # Copy of the clean list after an insert, delete, or reorder.
+    _original: ItemList | None = None
+
     def __init__(
         self,
         values,
@@ -95,13 +221,65 @@ class ListOf(list):
         """Set list value at ``index`` if ``value`` is valid"""
 
         self._validate(value)
-        return super().__setitem__(index, value)
+        with self._lock:
+            if isinstance(index, slice):
+                self._record_resize()
+            else:
+                index = operator.index(index)
+                if -len(self) <= index < 0:
+                    index += len(self)
+                if 0 <= index < len(self):
+                    self._record_change(index, value)
+            return super().__setitem__(index, value)
+
+    def __reduce__(self):
+        # The shared model lock is not picklable and belongs to the owner.
+        # Unpickled lists start clean, like unpickled models.
+        state = self.__dict__.copy()
+        for key in ("_lock", "_changes", "_original"):
+            state.pop(key, None)
+        return (_restore_list, (self.__class__, list(self), state))
+
+    def _record_change(self, index: int, value):
+        if self._original is not None:
+            return
+        if self._changes is None:
+            self._changes = {}
+        if index in self._changes:
+            if _same_value(self._changes[index], value):
+                del self._changes[index]
+        elif index >= len(self) or not _same_value(self[index], value):
+            self._changes[index] = self[index] if index < len(self) else UNDEF
+
+    def _record_resize(self):
+        if self._original is not None:
+            return
+        changes = self._changes or {}
+        self._original = [
+            changes.get(index, item)
+            for index, item in enumerate(self)
+            if changes.get(index, item) is not UNDEF
+        ]
+        self._changes = None
 
     def _validate(self, value):
-        from ._model import Model
-
         if self.types[0] is UNDEF:
             return
+        recorder = _metrics.recorder
+        if recorder is None:
+            return self._check_item(value)
+        start = perf_counter_ns()
+        try:
+            self._check_item(value)
+        except Exception as error:
+            records = records_from_error(error)
+            recorder.record(ListOf, "item", perf_counter_ns() - start, records)
+            raise
+        recorder.record(ListOf, "item", perf_counter_ns() - start, ())
+
+    def _check_item(self, value):
+        from ._model import Model
+
         if isinstance(value, dict):
             model_types = tuple(
                 cast(type[Model], type_)
@@ -127,22 +305,165 @@ class ListOf(list):
         """Append object to the list if ``value`` is valid."""
 
         self._validate(value)
-        return super().append(value)
+        with self._lock:
+            self._record_change(len(self), value)
+            return super().append(value)
+
+    def extend(self, values):
+        """Extend the list if every member of ``values`` is valid."""
+
+        values = list(values)
+        for value in values:
+            self._validate(value)
+        with self._lock:
+            for index, value in enumerate(values, len(self)):
+                self._record_change(index, value)
+            return super().extend(values)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def insert(self, index, value):
+        """Insert object before ``index`` if ``value`` is valid."""
+
+        self._validate(value)
+        with self._lock:
+            self._record_resize()
+            return super().insert(index, value)
+
+    def __delitem__(self, index):
+        with self._lock:
+            self._record_resize()
+            return super().__delitem__(index)
+
+    def __imul__(self, count):
+        with self._lock:
+            self._record_resize()
+            return super().__imul__(count)
+
+    def pop(self, index=-1):
+        with self._lock:
+            self._record_resize()
+            return super().pop(index)
+
+    def remove(self, value):
+        with self._lock:
+            self._record_resize()
+            return super().remove(value)
+
+    def clear(self):
+        with self._lock:
+            self._record_resize()
+            return super().clear()
+
+    def sort(self, *args, **kw):
+        with self._lock:
+            self._record_resize()
+            return super().sort(*args, **kw)
+
+    def reverse(self):
+        with self._lock:
+            self._record_resize()
+            return super().reverse()
+
+    def dirty_paths(self) -> set[str]:
+        """Return dotted paths changed since creation or ``mark_clean()``.
+
+        After an insert, delete, or reorder the whole list is reported with
+        an empty path.
+        """
+
+        return set(self.changes())
+
+    def changes(self, old: bool = False) -> dict[str, Any]:
+        """Return changed paths mapped to their current value.
+
+        With ``old=True`` each path maps to an ``(old, new)`` tuple.
+        """
+
+        return _collect_changes(self, old)
+
+    def _collect_changes(self, prefix: str, result: dict[str, Any], old: bool):
+        """Add own changes to ``result`` and return nested values to visit."""
+
+        from ._model import Model
+
+        if self._original is not None:
+            path = prefix[:-1]
+            result[path] = (list(self._original), self) if old else self
+            return []
+        changes = self._changes or {}
+        for index, original in changes.items():
+            value = self[index]
+            result[f"{prefix}{index}"] = (original, value) if old else value
+        return [
+            (f"{prefix}{index}.", item)
+            for index, item in enumerate(self)
+            if index not in changes and isinstance(item, (Model, ListOf))
+        ]
+
+    def mark_clean(self):
+        """Forget recorded changes here and in nested models and lists."""
+
+        _mark_clean(self)
+
+    def _clean(self):
+        """Forget own changes and return nested values to clean."""
+
+        from ._model import Model
+
+        with self._lock:
+            self._changes = None
+            self._original = None
+            return [item for item in self if isinstance(item, (Model, ListOf))]
 
     def list(self):
         """Return data as native `list`"""
 
-        from ._model import Model
+        from ._model import _to_native
 
-        data = []
-        for item in self:
-            if isinstance(item, Model):
-                data.append(item.dict())
-            elif isinstance(item, ListOf):
-                data.append(item.list())
-            else:
-                data.append(item)
-        return data
+        return _to_native(self)
+
+
+def _restore_list(cls, items, state):
+    """Rebuild a pickled ListOf without validating its items again."""
+
+    values = cls.__new__(cls)
+    list.extend(values, items)
+    values.__dict__.update(state)
+    return values
+
+
+def _collect_changes(root, old: bool) -> dict[str, Any]:
+    """Return the changes of a model or list, see ``Model.changes()``.
+
+    Nested values are visited on an explicit stack in the order of a
+    recursive walk, so data of any depth allowed by ``max_depth`` works.
+    """
+
+    result: dict[str, Any] = {}
+    stack = [("", root)]
+    while stack:
+        prefix, value = stack.pop()
+        stack.extend(reversed(value._collect_changes(prefix, result, old)))
+    return result
+
+
+def _mark_clean(root):
+    """Forget the changes of a model or list and its nested values."""
+
+    stack = [root]
+    while stack:
+        stack.extend(stack.pop()._clean())
+
+
+def _tracked_list(items: list) -> ListOf:
+    """Return an untyped ListOf of ``items``, which records its changes."""
+
+    values = ListOf.__new__(ListOf)
+    list.extend(values, items)
+    return values
 
 
 class Field[T]:
@@ -179,10 +500,21 @@ class Field[T]:
         Field's default value
     grant: list
         Granted values which always valid.
+    coerce: bool | None=None
+        Convert ``str`` values to the field's runtime type, such as ``int``,
+        ``bool``, ``datetime``, ``Decimal`` or ``UUID``, before validation.
+        ``None`` follows the ``coerce`` option of the owning model class.
+    adaptive: bool=False
+        Stop at the first failing validator and learn a validator order that
+        rejects invalid values early and cheaply. Only use it for validators
+        without side effects. See ``adaptive_stats()``.
     """
 
-    class VerifyError(Exception):
-        """Error to be raised if ``Field().value`` doesn't pass validation."""
+    class VerifyError(RecordedError):
+        """Error to be raised if ``Field().value`` doesn't pass validation.
+
+        The first argument is a list of ``ErrorRecord``, see ``records``.
+        """
 
         pass
 
@@ -198,14 +530,27 @@ class Field[T]:
 
         pass
 
-    def __init__(self, required: bool = False, default=UNDEF, grant=None):
+    def __init__(
+        self,
+        required: bool = False,
+        default=UNDEF,
+        grant=None,
+        coerce: bool | None = None,
+        adaptive: bool = False,
+    ):
         self.required = required
         self._default = default
         if grant is None:
             grant = []
         assert isinstance(grant, list)
         self.grant = grant
+        self.coerce = coerce
+        self.adaptive = adaptive
         self._functions = list()
+        self._async_functions = list()
+        # ``_functions`` with constraint runs grouped, built on first check.
+        self._plan: list | None = None
+        self._adaptive: AdaptiveOrder | None = None
         self._annotation_type = UNDEF
         self._instance_type = UNDEF
         self._name: str | None = None
@@ -221,20 +566,46 @@ class Field[T]:
             required=self.required,
             default=self._default,
             grant=self.grant.copy(),
+            coerce=self.coerce,
+            adaptive=self.adaptive,
         )
         field._functions = self._functions.copy()
+        field._async_functions = self._async_functions.copy()
         field._annotation_type = self._annotation_type
         field._instance_type = self._instance_type
         return field
 
+    def _add_function(self, function: Function) -> Self:
+        """Check the default against ``function`` and append it to the chain."""
+
+        if self.has_default:
+            default = self.get_default()
+            try:
+                function(self, default)
+            except Exception as error:
+                raise Field.DefineError(
+                    f"Field(default={default}) conflict with ",
+                    f"{function.func.__name__}(*{function.args}, **{function.kw})",
+                    error,
+                )
+        self._functions.append(function)
+        self._plan = None
+        self._adaptive = None
+        return self
+
+    @property
+    def constraints(self) -> list[Constraint]:
+        """Return the declarative validators of the chain, in order."""
+
+        return [
+            function for function in self._functions if isinstance(function, Constraint)
+        ]
+
     def _runtime_type_spec(self):
         if self._instance_type is not UNDEF:
             return self._instance_type
         return self._annotation_type
 
-    def _validate_runtime_type(self, value):
-        return _validate_type_spec(value, self._runtime_type_spec())
-
     def _ensure_default_matches_type_spec(self, type_spec):
         if self.has_default is False:
             return
@@ -255,38 +626,223 @@ class Field[T]:
             return default_factory()
         return self._default
 
+    def _tracked_default(self):
+        """Return ``get_default()`` with a list from a factory as ``ListOf``.
+
+        Models store defaults this way, so appending to the list of
+        ``Field(default=list)`` is reported by change tracking.
+        """
+
+        default = self.get_default()
+        if type(default) is list and callable(self._default):
+            return _tracked_list(default)
+        return default
+
+    def _tracked_factory(self) -> DefaultFactory:
+        """Return a function returning ``_tracked_default()``.
+
+        The common ``Field(default=list)`` creates the empty ``ListOf``
+        directly, about as fast as calling ``get_default()``.
+        """
+
+        if self._default is list:
+            return partial(ListOf.__new__, ListOf)
+        return self._tracked_default
+
     @property
     def has_default(self):
         """Return whether the field definition has a configured default."""
 
         return self._default is not UNDEF
 
+    @property
+    def has_default_factory(self):
+        """Return whether the default is a factory called for each value."""
+
+        return callable(self._default)
+
     def validate(self, value):
         """Validate and return the final field value."""
 
-        from ._model import Model
-
-        errors = list()
         if self.required and value is UNDEF:
             raise Field.RequiredError("Field is required")
+        records: list[ErrorRecord] = []
+        value = self._check(value, (), records)
+        if records:
+            raise Field.VerifyError(records)
+        return value
+
+    def _check(self, value, path: ErrorPath, records: list[ErrorRecord]):
+        """Validate ``value`` and append problems to ``records`` without raising.
+
+        Every validator runs, so all problems of the value are collected.
+        Returns the value to store.
+        """
+
+        if isinstance(value, (Mapping, list)):
+            return _run_steps(self._check_steps(value, path, records))
+        if value is UNDEF and self.required:
+            records.append(ErrorRecord(path, "required", "Field is required"))
+            return value
         if value in self.grant:
             return value
-        try:
-            value = self._validate_runtime_type(value)
-        except Exception as error:
-            errors.append(("runtime_type", error))
+        type_spec = self._runtime_type_spec()
+        if self.coerce and type(value) is str:
+            converter = converter_for(type_spec)
+            if converter is not None:
+                converted = coerce(converter, value, type_spec, path, records)
+                if converted is UNDEF:
+                    return value
+                # Converters return the field type, so only validators run.
+                return self._check_functions(converted, path, records)
+        value = _check_type_spec(value, type_spec, path, records)
+        return self._check_functions(value, path, records)
+
+    def _check_steps(self, value, path: ErrorPath, records: list[ErrorRecord]):
+        """Return validation steps of ``_check`` for mapping or list data."""
+
+        if value in self.grant:
+            return value
+        value = yield _type_steps(value, self._runtime_type_spec(), path, records)
+        # Lists the type spec does not wrap, such as those of untyped fields,
+        # still become ListOf to record their changes.
+        if type(value) is list:
+            value = _tracked_list(value)
+        return self._check_functions(value, path, records)
+
+    def _check_functions(self, value, path: ErrorPath, records: list[ErrorRecord]):
+        """Run validators on a type-checked value and return the value to store."""
+
+        if not self._functions:
+            return value
+        if self.adaptive:
+            return self._check_adaptive(value, path, records)
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = _plan_functions(self._functions)
+
+        from ._model import Model
+
+        for function in plan:
+            try:
+                value_ = function(self, value)
+                if isinstance(value_, (ListOf, Model)):
+                    value = value_
+            except RecordedError as error:
+                records.extend(record.prefixed(path) for record in error.records)
+            except Exception as error:
+                records.append(ErrorRecord(path, function.name, "{0}", (error,)))
+        return value
 
-        for function in self._functions:
+    def _check_adaptive(self, value, path: ErrorPath, records: list[ErrorRecord]):
+        """Run validators in learned order and stop at the first failure.
+
+        The reported error is the one of the first failing validator in the
+        current order, which only changes at ``AdaptiveOrder`` checkpoints.
+        """
+
+        from ._model import Model
+
+        adaptive = self._adaptive
+        if adaptive is None:
+            plan = _plan_functions(self._functions)
+            pinned = [
+                getattr(function, "func", None) in _TRANSFORMS for function in plan
+            ]
+            adaptive = self._adaptive = AdaptiveOrder(plan, pinned)
+        order, timed = adaptive.start()
+        functions = adaptive.functions
+        for index in order:
+            function = functions[index]
+            start = perf_counter_ns() if timed else 0
+            failed: list[ErrorRecord] = []
             try:
                 value_ = function(self, value)
                 if isinstance(value_, (ListOf, Model)):
                     value = value_
-            except Exception as e:
-                errors.append((function, e))
-        if errors:
-            raise Field.VerifyError(errors)
+            except RecordedError as error:
+                failed = [record.prefixed(path) for record in error.records]
+            except Exception as error:
+                failed = [ErrorRecord(path, function.name, "{0}", (error,))]
+            adaptive.count(
+                index, bool(failed), perf_counter_ns() - start if timed else None
+            )
+            if failed:
+                records.extend(failed)
+                break
+        return value
+
+    def adaptive_stats(self) -> list[dict[str, Any]]:
+        """Return calls, rejections, and mean cost per validator of the chain.
+
+        Entries follow the current execution order of an ``adaptive=True``
+        field. Counts are halved at every reordering checkpoint.
+        """
+
+        if self._adaptive is None:
+            return []
+        return self._adaptive.stats()
+
+    async def avalidate(self, value, timeout: float | None = None):
+        """Validate ``value`` with sync validators, then with async validators.
+
+        Async validators of the field run concurrently. ``timeout`` limits each
+        async validator, and a timeout counts as a validation failure.
+        """
+
+        value = self.validate(value)
+        records = await self._run_async_functions(value, (), nullcontext(), timeout)
+        if records:
+            raise Field.VerifyError(records)
         return value
 
+    async def _run_async_functions(
+        self,
+        value,
+        path: ErrorPath,
+        limiter: AbstractAsyncContextManager,
+        timeout: float | None,
+    ) -> list[ErrorRecord]:
+        """Run async validators for ``value`` and nested models concurrently."""
+
+        from ._model import Model
+
+        checks = []
+        if value not in self.grant:
+            checks.extend(
+                self._run_async_function(function, value, path, limiter, timeout)
+                for function in self._async_functions
+            )
+        if isinstance(value, Model):
+            checks.append(value._run_async_checks(path, limiter, timeout))
+        elif isinstance(value, ListOf):
+            checks.extend(
+                item._run_async_checks((*path, index), limiter, timeout)
+                for index, item in enumerate(value)
+                if isinstance(item, Model)
+            )
+        if not checks:
+            return []
+        results = await asyncio.gather(*checks)
+        return [record for records in results for record in records]
+
+    async def _run_async_function(
+        self,
+        function: Function,
+        value,
+        path: ErrorPath,
+        limiter: AbstractAsyncContextManager,
+        timeout: float | None,
+    ) -> list[ErrorRecord]:
+        async with limiter:
+            try:
+                await asyncio.wait_for(function(self, value), timeout)
+            except TimeoutError:
+                return [ErrorRecord(path, "timeout", "{0} timed out", (function,))]
+            except Exception as error:
+                return [ErrorRecord(path, function.name, "{0}", (error,))]
+        return []
+
     @property
     def default(self):
         """Field's default value"""
@@ -319,26 +875,44 @@ class Field[T]:
     def __get__(self, obj: Model, owner: type[Model] | None = None) -> T: ...
 
     def __get__(self, obj, owner=None):
+        # Field is a non-data descriptor: ``Model.__setattr__`` and
+        # ``Model.__delattr__`` route writes, and a value cached as an instance
+        # attribute, see ``Model.__cache_reads__``, is returned by attribute
+        # lookup without calling this method.
         if obj is None:
+            # Lazy models resolve annotations on first class-level access so
+            # standalone use like ``User.email.value = ...`` stays typed.
+            if owner is not None and getattr(owner, "__prepared__", True) is False:
+                owner._prepare()
             return self
 
-        if self._name is None:
-            raise AttributeError("Field is not bound to a model attribute")
-
-        bound_field = obj._bound_fields[self._name]
-        if self._name not in obj._data and bound_field.has_default is False:
-            raise AttributeError(self._name)
-        return cast(T, bound_field.value)
-
-    def __set__(self, obj: Model, value: T):
-        if self._name is None:
+        name = self._name
+        if name is None:
             raise AttributeError("Field is not bound to a model attribute")
-        obj[self._name] = value
 
-    def __delete__(self, obj: Model):
-        if self._name is None:
-            raise AttributeError("Field is not bound to a model attribute")
-        del obj[self._name]
+        data = obj._data
+        if type(data) is CompactData:
+            # Read the value list directly instead of through the mapping.
+            value = data._values[data._index[name]]
+            if value is not UNDEF:
+                return cast(T, value)
+        else:
+            try:
+                value = data[name]
+            except KeyError:
+                pass
+            else:
+                if obj.__class__.__cache_reads__:
+                    object.__setattr__(obj, name, value)
+                return cast(T, value)
+        # Instances of ``deferred=True`` models validate raw input on first
+        # read, which also caches the value.
+        if obj._unchecked is None:
+            raise AttributeError(name)
+        try:
+            return cast(T, obj._read_unchecked(name))
+        except KeyError:
+            raise AttributeError(name) from None
 
     def reset(self):
         """Reset ``Field().value`` to default or ``UNDEF``"""
@@ -397,3 +971,82 @@ class Field[T]:
     def func(self, value, fn):
         """Use callable function to validate value."""
         fn(value)
+
+    @constraint("value >= {0}")
+    def min(self, value, bound):
+        """Verify that ``value >= bound``."""
+        assert value >= bound, f"{value!r} is less than {bound!r}"
+
+    @constraint("value <= {0}")
+    def max(self, value, bound):
+        """Verify that ``value <= bound``."""
+        assert value <= bound, f"{value!r} is greater than {bound!r}"
+
+    @constraint("{0} <= value <= {1}")
+    def between(self, value, low, high):
+        """Verify that ``low <= value <= high``."""
+        assert low <= value <= high, f"{value!r} is not between {low!r} and {high!r}"
+
+    @constraint("len(value) >= {0}")
+    def min_len(self, value, length: int):
+        """Verify that ``len(value) >= length``."""
+        assert len(value) >= length, f"Length {len(value)} is less than {length}"
+
+    @constraint("len(value) <= {0}")
+    def max_len(self, value, length: int):
+        """Verify that ``len(value) <= length``."""
+        assert len(value) <= length, f"Length {len(value)} is greater than {length}"
+
+    @constraint("value in {0}")
+    def anyof(self, value, members):
+        """Verify that ``value`` is one of ``members``."""
+        assert value in members, f"{value!r} is not one of {members!r}"
+
+    @constraint("value not in {0}")
+    def noneof(self, value, members):
+        """Verify that ``value`` is none of ``members``."""
+        assert value not in members, f"{value!r} is one of {members!r}"
+
+    @constraint("len(value) > 0")
+    def nonempty(self, value):
+        """Verify that ``value`` has at least one item or character."""
+        assert len(value) > 0, "Value is empty"
+
+    @constraint("len(set(value)) == len(value)")
+    def unique_items(self, value):
+        """Verify that the items of ``value`` are unique."""
+        try:
+            unique = len(set(value)) == len(value)
+        except TypeError:
+            unique = all(item not in value[:index] for index, item in enumerate(value))
+        assert unique, "Items are not unique"
+
+    def verify_async(self, func, message=None):
+        """Add an async check that must return ``True`` or ``False``.
+
+        Async validators do not run on ``Field().value`` assignment or in
+        ``Model(...)``. They run in ``Field.avalidate()`` and
+        ``Model.avalidate()`` after the sync validation chain passed.
+        """
+
+        self._async_functions.append(Function(_verify_async, func, message))
+        return self
+
+    def func_async(self, fn):
+        """Add an async callable that raises an exception for invalid values."""
+
+        self._async_functions.append(Function(_func_async, fn))
+        return self
+
+
+# Validators that replace the value for later validators keep their place in
+# adaptive chains.
+_TRANSFORMS = (Field.listof.__wrapped__, Field.model.__wrapped__)
+
+
+async def _verify_async(field, value, func, message=None):
+    assert await func(value), message
+
+
+async def _func_async(field, value, fn):
+    await fn(value)
@@ -0,0 +1,261 @@
+"""In-process validation metrics with per-thread counters."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+from ._errors import ErrorRecord
+
+#: Upper bounds in seconds of the default latency histogram buckets.
+BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+
+
+#: Module and qualified name of a model class, the key of its counters.
+_Owner = tuple[str, str]
+
+
+class MetricsRecorder(Protocol):
+    """Receiver of validation events, see ``set_metrics()``."""
+
+    def record(
+        self,
+        owner: type,
+        operation: str,
+        nanoseconds: int,
+        records: Sequence[ErrorRecord],
+    ) -> None:
+        """Record one validated operation.
+
+        ``owner`` is the ``Model`` subclass, or ``ListOf`` for list items.
+        ``operation`` is ``init``, ``reuse``, ``update``, ``setitem`` or ``item``,
+        or ``read`` and ``validate_all`` for ``deferred=True`` models.
+        ``records`` is empty when the operation succeeded.
+        """
+
+
+#: Active recorder. Models check it once per operation, so recording is off
+#: at the cost of one global lookup.
+recorder: MetricsRecorder | None = None
+
+
+def set_metrics(metrics: MetricsRecorder | None) -> MetricsRecorder | None:
+    """Install ``metrics`` as the process-wide recorder and return the old one.
+
+    Pass ``None`` to turn recording off.
+    """
+
+    global recorder
+    previous = recorder
+    recorder = metrics
+    return previous
+
+
+class _Shard:
+    """Counters written by one thread only."""
+
+    __slots__ = ("histograms", "failed", "failures")
+
+    def __init__(self):
+        # (owner, operation) -> bucket counts, then the overflow bucket, then
+        # the sum of nanoseconds.
+        self.histograms: dict[tuple[type, str], list[int]] = {}
+        # (owner, operation) -> failed operations.
+        self.failed: dict[tuple[type, str], int] = {}
+        # (owner, top-level key, code) -> error records.
+        self.failures: dict[tuple[type, str, str], int] = {}
+
+
+class Metrics:
+    """Counters and latency histograms of validated operations.
+
+    Every thread writes to its own shard, so recording takes no lock. Shards
+    are merged when a snapshot is taken, which may miss events recorded at
+    the same moment by other threads.
+
+    Parameters
+    ----------
+    buckets:
+        Upper bounds in seconds of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: Sequence[float] = BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._bounds = tuple(int(bound * 1e9) for bound in self.buckets)
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+
+    def _new_shard(self) -> _Shard:
+        shard = self._local.shard = _Shard()
+        with self._shards_lock:
+            self._shards.append(shard)
+        return shard
+
+    def record(
+        self,
+        owner: type,
+        operation: str,
+        nanoseconds: int,
+        records: Sequence[ErrorRecord],
+    ) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        key = (owner, operation)
+        histogram = shard.histograms.get(key)
+        if histogram is None:
+            histogram = shard.histograms[key] = [0] * (len(self._bounds) + 2)
+        histogram[bisect_left(self._bounds, nanoseconds)] += 1
+        histogram[-1] += nanoseconds
+        if records:
+            shard.failed[key] = shard.failed.get(key, 0) + 1
+            failures = shard.failures
+            for record in records:
+                field = str(record.path[0]) if record.path else ""
+                failure = (owner, field, record.code)
+                failures[failure] = failures.get(failure, 0) + 1
+
+    def _merged(self):
+        """Return counters of all shards keyed by ``(module, qualname)`` pairs.
+
+        Distinct classes with the same module and qualified name, such as
+        redefined local classes, share their counters.
+        """
+
+        histograms: dict[tuple[_Owner, str], list[int]] = {}
+        failed: dict[tuple[_Owner, str], int] = {}
+        failures: dict[tuple[_Owner, str, str], int] = {}
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for (owner, operation), histogram in shard.histograms.copy().items():
+                merged = histograms.setdefault(
+                    (_name(owner), operation), [0] * len(histogram)
+                )
+                for index, count in enumerate(histogram):
+                    merged[index] += count
+            for (owner, operation), count in shard.failed.copy().items():
+                key = (_name(owner), operation)
+                failed[key] = failed.get(key, 0) + count
+            for (owner, field, code), count in shard.failures.copy().items():
+                key = (_name(owner), field, code)
+                failures[key] = failures.get(key, 0) + count
+        return histograms, failed, failures
+
+    def _counters(self) -> dict[str, dict[_Owner, Any]]:
+        histograms, failed, failures = self._merged()
+        operations: dict[_Owner, dict[str, Any]] = {}
+        instances: dict[_Owner, int] = {}
+        for (owner, operation), histogram in sorted(histograms.items()):
+            count = sum(histogram[:-1])
+            failed_count = failed.get((owner, operation), 0)
+            cumulative = 0
+            buckets = {}
+            for bound, bucket in zip((*self.buckets, "+Inf"), histogram[:-1]):
+                cumulative += bucket
+                buckets[str(bound)] = cumulative
+            operations.setdefault(owner, {})[operation] = {
+                "count": count,
+                "failed": failed_count,
+                "sum_seconds": histogram[-1] / 1e9,
+                "buckets": buckets,
+            }
+            if operation == "init":
+                instances[owner] = count - failed_count
+        errors: dict[_Owner, dict[str, dict[str, int]]] = {}
+        for (owner, field, code), count in sorted(failures.items()):
+            errors.setdefault(owner, {}).setdefault(field, {})[code] = count
+        return {"instances": instances, "operations": operations, "failures": errors}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return merged counters as plain data.
+
+        ``operations`` maps model names, the module and qualified name of the
+        class such as ``app.models.User``, to operations with their ``count``,
+        ``failed`` count, ``sum_seconds`` and cumulative ``buckets`` keyed by
+        upper bound. ``instances`` counts successful ``init`` operations.
+        ``failures`` maps model names to top-level keys to error codes.
+        """
+
+        return {
+            section: {
+                f"{module}.{name}": value for (module, name), value in items.items()
+            }
+            for section, items in self._counters().items()
+        }
+
+    def to_prometheus(self, prefix: str = "dictify") -> str:
+        """Return the counters in the Prometheus text exposition format.
+
+        Series are labeled with the ``module`` and qualified ``model`` name of
+        the class.
+        """
+
+        counters = self._counters()
+        lines = [
+            f"# HELP {prefix}_instances_total Model instances built and validated.",
+            f"# TYPE {prefix}_instances_total counter",
+        ]
+        for (module, model), count in counters["instances"].items():
+            labels = _labels(module=module, model=model)
+            lines.append(f"{prefix}_instances_total{labels} {count}")
+        lines += [
+            f"# HELP {prefix}_failures_total Validation errors by field and code.",
+            f"# TYPE {prefix}_failures_total counter",
+        ]
+        for (module, model), fields in counters["failures"].items():
+            for field, codes in fields.items():
+                for code, count in codes.items():
+                    labels = _labels(module=module, model=model, field=field, code=code)
+                    lines.append(f"{prefix}_failures_total{labels} {count}")
+        lines += [
+            f"# HELP {prefix}_validation_seconds Validation latency.",
+            f"# TYPE {prefix}_validation_seconds histogram",
+        ]
+        for (module, model), operations in counters["operations"].items():
+            for operation, data in operations.items():
+                for bound, count in data["buckets"].items():
+                    labels = _labels(
+                        module=module, model=model, operation=operation, le=bound
+                    )
+                    lines.append(f"{prefix}_validation_seconds_bucket{labels} {count}")
+                labels = _labels(module=module, model=model, operation=operation)
+                lines.append(
+                    f"{prefix}_validation_seconds_sum{labels} {data['sum_seconds']}"
+                )
+                lines.append(
+                    f"{prefix}_validation_seconds_count{labels} {data['count']}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _name(owner: type) -> _Owner:
+    return owner.__module__, owner.__qualname__
+
+
+def _labels(**labels: str) -> str:
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
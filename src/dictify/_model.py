@@ -2,13 +2,56 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, MutableMapping
-from typing import Any, get_type_hints
-
-from ._field import Field, ListOf
+import asyncio
+import os
+import pickle
+import types
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, nullcontext
+from threading import RLock
+from time import perf_counter_ns
+from typing import Any, Self, get_type_hints
+from weakref import WeakSet
+
+from . import _metrics, _schema_cache, _stream
+from ._coerce import coerce, converter_for
+from ._compact import CompactData
+from ._dataclasses import derive_dataclass, from_dataclass, to_dataclass
+from ._errors import (
+    ErrorPath,
+    ErrorRecord,
+    RecordedError,
+    group_records,
+    records_from_error,
+)
+from ._field import Field, ListOf, _collect_changes, _mark_clean
+from ._path import compile_path
+from ._sampling import ModelStream
 from ._sentinel import UNDEF
-from ._types import FieldMap, FieldTypeMap
-from ._utils import _normalize_simple_type_spec, _resolve_field_annotation
+from ._types import (
+    ConverterMap,
+    DataDict,
+    DefaultFactory,
+    FieldMap,
+    FieldTypeMap,
+    KeyIndex,
+)
+from ._utils import (
+    _normalize_simple_type_spec,
+    _resolve_field_annotation,
+    _run_steps,
+    _same_value,
+)
+
+# Instance attributes that ``Model`` manages itself, which pickles leave out.
+_INSTANCE_STATE = frozenset(
+    ("_data", "_bound_fields", "_strict", "_lock", "_changes", "_unchecked")
+)
+
+# Lazy model classes waiting for type hint resolution and definition checks.
+_pending_models: WeakSet[type[Model]] = WeakSet()
+_prepare_lock = RLock()
 
 
 class BoundField:
@@ -20,9 +63,9 @@ class BoundField:
     runtime state.
     """
 
-    def __init__(self, definition: Field):
+    def __init__(self, definition: Field, value: Any = UNDEF):
         self.definition = definition
-        self._value = self.definition.get_default()
+        self._value = value
 
     @property
     def has_default(self):
@@ -38,8 +81,13 @@ class BoundField:
 
     @property
     def value(self):
-        """Return the current bound value, enforcing required-field access."""
+        """Return the current bound value, enforcing required-field access.
+
+        An unset field with a default takes its default on first access.
+        """
 
+        if self._value is UNDEF and self.definition.has_default:
+            self._value = self.definition.get_default()
         if self.definition.required and self._value is UNDEF:
             raise Field.RequiredError("Field is required")
         return self._value
@@ -54,58 +102,392 @@ class BoundField:
         self._value = self.default
 
 
+class _BoundFields(dict[str, BoundField]):
+    """Per-instance ``BoundField`` objects, created on first access.
+
+    Stored model data stays in the instance ``_data`` dict, so most
+    instances never need a ``BoundField`` at all.
+    """
+
+    __slots__ = ("_fields", "_data")
+
+    def __init__(self, fields: FieldMap, data: DataDict):
+        super().__init__()
+        self._fields = fields
+        self._data = data
+
+    def __missing__(self, key):
+        bound_field = BoundField(self._fields[key], self._data.get(key, UNDEF))
+        self[key] = bound_field
+        return bound_field
+
+
 class Model(MutableMapping[str, Any]):
     """Modified mapping that can define ``Field`` in it's class."""
 
     # Class-level schema collected once from Field declarations.
     __fields__: FieldMap = {}
     __field_types__: FieldTypeMap = {}
-
-    class Error(Exception):
-        """``Exception`` when data doesn't pass ``Model`` validation."""
+    __lazy__: bool = False
+    __prepared__: bool = True
+    __pickle_validate__: bool = True
+    __threadsafe__: bool = False
+    __layout_id__: int = 0
+    __compact__: bool = False
+    __coerce__: bool = False
+    __deferred__: bool = False
+    __key_index__: KeyIndex = {}
+    __max_depth__: int = 256
+
+    # Default handling planned once per class: shared non-callable defaults,
+    # every default in declaration order with ``UNDEF`` for factories, the
+    # factories, which return lists as ``ListOf``, and required fields
+    # without a default.
+    __default_values__: DataDict = {}
+    __default_slots__: DataDict = {}
+    __default_factories__: tuple[tuple[str, DefaultFactory], ...] = ()
+    __required_keys__: tuple[str, ...] = ()
+    # String converters of fields coerced by the class ``coerce`` option.
+    __coercers__: ConverterMap = {}
+    # Whether field values are also kept as plain instance attributes, which
+    # attribute lookup finds without calling ``Field.__get__``. Stored values
+    # are set on commit and defaults on first read. Off for compact models,
+    # to save memory, and threadsafe models, where a read could cache a value
+    # that a concurrent write just replaced.
+    __cache_reads__: bool = True
+    # Source class and field names of classes made by ``project()``.
+    __projection__: tuple[type[Model], tuple[str, ...]] | None = None
+
+    # Mutation lock; ``threadsafe=True`` models replace it per instance.
+    _lock: AbstractContextManager = nullcontext()
+
+    # Original values of keys changed since creation or ``mark_clean()``,
+    # created on the first change.
+    _changes: DataDict | None = None
+
+    # Raw input of a ``deferred=True`` instance that was not read yet, until
+    # ``validate_all()`` completes.
+    _unchecked: DataDict | None = None
+
+    class Error(RecordedError):
+        """``Exception`` when data doesn't pass ``Model`` validation.
+
+        The first argument maps top-level keys to lists of ``ErrorRecord``.
+        ``records`` lists every problem with its full path, and ``flatten()``
+        groups messages by dotted path such as ``items.3.price``.
+        """
 
         pass
 
-    def __init_subclass__(cls, **kwargs):
+    def __init_subclass__(
+        cls,
+        lazy: bool | None = None,
+        pickle_validate: bool | None = None,
+        threadsafe: bool | None = None,
+        max_depth: int | None = None,
+        compact: bool | None = None,
+        coerce: bool | None = None,
+        deferred: bool | None = None,
+        **kwargs,
+    ):
         """Collect class-declared Field definitions into ``cls.__fields__``.
 
         ``Field(...)`` expressions in a Model class body run once when the
         subclass is defined, so those objects act as shared schema templates.
         Per-instance runtime values are stored separately in BoundField objects.
+
+        Type hint resolution and definition checks run immediately unless the
+        class is declared with ``lazy=True``, in which case they are deferred to
+        first instantiation or ``Model.prepare_all()``.
+
+        ``pickle_validate=False`` rebuilds unpickled instances without running
+        validation again.
+
+        ``threadsafe=True`` gives each instance a reentrant lock that serializes
+        mutations, their ``post_validate()`` call, and ``dict()`` snapshots.
+
+        ``compact=True`` stores each instance's values in a list indexed by a
+        per-class key index instead of per-instance dicts and BoundField
+        objects, which takes far less memory for many small instances.
+
+        ``coerce=True`` converts ``str`` values of fields typed as ``int``,
+        ``float``, ``bool``, ``Decimal``, ``UUID``, ``datetime``, ``date`` or
+        ``time``, as found in query strings, CSV rows, and environment
+        variables. Fields declared with ``Field(coerce=False)`` opt out.
+
+        ``deferred=True`` makes the constructor store a copy of the raw input.
+        Each field is validated on first read, and iteration, ``dict()``,
+        pickling, and changes validate the rest, see ``validate_all()``.
+
+        ``max_depth`` limits how many keys and list indexes below the validated
+        root data for this model may sit. Deeper data fails validation with a
+        ``"depth"`` error. The default is 256.
+
+        Annotations may refer to the class itself. References to classes that
+        are not defined yet are resolved on first use.
+
+        Subclasses inherit these options from their bases.
         """
 
         super().__init_subclass__(**kwargs)
+        if lazy is not None:
+            cls.__lazy__ = lazy
+        if pickle_validate is not None:
+            cls.__pickle_validate__ = pickle_validate
+        if threadsafe is not None:
+            cls.__threadsafe__ = threadsafe
+        if max_depth is not None:
+            assert isinstance(max_depth, int) and max_depth >= 0
+            cls.__max_depth__ = max_depth
+        if compact is not None:
+            cls.__compact__ = compact
+        if coerce is not None:
+            cls.__coerce__ = coerce
+        if deferred is not None:
+            cls.__deferred__ = deferred
+        cls.__cache_reads__ = not (cls.__compact__ or cls.__threadsafe__)
         fields = {}
-        field_types = {}
-        type_hints = get_type_hints(cls, include_extras=True)
         for base in reversed(cls.__mro__[1:]):
             fields.update(getattr(base, "__fields__", {}))
-            field_types.update(getattr(base, "__field_types__", {}))
         for key, value in vars(cls).items():
             if isinstance(value, Field):
                 value._name = key
                 fields[key] = value
-                if key in type_hints:
-                    annotation = _resolve_field_annotation(type_hints[key])
-                    field_types[key] = annotation
-                    normalized_annotation = _normalize_simple_type_spec(annotation)
-                    normalized_instance = _normalize_simple_type_spec(
-                        value._instance_type
-                    )
-                    if (
-                        normalized_annotation is not None
-                        and normalized_instance is not None
-                        and normalized_annotation != normalized_instance
-                    ):
-                        raise Field.DefineError(
-                            f"{cls.__name__}.{key}: annotation {annotation!r} "
-                            f"conflicts with instance({value._instance_type!r})"
-                        )
-                    value._annotation_type = annotation
-                    if value._instance_type is UNDEF:
-                        value._ensure_default_matches_type_spec(annotation)
         cls.__fields__ = fields
-        cls.__field_types__ = field_types
+        cls.__layout_id__ = zlib.crc32("\0".join(fields).encode())
+        cls.__key_index__ = {key: position for position, key in enumerate(fields)}
+        cls.__default_values__ = {
+            key: field.get_default()
+            for key, field in fields.items()
+            if field.has_default and not field.has_default_factory
+        }
+        cls.__default_slots__ = {
+            key: cls.__default_values__.get(key, UNDEF)
+            for key, field in fields.items()
+            if field.has_default
+        }
+        cls.__default_factories__ = tuple(
+            (key, field._tracked_factory())
+            for key, field in fields.items()
+            if field.has_default_factory
+        )
+        cls.__required_keys__ = tuple(
+            key
+            for key, field in fields.items()
+            if field.required and not field.has_default
+        )
+        cls.__prepared__ = False
+        if cls.__lazy__:
+            _pending_models.add(cls)
+            return
+        try:
+            cls._prepare()
+        except NameError:
+            # Forward reference to a class defined later in its module.
+            _pending_models.add(cls)
+
+    @classmethod
+    def _prepare(cls):
+        """Resolve type hints and run definition checks once per class."""
+
+        if cls.__prepared__:
+            return
+        with _prepare_lock:
+            if cls.__prepared__:
+                return
+            for base in cls.__mro__[1:]:
+                if isinstance(base, type) and issubclass(base, Model):
+                    base._prepare()
+            field_types = _schema_cache.lookup(cls)
+            if field_types is None:
+                field_types = cls._resolve_field_types()
+            else:
+                for key, value in vars(cls).items():
+                    if isinstance(value, Field) and key in field_types:
+                        value._annotation_type = field_types[key]
+            cls.__field_types__ = field_types
+            cls.__coercers__ = cls._compile_coercers()
+            cls.__prepared__ = True
+            _pending_models.discard(cls)
+
+    @classmethod
+    def _compile_coercers(cls) -> ConverterMap:
+        """Return string converters of fields that follow the class option."""
+
+        if not cls.__coerce__:
+            return {}
+        coercers = {}
+        for key, field in cls.__fields__.items():
+            if field.coerce is None:
+                converter = converter_for(field._runtime_type_spec())
+                if converter is not None:
+                    coercers[key] = converter
+        return coercers
+
+    @classmethod
+    def _resolve_field_types(cls) -> FieldTypeMap:
+        """Resolve field annotations and check them against Field definitions."""
+
+        field_types = {}
+        for base in reversed(cls.__mro__[1:]):
+            field_types.update(getattr(base, "__field_types__", {}))
+        try:
+            type_hints = get_type_hints(cls, include_extras=True)
+        except NameError:
+            # The class name is not bound while its body is being defined.
+            type_hints = get_type_hints(
+                cls, localns={cls.__name__: cls}, include_extras=True
+            )
+        for key, value in vars(cls).items():
+            if isinstance(value, Field) and key in type_hints:
+                annotation = _resolve_field_annotation(type_hints[key])
+                field_types[key] = annotation
+                normalized_annotation = _normalize_simple_type_spec(annotation)
+                normalized_instance = _normalize_simple_type_spec(value._instance_type)
+                if (
+                    normalized_annotation is not None
+                    and normalized_instance is not None
+                    and normalized_annotation != normalized_instance
+                ):
+                    raise Field.DefineError(
+                        f"{cls.__name__}.{key}: annotation {annotation!r} "
+                        f"conflicts with instance({value._instance_type!r})"
+                    )
+                value._annotation_type = annotation
+                if value._instance_type is UNDEF:
+                    value._ensure_default_matches_type_spec(annotation)
+        return field_types
+
+    @classmethod
+    def project(cls, *keys: str) -> type[Model]:
+        """Return a model class with only the fields ``keys`` of this class.
+
+        Construction validates and stores only the projected keys of the
+        input and ignores the rest, so its cost follows the projection and
+        not the size of the input. The class shares the Field definitions
+        and class options of this class, but not its methods or
+        ``post_validate()``, and it is not a subclass. Classes are cached
+        per set of keys.
+        """
+
+        wanted = frozenset(keys)
+        projections = cls.__dict__.get("__projections__")
+        if projections is not None and wanted in projections:
+            return projections[wanted]
+        for key in wanted:
+            if key not in cls.__fields__:
+                raise KeyError(key)
+        with _prepare_lock:
+            cls._prepare()
+            projections = cls.__dict__.get("__projections__")
+            if projections is None:
+                projections = {}
+                cls.__projections__ = projections
+            if wanted in projections:
+                return projections[wanted]
+            selected = tuple(key for key in cls.__fields__ if key in wanted)
+            namespace: dict[str, Any] = {key: cls.__fields__[key] for key in selected}
+            namespace["__annotations__"] = {
+                key: cls.__field_types__[key]
+                for key in selected
+                if key in cls.__field_types__
+            }
+            namespace["__module__"] = cls.__module__
+            namespace["__qualname__"] = f"{cls.__qualname__}[{','.join(selected)}]"
+            namespace["__projection__"] = (cls, selected)
+            options = {
+                "pickle_validate": cls.__pickle_validate__,
+                "threadsafe": cls.__threadsafe__,
+                "max_depth": cls.__max_depth__,
+                "compact": cls.__compact__,
+                "coerce": cls.__coerce__,
+                "deferred": cls.__deferred__,
+            }
+            projected = types.new_class(
+                f"{cls.__name__}[{','.join(selected)}]",
+                (Model,),
+                options,
+                lambda body: body.update(namespace),
+            )
+            projections[wanted] = projected
+            return projected
+
+    @classmethod
+    def dataclass_type(cls, frozen: bool = False) -> type[Any]:
+        """Return a slotted dataclass with the fields of this class.
+
+        Instances are cheap to build and read, for example as snapshots on
+        hot read-only paths, see ``to_dataclass()``. ``frozen=True`` rejects
+        writes, at the cost of slower construction. Fields with a default,
+        and optional fields, which default to ``UNDEF``, are keyword-only. The
+        type is created once per class and ``frozen`` value.
+        """
+
+        derived = cls.__dict__.get("__dataclasses__")
+        if derived is not None and frozen in derived:
+            return derived[frozen]
+        with _prepare_lock:
+            derived = cls.__dict__.get("__dataclasses__")
+            if derived is None:
+                derived = {}
+                cls.__dataclasses__ = derived
+            if frozen not in derived:
+                derived[frozen] = derive_dataclass(cls, frozen)
+            return derived[frozen]
+
+    @classmethod
+    def from_dataclass(cls, obj: Any, trusted: bool = False) -> Self:
+        """Build an instance from the attributes of dataclass instance ``obj``.
+
+        Attributes named like fields of this class are read by a function
+        generated once per dataclass type, and ``UNDEF`` values of optional
+        fields are left out. With ``trusted=True`` the values are stored
+        without validation, like ``Model.from_stream()`` does for records
+        that were not sampled.
+        """
+
+        return from_dataclass(cls, obj, trusted)
+
+    @classmethod
+    def prepare_all(cls):
+        """Prepare every lazy subclass of ``cls`` that is not prepared yet.
+
+        Call this at a convenient point, for example after imports in a
+        long-running worker, to surface definition errors of ``lazy=True``
+        models before the first request instead of on first instantiation.
+        """
+
+        for model_cls in list(_pending_models):
+            if issubclass(model_cls, cls):
+                model_cls._prepare()
+
+    @classmethod
+    def save_schema_cache(cls, path: str | os.PathLike[str]) -> int:
+        """Write resolved schemas of ``cls`` subclasses to a cache file.
+
+        Every non-local subclass is prepared first, so the file also serves
+        as a check that all lazy models are valid. Returns the entry count.
+        """
+
+        classes = []
+        pending = [cls]
+        while pending:
+            model_cls = pending.pop()
+            if model_cls is not Model:
+                classes.append(model_cls)
+            pending.extend(model_cls.__subclasses__())
+        return _schema_cache.dump(path, classes)
+
+    @staticmethod
+    def load_schema_cache(path: str | os.PathLike[str]) -> int:
+        """Load a schema cache written by ``Model.save_schema_cache()``.
+
+        Load the cache before importing model modules. Classes whose source,
+        base classes, or annotation types changed since the cache was written
+        are analyzed normally. Returns the number of entries read.
+        """
+
+        return _schema_cache.load(path)
 
     def __init__(self, data: Mapping[str, Any] | None = None, strict: bool = True):
         """Create a model instance from mapping data and validate declared fields."""
@@ -116,53 +498,544 @@ class Model(MutableMapping[str, Any]):
             "Model initial data should be instance of mapping"
         )
         assert isinstance(strict, bool)
-        data = dict(data)
-        object.__setattr__(
-            self,
-            "_bound_fields",
-            {
-                key: BoundField(field)
-                for key, field in self.__class__.__fields__.items()
-            },
-        )
-        object.__setattr__(self, "_data", {})
+        if self.__class__.__deferred__:
+            self._defer(data, strict)
+            return
+        recorder = _metrics.recorder
+        start = perf_counter_ns() if recorder is not None else 0
+        records: list[ErrorRecord] = []
+        _run_steps(self._construct_steps(data, strict, (), records))
+        if recorder is not None:
+            recorder.record(self.__class__, "init", perf_counter_ns() - start, records)
+        if records:
+            raise Model.Error(group_records(records))
+        self.post_validate()
+
+    def _construct_steps(
+        self,
+        data: Mapping[str, Any],
+        strict: bool,
+        path: ErrorPath,
+        records: list[ErrorRecord],
+    ):
+        """Return validation steps that fill a new instance from ``data``.
+
+        Problems are appended to ``records``; values are only stored when
+        there are none.
+        """
+
+        cls = self.__class__
+        if not cls.__prepared__:
+            cls._prepare()
+        if cls.__projection__ is not None:
+            data = {key: data[key] for key in cls.__fields__ if key in data}
+        self._init_state(strict, data)
+
+        count = len(records)
+        for key in cls.__required_keys__:
+            if key not in data:
+                records.append(
+                    ErrorRecord((*path, key), "required", "Field is required")
+                )
+
+        validated = yield from self._check_mapping_steps(data, path, records)
+        if len(records) == count:
+            self._commit_validated(validated)
+
+    def _defer(self, data: Mapping[str, Any], strict: bool):
+        """Keep a copy of ``data`` to validate on read, see ``deferred=True``."""
+
+        cls = self.__class__
+        if not cls.__prepared__:
+            cls._prepare()
+        if cls.__projection__ is not None:
+            unchecked = {key: data[key] for key in cls.__fields__ if key in data}
+        else:
+            unchecked = dict(data)
+        # Defaults are stored on first read too, so a key missing from the
+        # storage is either unchecked input, an unset default, or absent.
+        self._init_state(strict)
+        object.__setattr__(self, "_unchecked", unchecked)
+
+    def _read_unchecked(self, key):
+        """Validate, store, and return the value of ``key`` on its first read.
+
+        Raises ``Model.Error`` when the raw value is invalid, leaving it to be
+        reported again, and ``KeyError`` when there is no value.
+        """
+
+        cls = self.__class__
+        with self._lock:
+            unchecked = self._unchecked
+            data = self._data
+            if unchecked is not None and key not in data:
+                if key in unchecked:
+                    recorder = _metrics.recorder
+                    start = perf_counter_ns() if recorder is not None else 0
+                    records: list[ErrorRecord] = []
+                    validated = self._check_mapping({key: unchecked[key]}, (), records)
+                    if recorder is not None:
+                        recorder.record(cls, "read", perf_counter_ns() - start, records)
+                    if records:
+                        raise Model.Error(group_records(records))
+                    self._commit_validated(validated)
+                    del unchecked[key]
+                elif key in cls.__fields__ and cls.__fields__[key].has_default:
+                    self._commit_validated(
+                        {key: cls.__fields__[key]._tracked_default()}
+                    )
+            return data[key]
+
+    def validate_all(self):
+        """Validate the rest of a ``deferred=True`` instance.
+
+        Fields not read yet are validated, required and undeclared keys are
+        checked, unset defaults are stored, and ``post_validate()`` runs.
+        Raises ``Model.Error`` with every problem left, as the constructor of
+        a model without ``deferred=True`` would. Does nothing once an instance
+        is complete, which other instances always are.
+        """
+
+        if self._unchecked is None:
+            return
+        cls = self.__class__
+        with self._lock:
+            unchecked = self._unchecked
+            if unchecked is None:
+                return
+            data = self._data
+            recorder = _metrics.recorder
+            start = perf_counter_ns() if recorder is not None else 0
+            records: list[ErrorRecord] = [
+                ErrorRecord((key,), "required", "Field is required")
+                for key in cls.__required_keys__
+                if key not in data and key not in unchecked
+            ]
+            validated = self._check_mapping(unchecked, (), records)
+            if recorder is not None:
+                recorder.record(cls, "validate_all", perf_counter_ns() - start, records)
+            if records:
+                raise Model.Error(group_records(records))
+
+            defaults = {}
+            for key, value in cls.__default_slots__.items():
+                if key not in data and key not in validated:
+                    if value is UNDEF:
+                        value = cls.__fields__[key]._tracked_default()
+                    defaults[key] = value
+            self._commit_validated(defaults)
+            self._commit_validated(validated)
+            self.post_validate()
+            object.__setattr__(self, "_unchecked", None)
+
+    @classmethod
+    def _build_steps(
+        cls,
+        data: Mapping[str, Any],
+        path: ErrorPath,
+        records: list[ErrorRecord],
+    ):
+        """Return steps building a nested instance, or ``None`` on problems."""
+
+        if cls.__init__ is not Model.__init__:
+            try:
+                return cls(data)
+            except Exception as error:
+                records.extend(records_from_error(error, path))
+                return None
+        if len(path) > cls.__max_depth__:
+            records.append(
+                ErrorRecord(
+                    path,
+                    "depth",
+                    "Data is nested deeper than {0}",
+                    (cls.__max_depth__,),
+                )
+            )
+            return None
+
+        instance = cls.__new__(cls)
+        count = len(records)
+        yield from instance._construct_steps(data, True, path, records)
+        if len(records) > count:
+            return None
+        try:
+            instance.post_validate()
+        except Exception as error:
+            records.append(ErrorRecord(path, "post_validate", "{0}", (error,)))
+            return None
+        return instance
+
+    def _init_state(self, strict: bool, data: Mapping[str, Any] | None = None):
+        """Create per-instance storage for filling from ``data``.
+
+        The storage holds the defaults of keys missing from ``data``, see
+        ``_defaults_for()``, and is left empty without ``data``.
+        """
+
+        cls = self.__class__
+        if cls.__threadsafe__:
+            object.__setattr__(self, "_lock", RLock())
+        defaults = {} if data is None else self._defaults_for(data)
+        if cls.__compact__:
+            storage = CompactData(cls.__key_index__, defaults)
+        else:
+            storage = defaults
+            object.__setattr__(
+                self, "_bound_fields", _BoundFields(cls.__fields__, storage)
+            )
+        object.__setattr__(self, "_data", storage)
         object.__setattr__(self, "_strict", strict)
 
-        errors = {}
-        for key, field in self.__class__.__fields__.items():
-            bound_field = self._bound_fields[key]
-            if key in data:
-                continue
-            if bound_field.has_default:
-                self._data[key] = bound_field.value
-            elif field.required:
-                errors[key] = Field.RequiredError("This field is required")
-        if errors:
-            raise Model.Error(errors)
+    def _defaults_for(self, data: Mapping[str, Any]) -> DataDict:
+        """Return a new dict with the defaults of keys missing from ``data``.
 
-        self._commit_validated(self._validate_mapping(data))
-        self.post_validate()
+        Defaults keep their declaration order, factories included, so input
+        values stored afterwards follow in input order, as in a dict filled
+        field by field. Factories only run for missing keys.
+        """
+
+        cls = self.__class__
+        defaults = cls.__default_slots__.copy()
+        # Drop the keys present in data, looking up whichever side is smaller,
+        # as sparse input of wide models is common.
+        if len(data) < len(defaults):
+            for key in data:
+                if key in defaults:
+                    del defaults[key]
+        else:
+            for key in cls.__default_slots__:
+                if key in data:
+                    del defaults[key]
+        for key, factory in cls.__default_factories__:
+            if key not in data:
+                value = defaults[key] = factory()
+                if cls.__threadsafe__ and isinstance(value, ListOf):
+                    value._lock = self._lock
+        return defaults
+
+    @classmethod
+    def _from_trusted(cls, data: Mapping[str, Any], strict: bool = True) -> Self:
+        """Build an instance from already validated data without validation.
+
+        Missing fields with defaults are filled in; required fields and
+        ``post_validate()`` are not checked. Projections drop other keys.
+        """
+
+        if not cls.__prepared__:
+            cls._prepare()
+        if cls.__projection__ is not None:
+            data = {key: data[key] for key in cls.__fields__ if key in data}
+        instance = cls.__new__(cls)
+        instance._init_state(strict, data)
+        instance._commit_validated(data)
+        return instance
+
+    @classmethod
+    def reuse(cls, instance: Self, data: Mapping[str, Any]) -> Self:
+        """Validate ``data`` into an existing ``instance`` and return it.
+
+        The result equals a new instance built from ``data`` with the
+        ``strict`` option of ``instance``, but the instance is reused, so a
+        loop that handles one record at a time keeps little alive beyond the
+        new values. Fields missing from ``data`` are reset to their defaults
+        and change tracking starts clean.
+
+        Invalid data raises ``Model.Error`` and leaves ``instance`` unchanged.
+        ``post_validate()`` runs on the new values, and if it fails the
+        previous values are restored before the error is raised.
+        """
+
+        assert isinstance(instance, cls), f"{instance!r} is not instance of {cls}"
+        assert isinstance(data, Mapping), "Model data should be instance of mapping"
+        instance._reuse(data)
+        return instance
+
+    def _reuse(self, data: Mapping[str, Any]):
+        cls = self.__class__
+        if cls.__projection__ is not None:
+            data = {key: data[key] for key in cls.__fields__ if key in data}
+        recorder = _metrics.recorder
+        start = perf_counter_ns() if recorder is not None else 0
+        records: list[ErrorRecord] = []
+        for key in cls.__required_keys__:
+            if key not in data:
+                records.append(ErrorRecord((key,), "required", "Field is required"))
+        validated = _run_steps(self._check_mapping_steps(data, (), records))
+        if recorder is not None:
+            recorder.record(cls, "reuse", perf_counter_ns() - start, records)
+        if records:
+            raise Model.Error(group_records(records))
+
+        with self._lock:
+            # The new values go into fresh storage that replaces the current
+            # one, which stays intact until post_validate() succeeds.
+            previous = self._data
+            defaults = self._defaults_for(data)
+            if cls.__compact__:
+                storage = CompactData(cls.__key_index__, defaults)
+            else:
+                storage = defaults
+            bound_fields = None if cls.__compact__ else self._bound_fields
+            changes = self._changes
+            unchecked = self._unchecked
+            self._swap_storage(storage, previous, validated)
+            try:
+                if changes is not None:
+                    object.__setattr__(self, "_changes", None)
+                if unchecked is not None:
+                    object.__setattr__(self, "_unchecked", None)
+                self._commit_validated(validated)
+                self.post_validate()
+            except BaseException:
+                self._swap_storage(previous, storage, {}, bound_fields)
+                object.__setattr__(self, "_changes", changes)
+                object.__setattr__(self, "_unchecked", unchecked)
+                raise
+
+    def _swap_storage(
+        self,
+        storage: Any,
+        replaced: Any,
+        stored: Mapping[str, Any],
+        bound_fields: _BoundFields | None = None,
+    ):
+        """Install ``storage`` in place of ``replaced`` for ``_reuse()``.
+
+        Cached attributes of fields in ``storage`` but not in ``stored``,
+        which ``_commit_validated()`` sets, are refreshed, and those of
+        fields no longer stored are removed. ``bound_fields`` are installed
+        too, or new ones when the current ones are in use.
+        """
+
+        cls = self.__class__
+        object.__setattr__(self, "_data", storage)
+        if not cls.__compact__:
+            current = self._bound_fields
+            if bound_fields is None:
+                bound_fields = current
+                if current:
+                    bound_fields = _BoundFields(cls.__fields__, storage)
+            bound_fields._data = storage
+            if bound_fields is not current:
+                object.__setattr__(self, "_bound_fields", bound_fields)
+        if cls.__cache_reads__:
+            for key in cls.__fields__:
+                if key in storage:
+                    if key not in stored:
+                        object.__setattr__(self, key, storage[key])
+                elif key in replaced:
+                    self._uncache(key)
+
+    @classmethod
+    async def avalidate(
+        cls,
+        data: Mapping[str, Any] | None = None,
+        strict: bool = True,
+        *,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> Self:
+        """Create a model instance and run async field validators.
+
+        The instance is built and validated synchronously first. Async
+        validators of all fields, including nested models, then run
+        concurrently with ``asyncio.gather``.
+
+        Parameters
+        ----------
+        concurrency:
+            Maximum number of async validators running at once.
+        timeout:
+            Seconds each async validator may take. A timeout is reported as a
+            validation error of its field.
+        """
+
+        instance = cls(data, strict=strict)
+        instance.validate_all()
+        limiter: AbstractAsyncContextManager = nullcontext()
+        if concurrency is not None:
+            limiter = asyncio.Semaphore(concurrency)
+        records = await instance._run_async_checks((), limiter, timeout)
+        if records:
+            raise Model.Error(group_records(records))
+        return instance
+
+    @classmethod
+    def iter_json_array(
+        cls,
+        path: str | os.PathLike[str],
+        strict: bool = True,
+        *,
+        chunk_size: int = _stream.CHUNK_SIZE,
+    ) -> Iterator[tuple[int, Self | Model.Error]]:
+        """Validate the elements of a JSON array file one at a time.
+
+        The file is memory-mapped and decoded incrementally, so memory stays
+        proportional to one element instead of the whole document. Yields
+        ``(byte offset, instance)`` for valid elements and ``(byte offset,
+        Model.Error)`` for invalid ones, where the offset points at the first
+        byte of the element. Malformed JSON raises ``json.JSONDecodeError``.
+        """
+
+        for offset, value in _stream.iter_json_array(path, chunk_size):
+            result: Self | Model.Error
+            if isinstance(value, Mapping):
+                try:
+                    result = cls(value, strict=strict)
+                except Model.Error as error:
+                    result = error
+            else:
+                record = ErrorRecord(
+                    (), "type", "{0} is not instance of {1}", (type(value), Mapping)
+                )
+                result = Model.Error(group_records([record]))
+            yield offset, result
+
+    @classmethod
+    def from_stream(
+        cls,
+        records: Iterable[Any],
+        sample_rate: float = 0.01,
+        strict: bool = True,
+        *,
+        seed: int | None = None,
+    ) -> ModelStream[Self]:
+        """Build instances from records that were validated upstream.
+
+        A random ``sample_rate`` share of records gets full validation. The
+        rest are built without validation after checking required keys and
+        the top-level type of each value; nested models and lists are built
+        from trusted data. Returns an iterator of instances, with
+        ``Model.Error`` in place of invalid records, whose ``stats`` attribute
+        counts failures per top-level key to detect schema drift.
+        ``seed`` makes the sample reproducible.
+        """
+
+        return ModelStream(cls, records, sample_rate, strict, seed)
+
+    async def _run_async_checks(
+        self,
+        path: ErrorPath,
+        limiter: AbstractAsyncContextManager,
+        timeout: float | None,
+    ) -> list[ErrorRecord]:
+        """Run async validators of stored fields and return their problems."""
+
+        fields = self.__class__.__fields__
+        results = await asyncio.gather(
+            *(
+                fields[key]._run_async_functions(value, (*path, key), limiter, timeout)
+                for key, value in self._data.items()
+                if key in fields
+            )
+        )
+        return [record for records in results for record in records]
+
+    def __reduce__(self):
+        """Pickle as the class plus a positional tuple of field values.
+
+        Field definitions are not serialized. Undeclared ``strict=False`` extras
+        travel in a separate mapping, and other instance attributes, such as
+        those set by a subclass ``__init__``, in a third one. The key order is
+        added when it differs from declared fields followed by extras.
+        Unpickling does not call a subclass ``__init__``, see
+        ``_restore_model()``. Nested models are pickled by ``pickle``
+        itself, one recursion level each, as nested dicts are.
+        """
+
+        self.validate_all()
+        cls = self.__class__
+        data = self._data
+        values = tuple(data.get(key, UNDEF) for key in cls.__fields__)
+        # Projected classes are not importable, so they travel as their
+        # source class and keys.
+        if cls.__projection__ is None:
+            restore, owner = _restore_model, (cls,)
+        else:
+            restore, owner = _restore_projection, cls.__projection__
+        state = {
+            key: value
+            for key, value in vars(self).items()
+            if key not in _INSTANCE_STATE and key not in cls.__fields__
+        }
+        extra = {key: data[key] for key in data if key not in cls.__fields__}
+        order = None
+        if not cls.__compact__:
+            keys = [key for key in cls.__fields__ if key in data]
+            keys.extend(extra)
+            if keys != list(data):
+                order = tuple(data)
+        if self._strict and not state and not extra and order is None:
+            return (restore, (*owner, cls.__layout_id__, values))
+        return (
+            restore,
+            (*owner, cls.__layout_id__, values, extra, self._strict, state, order),
+        )
 
     def __getitem__(self, key):
         """Return a validated stored value by key."""
 
-        return self._data[key]
+        try:
+            return self._data[key]
+        except KeyError:
+            if self._unchecked is None:
+                raise
+        return self._read_unchecked(key)
+
+    def __contains__(self, key):
+        """Return whether ``key`` has a value, without validating it.
+
+        Keys of a ``deferred=True`` instance that are not validated yet count
+        when they are in the input, or are fields with a default.
+        """
+
+        if key in self._data:
+            return True
+        unchecked = self._unchecked
+        if unchecked is None:
+            return False
+        if key in unchecked:
+            return True
+        field = self.__class__.__fields__.get(key)
+        return field is not None and field.has_default
+
+    def get(self, key, default=None):
+        """Return the value of ``key``, or ``default`` if it has no value.
+
+        Like ``self[key]``, an invalid value of a ``deferred=True`` instance
+        raises ``Model.Error`` instead of returning ``default``.
+        """
+
+        try:
+            return self._data[key]
+        except KeyError:
+            if self._unchecked is None:
+                return default
+        try:
+            return self._read_unchecked(key)
+        except KeyError:
+            return default
 
     def __iter__(self):
         """Iterate over stored model keys."""
 
+        if self._unchecked is not None:
+            self.validate_all()
         return iter(self._data)
 
     def __len__(self):
         """Return the number of stored keys."""
 
+        if self._unchecked is not None:
+            self.validate_all()
         return len(self._data)
 
     def __eq__(self, other):
         """Compare model data against another mapping by value."""
 
         if isinstance(other, Mapping):
-            return dict(self) == dict(other)
+            return _equal(self, other)
         return NotImplemented
 
     def __getattr__(self, key):
@@ -171,22 +1044,31 @@ class Model(MutableMapping[str, Any]):
         if key.startswith("_"):
             raise AttributeError(key)
 
-        data = self.__dict__.get("_data")
-        if data is not None and key not in self.__class__.__fields__ and key in data:
-            return data[key]
+        # ``_data`` is looked up as an attribute, because reading ``__dict__``
+        # would materialize the instance dict and slow down later lookups.
+        try:
+            data = self._data
+        except AttributeError:
+            raise AttributeError(key) from None
+        if key not in self.__class__.__fields__:
+            if key in data:
+                return data[key]
+            unchecked = self._unchecked
+            if unchecked is not None and key in unchecked:
+                return self._read_unchecked(key)
         raise AttributeError(key)
 
     def __setattr__(self, key, value):
         """Route public attribute writes through field or strict model semantics."""
 
-        if key.startswith("_") or "_data" not in self.__dict__:
-            object.__setattr__(self, key, value)
-            return
-
         if key in self.__class__.__fields__:
             self[key] = value
             return
 
+        if key.startswith("_") or "_data" not in self.__dict__:
+            object.__setattr__(self, key, value)
+            return
+
         if self._strict is False:
             self[key] = value
             return
@@ -196,80 +1078,166 @@ class Model(MutableMapping[str, Any]):
     def __delattr__(self, key):
         """Route public attribute deletes through field or strict model semantics."""
 
-        if key.startswith("_") or "_data" not in self.__dict__:
-            object.__delattr__(self, key)
-            return
-
         if key in self.__class__.__fields__:
             del self[key]
             return
 
+        if key.startswith("_") or "_data" not in self.__dict__:
+            object.__delattr__(self, key)
+            return
+
         if self._strict is False and key in self._data:
             del self[key]
             return
 
         raise AttributeError(key)
 
-    def _validate_item(self, key, value):
-        """Validate one key/value pair against the declared schema."""
+    def _check_mapping(
+        self,
+        data: Mapping[str, Any],
+        path: ErrorPath,
+        records: list[ErrorRecord],
+    ):
+        """Validate key/value pairs against the declared schema without raising."""
+
+        return _run_steps(self._check_mapping_steps(data, path, records))
+
+    def _check_mapping_steps(
+        self,
+        data: Mapping[str, Any],
+        path: ErrorPath,
+        records: list[ErrorRecord],
+    ):
+        """Return validation steps of ``_check_mapping``."""
+
+        fields = self.__class__.__fields__
+        coercers = self.__class__.__coercers__
+        validated = {}
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                if self._strict is False:
+                    validated[key] = value
+                else:
+                    records.append(
+                        ErrorRecord((*path, key), "undefined", "Field is not defined")
+                    )
+            elif isinstance(value, (Mapping, list)):
+                validated[key] = yield field._check_steps(value, (*path, key), records)
+            else:
+                if (
+                    coercers
+                    and type(value) is str
+                    and key in coercers
+                    and value not in field.grant
+                ):
+                    value = coerce(
+                        coercers[key],
+                        value,
+                        field._runtime_type_spec(),
+                        (*path, key),
+                        records,
+                    )
+                    # Converters return the field type, so only validators run.
+                    if value is not UNDEF:
+                        validated[key] = field._check_functions(
+                            value, (*path, key), records
+                        )
+                    continue
+                validated[key] = field._check(value, (*path, key), records)
+        return validated
 
-        if key not in self.__class__.__fields__:
-            if self._strict is False:
-                return value
-            raise KeyError("Field is not defined")
-        return self._bound_fields[key].definition.validate(value)
+    def _validate_mapping(self, data: Mapping[str, Any], operation: str):
+        """Validate a mapping and return validated values or raise Model.Error.
 
-    def _validate_mapping(self, data: Mapping[str, Any]):
-        """Validate a mapping and return validated values or raise Model.Error."""
+        ``operation`` names the caller for the metrics recorder.
+        """
 
-        errors = {}
-        validated = {}
-        for key, value in data.items():
-            try:
-                validated[key] = self._validate_item(key, value)
-            except (Field.VerifyError, KeyError) as error:
-                errors[key] = error
-        if errors:
-            raise Model.Error(errors)
+        self.validate_all()
+        recorder = _metrics.recorder
+        start = perf_counter_ns() if recorder is not None else 0
+        records: list[ErrorRecord] = []
+        validated = self._check_mapping(data, (), records)
+        if recorder is not None:
+            recorder.record(
+                self.__class__, operation, perf_counter_ns() - start, records
+            )
+        if records:
+            raise Model.Error(group_records(records))
         return validated
 
     def _commit_validated(self, data: Mapping[str, Any]):
         """Persist validated values into bound fields and model storage."""
 
+        cls = self.__class__
+        threadsafe = cls.__threadsafe__
+        bound_fields = None if cls.__compact__ else self._bound_fields
+        fields = cls.__fields__ if cls.__cache_reads__ else None
         for key, value in data.items():
-            if key in self.__class__.__fields__:
-                self._bound_fields[key]._value = value
+            if bound_fields:
+                bound_field = bound_fields.get(key)
+                if bound_field is not None:
+                    bound_field._value = value
+            if fields is not None and key in fields:
+                object.__setattr__(self, key, value)
+            if threadsafe and isinstance(value, ListOf):
+                value._lock = self._lock
             self._data[key] = value
 
+    def _commit_changes(self, data: Mapping[str, Any]):
+        """Record changed keys, then persist validated values."""
+
+        for key, value in data.items():
+            self._record_change(key, value)
+        self._commit_validated(data)
+
+    def _record_change(self, key, value):
+        """Remember the original value of ``key`` unless ``value`` is a no-op."""
+
+        changes = self._changes
+        if changes is None:
+            if _same_value(self._data.get(key, UNDEF), value):
+                return
+            changes = {}
+            object.__setattr__(self, "_changes", changes)
+        if key in changes:
+            if _same_value(changes[key], value):
+                del changes[key]
+            return
+        current = self._data.get(key, UNDEF)
+        if not _same_value(current, value):
+            changes[key] = current
+
     def __delitem__(self, key):
         """Delete item but also check for Field's default or required option."""
 
-        if (key not in self.__class__.__fields__) and (self._strict is False):
-            del self._data[key]
+        self.validate_all()
+        with self._lock:
+            if (key not in self.__class__.__fields__) and (self._strict is False):
+                self._record_change(key, UNDEF)
+                del self._data[key]
+                self.post_validate()
+                return
+
+            field = self.__class__.__fields__[key]
+            if field.has_default:
+                self._commit_changes({key: field._tracked_default()})
+            elif field.required:
+                record = ErrorRecord((key,), "required", "Field is required")
+                raise Model.Error({key: [record]})
+            else:
+                self._record_change(key, UNDEF)
+                del self._data[key]
+                self._forget(key)
             self.post_validate()
-            return
-
-        bound_field = self._bound_fields[key]
-        if bound_field.has_default:
-            bound_field.reset()
-            self._data[key] = bound_field.value
-        elif bound_field.definition.required:
-            raise Model.Error({key: Field.RequiredError("Field is required")})
-        else:
-            del self._data[key]
-            bound_field._value = UNDEF
-        self.post_validate()
 
     def __setitem__(self, key, value):
         """Set ``value`` if is valid."""
 
-        try:
-            validated = self._validate_item(key, value)
-        except (Field.VerifyError, KeyError) as error:
-            raise Model.Error({key: error}) from error
-
-        self._commit_validated({key: validated})
-        self.post_validate()
+        validated = self._validate_mapping({key: value}, "setitem")[key]
+        with self._lock:
+            self._commit_changes({key: validated})
+            self.post_validate()
 
     def pop(self, *args, **kw):
         """Unsupported because schema-aware delete semantics are not defined."""
@@ -294,27 +1262,343 @@ class Model(MutableMapping[str, Any]):
     def setdefault(self, key, default=None):
         """Return an existing value or validate and store the provided default."""
 
-        if key in self:
+        with self._lock:
+            if key in self:
+                return self[key]
+            self[key] = default
             return self[key]
-        self[key] = default
-        return self[key]
 
     def update(self, data=None, **kwargs):
         """Update ``data`` if is valid."""
         if data is None:
             data = {}
-        validated = self._validate_mapping(dict(data, **kwargs))
-        self._commit_validated(validated)
-        self.post_validate()
+        validated = self._validate_mapping(dict(data, **kwargs), "update")
+        with self._lock:
+            self._commit_changes(validated)
+            self.post_validate()
+
+    def get_path(self, path: str | ErrorPath, default: Any = UNDEF) -> Any:
+        """Return the nested value at ``path``, such as ``"items.3.price"``.
+
+        ``path`` is a dotted string or a tuple of keys and list indexes, in
+        the notation of ``ErrorRecord.location`` and ``ErrorRecord.path``.
+        Compiled paths are cached. A missing key or index raises ``KeyError``
+        with the dotted path, unless ``default`` is given.
+        """
+
+        return compile_path(path).get(self, default)
+
+    def set_path(self, path: str | ErrorPath, value: Any):
+        """Validate ``value`` and store it at the nested ``path``.
+
+        Only the field or ``ListOf`` holding the value validates it, and
+        errors carry paths from this model. ``post_validate()`` then runs on
+        each model along the path, innermost first. If it fails, the previous
+        value is restored before the error is raised.
+        """
+
+        compile_path(path).set(self, value)
+
+    def patch(self, patch_doc: Mapping[str, Any]):
+        """Apply an RFC 7386 JSON Merge Patch and validate only touched paths.
+
+        - ``None`` removes a key with ``__delitem__()`` rules: fields with a
+          default are reset, required fields cannot be removed.
+        - A mapping patches a nested ``Model`` value in place, or is merged
+          into a plain mapping value before validation.
+        - Any other value, including lists, replaces the current value.
+
+        All changes are validated before any is applied. ``post_validate()``
+        then runs on every affected model, innermost first, and a failure
+        there restores all previous values before the error is re-raised.
+        """
+
+        assert isinstance(patch_doc, Mapping), "Patch document should be a mapping"
+        changes: list[tuple[Model, str, Any]] = []
+        affected: list[Model] = []
+        records: list[ErrorRecord] = []
+        self._plan_patch(patch_doc, (), changes, affected, records)
+        if records:
+            raise Model.Error(group_records(records))
+
+        with self._lock:
+            previous = []
+            try:
+                for model, key, value in changes:
+                    previous.append((model, key, model._data.get(key, UNDEF)))
+                    model._apply_patched(key, value)
+                for model in affected:
+                    model.post_validate()
+            except BaseException:
+                for model, key, value in reversed(previous):
+                    model._apply_patched(key, value)
+                raise
+
+    def _plan_patch(
+        self,
+        patch_doc: Mapping[str, Any],
+        path: ErrorPath,
+        changes: list[tuple[Model, str, Any]],
+        affected: list[Model],
+        records: list[ErrorRecord],
+    ):
+        """Validate a merge patch and collect the changes it would apply.
+
+        Appends ``(model, key, value)`` changes, where ``UNDEF`` removes the
+        key, affected models in post-order, and problems to ``records``.
+        """
+
+        self.validate_all()
+        fields = self.__class__.__fields__
+        planned = len(changes)
+        for key, value in patch_doc.items():
+            current = self._data.get(key, UNDEF)
+            if value is None:
+                if key not in fields:
+                    if self._strict:
+                        records.append(
+                            ErrorRecord(
+                                (*path, key), "undefined", "Field is not defined"
+                            )
+                        )
+                    elif current is not UNDEF:
+                        changes.append((self, key, UNDEF))
+                    continue
+                field = fields[key]
+                if field.has_default:
+                    changes.append((self, key, field._tracked_default()))
+                elif field.required:
+                    records.append(
+                        ErrorRecord((*path, key), "required", "Field is required")
+                    )
+                elif current is not UNDEF:
+                    changes.append((self, key, UNDEF))
+                continue
+
+            if isinstance(value, Mapping) and isinstance(current, Model):
+                current._plan_patch(value, (*path, key), changes, affected, records)
+                continue
+
+            if isinstance(value, Mapping):
+                target = current if isinstance(current, Mapping) else {}
+                value = _merge_patch(target, value)
+            count = len(records)
+            validated = self._check_mapping({key: value}, path, records)
+            if len(records) == count:
+                changes.append((self, key, validated[key]))
+
+        if len(changes) > planned:
+            affected.append(self)
+
+    def _apply_patched(self, key, value):
+        """Store a planned patch value, where ``UNDEF`` removes the key."""
+
+        if value is not UNDEF:
+            self._commit_changes({key: value})
+            return
+        self._record_change(key, UNDEF)
+        self._data.pop(key, None)
+        self._forget(key)
+
+    def _forget(self, key):
+        """Drop the bound and cached value of a removed field."""
+
+        if not self.__class__.__compact__ and key in self._bound_fields:
+            self._bound_fields[key]._value = UNDEF
+        self._uncache(key)
+
+    def _uncache(self, key):
+        """Remove the instance attribute caching the value of field ``key``.
+
+        ``object.__delattr__`` keeps the instance dict unmaterialized, so
+        lookups of other instance attributes stay specialized.
+        """
+
+        if self.__class__.__cache_reads__:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                pass
+
+    def dirty_paths(self) -> set[str]:
+        """Return dotted paths changed since creation or ``mark_clean()``.
+
+        Changes inside nested ``Model`` and ``ListOf`` values are reported
+        with their full path, for example ``items.3.price``.
+        """
+
+        return set(self.changes())
+
+    def changes(self, old: bool = False) -> DataDict:
+        """Return changed paths mapped to their current value.
+
+        Removed keys map to ``UNDEF``. With ``old=True`` each path maps to an
+        ``(old, new)`` tuple, where ``old`` is the value at the last clean
+        point or ``UNDEF`` if the key did not exist.
+        """
+
+        return _collect_changes(self, old)
+
+    def _collect_changes(self, prefix: str, result: DataDict, old: bool):
+        """Add own changes to ``result`` and return nested values to visit."""
+
+        changes = self._changes or {}
+        for key, original in changes.items():
+            value = self._data.get(key, UNDEF)
+            result[prefix + key] = (original, value) if old else value
+        return [
+            (f"{prefix}{key}.", value)
+            for key, value in self._data.items()
+            if key not in changes and isinstance(value, (Model, ListOf))
+        ]
+
+    def mark_clean(self):
+        """Forget recorded changes here and in nested models and lists."""
+
+        _mark_clean(self)
+
+    def _clean(self):
+        """Forget own changes and return nested values to clean."""
+
+        with self._lock:
+            object.__setattr__(self, "_changes", None)
+            return [
+                value
+                for value in self._data.values()
+                if isinstance(value, (Model, ListOf))
+            ]
+
+    def to_dataclass[D](self, target: type[D]) -> D:
+        """Return an instance of dataclass ``target`` with the values of this model.
+
+        A function generated once per dataclass type passes stored values
+        straight to the constructor, positionally where the field orders
+        allow it, without copying the data into a ``dict`` first. Fields of
+        ``target`` that this model does not declare keep their defaults, and
+        nested models and lists are passed as they are.
+        """
+
+        return to_dataclass(self, target)
 
     def dict(self):
         """Return data as native `dict` and `list`"""
-        data = {}
-        for key, value in self.items():
+        return _to_native(self)
+
+
+def _to_native(root: Model | ListOf):
+    """Return ``root`` with nested models and lists as native dicts and lists.
+
+    Nested containers are placed when they are reached and filled from an
+    explicit stack, like validation, so data of any depth allowed by
+    ``max_depth`` converts without recursion.
+    """
+
+    result = [root]
+    stack: list[tuple[Any, Iterable[tuple[Any, Any]]]] = [(result, [(0, root)])]
+    while stack:
+        target, items = stack.pop()
+        for key, value in items:
             if isinstance(value, Model):
-                data[key] = value.dict()
+                value.validate_all()
+                with value._lock:
+                    nested = list(value._data.items())
+                value = {}
+                stack.append((value, nested))
             elif isinstance(value, ListOf):
-                data[key] = value.list()
-            else:
-                data[key] = value
-        return data
+                nested = list(value)
+                value = [None] * len(nested)
+                stack.append((value, enumerate(nested)))
+            target[key] = value
+    return result[0]
+
+
+def _equal(model: Model, other: Mapping[str, Any]) -> bool:
+    """Compare ``model`` with a mapping by value, see ``Model.__eq__``.
+
+    Nested models and lists are compared on an explicit stack. Other values
+    compare with ``==``, after an identity check as in ``dict`` comparison.
+    """
+
+    stack: list[tuple[Any, Any]] = [(model, other)]
+    while stack:
+        first, second = stack.pop()
+        if first is second:
+            continue
+        if not isinstance(first, (ListOf, Model)):
+            if not isinstance(second, (ListOf, Model)):
+                if not first == second:
+                    return False
+                continue
+            first, second = second, first
+        if isinstance(first, ListOf):
+            if not isinstance(second, list) or len(first) != len(second):
+                return False
+            stack.extend(zip(first, second))
+            continue
+        if not isinstance(second, Mapping):
+            return False
+        first.validate_all()
+        first = first._data
+        if isinstance(second, Model):
+            second.validate_all()
+            second = second._data
+        if first.keys() != second.keys():
+            return False
+        stack.extend((value, second[key]) for key, value in first.items())
+    return True
+
+
+def _merge_patch(target: Mapping[str, Any], patch_doc: Mapping[str, Any]):
+    """Return a new dict with an RFC 7386 merge patch applied to ``target``."""
+
+    result = dict(target)
+    for key, value in patch_doc.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, Mapping):
+            current = result.get(key)
+            result[key] = _merge_patch(
+                current if isinstance(current, Mapping) else {}, value
+            )
+        else:
+            result[key] = value
+    return result
+
+
+def _restore_model(
+    cls, layout_id, values, extra=None, strict=True, state=None, order=None
+):
+    """Rebuild a pickled Model instance, see ``Model.__reduce__``.
+
+    Values are validated by ``Model.__init__`` rather than the constructor of
+    ``cls``, which may take other arguments, and instance attributes in
+    ``state`` are set afterwards. ``order`` restores the key order of the
+    stored values.
+    """
+
+    if layout_id != cls.__layout_id__:
+        raise pickle.UnpicklingError(
+            f"{cls.__name__} fields changed since the instance was pickled"
+        )
+    data = {
+        key: value for key, value in zip(cls.__fields__, values) if value is not UNDEF
+    }
+    if extra:
+        data.update(extra)
+    if order is not None:
+        data = {key: data[key] for key in order}
+    if cls.__pickle_validate__:
+        instance = cls.__new__(cls)
+        Model.__init__(instance, data, strict=strict)
+    else:
+        instance = cls._from_trusted(data, strict=strict)
+    if state:
+        for key, value in state.items():
+            object.__setattr__(instance, key, value)
+    return instance
+
+
+def _restore_projection(source, keys, *args):
+    """Rebuild a pickled instance of ``source.project(*keys)``."""
+
+    return _restore_model(source.project(*keys), *args)
@@ -0,0 +1,256 @@
+"""Compiled dotted paths for ``Model.get_path()`` and ``Model.set_path()``."""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Mapping
+from functools import cache, lru_cache, reduce
+from types import UnionType
+from typing import TYPE_CHECKING, Any, get_args, get_origin
+
+from ._errors import ErrorPath, ErrorRecord, group_records, records_from_error
+from ._field import ListOf
+from ._sentinel import UNDEF
+from ._utils import _check_type_spec, _strip_annotated_type
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+
+class DataPath:
+    """Keys and list indexes from a model to a nested value.
+
+    Paths use the notation of ``ErrorRecord``: ``"items.3.price"`` as a
+    string, or ``("items", 3, "price")`` as ``ErrorRecord.path``. Digit
+    segments of a string are list indexes, and are used as string keys when
+    the value at that point is a mapping.
+
+    Use ``compile_path()``, which caches compiled paths.
+    """
+
+    __slots__ = ("steps", "location", "_getter")
+
+    def __init__(self, steps: ErrorPath):
+        assert steps, "Path should not be empty"
+        if not all(type(step) in (str, int) for step in steps):
+            raise TypeError(f"Path steps should be str or int: {steps!r}")
+        self.steps = steps
+        self.location = ".".join(str(step) for step in steps)
+        # One chained subscription, like ``root["items"][3]["price"]``. Steps
+        # are ``str`` and ``int`` literals, so their reprs are safe to eval.
+        self._getter = eval(
+            "lambda root: root" + "".join(f"[{step!r}]" for step in steps)
+        )
+
+    def __repr__(self):
+        return f"DataPath({self.location!r})"
+
+    def get(self, root: Model, default: Any = UNDEF) -> Any:
+        """Return the value at this path below ``root``.
+
+        Raises ``KeyError`` with the dotted path when a key or index is
+        missing, unless ``default`` is given.
+        """
+
+        try:
+            return self._getter(root)
+        except (KeyError, IndexError, TypeError):
+            pass
+        # Digit segments may be string keys of mappings, which the chained
+        # subscription looked up as ints.
+        current: Any = root
+        try:
+            for step in self.steps:
+                if type(step) is int and not isinstance(current, list):
+                    step = str(step)
+                current = current[step]
+        except (KeyError, IndexError, TypeError):
+            if default is UNDEF:
+                raise KeyError(self.location) from None
+            return default
+        return current
+
+    def set(self, root: Model, value: Any):
+        """Validate ``value`` and store it at this path below ``root``.
+
+        The value is validated by the nearest model field or ``ListOf`` that
+        holds it. Items of a ``ListOf`` built for a ``list[Item]`` field are
+        checked against the item type of that field. Plain ``dict`` and
+        ``list`` values below that point are copied with the change and
+        validated as a whole by their field.
+        ``post_validate()`` then runs on each model along the path, innermost
+        first. If one fails, the previous value is restored before the error
+        is re-raised.
+        """
+
+        model_type = _model_type()
+        steps = self.steps
+        containers: list[Any] = [root]
+        # The owner is the deepest container reached through models and
+        # lists only. Anything below it is plain data rebuilt with the change.
+        owner = 0
+        current: Any = root
+        try:
+            for step in steps[:-1]:
+                if type(step) is int and not isinstance(current, list):
+                    step = str(step)
+                current = current[step]
+                containers.append(current)
+                # The ``__mro__`` test avoids ``isinstance()`` with an ABC.
+                if owner == len(containers) - 2 and (
+                    isinstance(current, ListOf) or model_type in type(current).__mro__
+                ):
+                    owner += 1
+        except (KeyError, IndexError, TypeError):
+            raise KeyError(self.location) from None
+        container = containers[owner]
+        step = steps[owner]
+        if owner + 1 < len(containers):
+            try:
+                value = _replaced(containers[owner + 1], steps[owner + 1 :], value)
+            except (KeyError, IndexError, TypeError):
+                raise KeyError(self.location) from None
+        prefix = steps[:owner]
+        models = [
+            item for item in containers[: owner + 1] if not isinstance(item, ListOf)
+        ]
+        # Deferred models along the path complete before they change.
+        for model in models:
+            model.validate_all()
+
+        if isinstance(container, ListOf):
+            index = _index(container, step)
+            if index is None:
+                raise KeyError(self.location)
+            if container.types[0] is UNDEF:
+                # Lists of typed fields, such as ``list[Item]``, carry no item
+                # type, so items are checked against the field annotation.
+                records: list[ErrorRecord] = []
+                value = _check_type_spec(
+                    value,
+                    _item_spec(containers, steps, owner),
+                    (*prefix, step),
+                    records,
+                )
+                if records:
+                    raise model_type.Error(group_records(records))
+            else:
+                try:
+                    container._validate(value)
+                except Exception as error:
+                    records = records_from_error(error, (*prefix, step))
+                    raise model_type.Error(group_records(records)) from None
+            with root._lock:
+                previous = container[index]
+                _store_item(container, index, value)
+                try:
+                    for model in reversed(models):
+                        model.post_validate()
+                except BaseException:
+                    _store_item(container, index, previous)
+                    raise
+            return
+
+        key = str(step)
+        try:
+            validated = container._validate_mapping({key: value}, "setitem")[key]
+        except model_type.Error as error:
+            records = [record.prefixed(prefix) for record in error.records]
+            raise model_type.Error(group_records(records)) from None
+        with root._lock:
+            previous = container._data.get(key, UNDEF)
+            container._apply_patched(key, validated)
+            try:
+                for model in reversed(models):
+                    model.post_validate()
+            except BaseException:
+                container._apply_patched(key, previous)
+                raise
+
+
+@lru_cache(maxsize=4096)
+def compile_path(path: str | ErrorPath) -> DataPath:
+    """Return the compiled ``DataPath`` of a dotted string or key tuple."""
+
+    if isinstance(path, str):
+        return DataPath(
+            tuple(
+                int(part) if part.isascii() and part.isdigit() else part
+                for part in path.split(".")
+            )
+        )
+    return DataPath(tuple(path))
+
+
+@cache
+def _model_type() -> type[Model]:
+    from ._model import Model
+
+    return Model
+
+
+def _index(values: list, step: str | int) -> int | None:
+    """Return ``step`` as an index of ``values``, or ``None`` if out of range."""
+
+    try:
+        index = int(step)
+    except ValueError:
+        return None
+    if -len(values) <= index < 0:
+        index += len(values)
+    return index if 0 <= index < len(values) else None
+
+
+def _item_spec(containers: list[Any], steps: ErrorPath, owner: int) -> Any:
+    """Return the item type of the ``ListOf`` at ``containers[owner]``.
+
+    The type comes from the annotation of the model field holding the
+    outermost list, unwrapped once per level of nested lists.
+    """
+
+    model = owner - 1
+    while isinstance(containers[model], ListOf):
+        model -= 1
+    field = type(containers[model]).__fields__.get(str(steps[model]))
+    if field is None:
+        return UNDEF
+    spec = field._runtime_type_spec()
+    for _ in range(model + 1, owner + 1):
+        spec = _strip_annotated_type(spec)
+        if get_origin(spec) is UnionType:
+            options = [
+                get_args(option)[0]
+                for option in map(_strip_annotated_type, get_args(spec))
+                if get_origin(option) is list and get_args(option)
+            ]
+            spec = reduce(operator.or_, options) if options else UNDEF
+        elif get_origin(spec) is list and get_args(spec):
+            spec = get_args(spec)[0]
+        else:
+            return UNDEF
+    return spec
+
+
+def _replaced(container: Any, steps: ErrorPath, value: Any) -> Any:
+    """Return a copy of plain ``container`` with ``value`` at ``steps``."""
+
+    step = steps[0]
+    if isinstance(container, list):
+        copy: Any = list(container)
+        index = _index(copy, step)
+        if index is None:
+            raise IndexError(step)
+    elif isinstance(container, Mapping):
+        copy = dict(container)
+        index = str(step)
+    else:
+        raise TypeError(step)
+    copy[index] = value if len(steps) == 1 else _replaced(copy[index], steps[1:], value)
+    return copy
+
+
+def _store_item(values: Any, index: int, value: Any):
+    """Store a validated item of a ``ListOf`` with change tracking."""
+
+    values._record_change(index, value)
+    list.__setitem__(values, index, value)
@@ -0,0 +1,334 @@
+"""Sampled validation of record streams with per-field drift statistics."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+from ._coerce import coerce, converter_for
+from ._errors import ErrorRecord, group_records
+from ._sentinel import UNDEF
+from ._utils import _check_type_spec, _strip_annotated_type
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+
+class FieldDrift:
+    """Failure counts of one top-level key in a stream.
+
+    ``failures`` and ``codes`` come from fully validated sampled records, so
+    ``failures / sampled`` estimates the failure rate of the whole stream.
+    ``trusted_failures`` counts failed required-key and type checks of the
+    records that were not sampled.
+    """
+
+    __slots__ = ("failures", "codes", "trusted_failures")
+
+    def __init__(self):
+        self.failures = 0
+        self.codes: Counter[str] = Counter()
+        self.trusted_failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "failures": self.failures,
+            "codes": dict(self.codes),
+            "trusted_failures": self.trusted_failures,
+        }
+
+
+class DriftStats:
+    """Counters of a ``Model.from_stream()`` run.
+
+    Attributes
+    ----------
+    records:
+        Records read from the stream.
+    sampled:
+        Records that got full validation.
+    invalid:
+        Records yielded as ``Model.Error``.
+    fields:
+        ``FieldDrift`` per top-level key, created on the first failure of
+        the key. Undeclared keys appear with the ``undefined`` code.
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.sampled = 0
+        self.invalid = 0
+        self.fields: dict[str, FieldDrift] = {}
+
+    def field(self, key: str) -> FieldDrift:
+        drift = self.fields.get(key)
+        if drift is None:
+            drift = self.fields[key] = FieldDrift()
+        return drift
+
+    def failure_rate(self, key: str) -> float:
+        """Return the share of sampled records where ``key`` failed."""
+
+        drift = self.fields.get(key)
+        if drift is None or not self.sampled:
+            return 0.0
+        return drift.failures / self.sampled
+
+    def alerts(self, threshold: float) -> dict[str, float]:
+        """Return keys whose failure rate is above ``threshold``."""
+
+        rates = {key: self.failure_rate(key) for key in self.fields}
+        return {key: rate for key, rate in rates.items() if rate > threshold}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as plain data, for example to log them."""
+
+        return {
+            "records": self.records,
+            "sampled": self.sampled,
+            "invalid": self.invalid,
+            "fields": {key: drift.as_dict() for key, drift in self.fields.items()},
+        }
+
+
+class ModelStream[M: Model]:
+    """Iterator returned by ``Model.from_stream()``.
+
+    Yields an instance for each valid record and a ``Model.Error`` for each
+    invalid one. ``stats`` is updated as records are consumed.
+    """
+
+    def __init__(
+        self,
+        cls: type[M],
+        records: Iterable[Any],
+        sample_rate: float,
+        strict: bool,
+        seed: int | None,
+    ):
+        assert 0.0 <= sample_rate <= 1.0
+        self.cls = cls
+        self.sample_rate = sample_rate
+        self.strict = strict
+        self.stats = DriftStats()
+        self._records = iter(records)
+        self._random = random.Random(seed).random
+
+    def __iter__(self) -> Iterator[M | Model.Error]:
+        return self
+
+    def __next__(self) -> M | Model.Error:
+        record = next(self._records)
+        stats = self.stats
+        stats.records += 1
+        if self._random() < self.sample_rate:
+            stats.sampled += 1
+            result = self._validate(record)
+        else:
+            result = self._trusted(record)
+        if isinstance(result, Exception):
+            stats.invalid += 1
+        return result
+
+    def _validate(self, record) -> M | Model.Error:
+        cls = self.cls
+        if isinstance(record, Mapping):
+            try:
+                return cls(record, strict=self.strict)
+            except cls.Error as error:
+                failed = error.args[0]
+        else:
+            failed = group_records([_type_record(record, Mapping)])
+        for key, records in failed.items():
+            drift = self.stats.field(str(key))
+            drift.failures += 1
+            drift.codes.update(record.code for record in records)
+        return cls.Error(failed)
+
+    def _trusted(self, record) -> M | Model.Error:
+        cls = self.cls
+        if not isinstance(record, Mapping):
+            records = [_type_record(record, Mapping)]
+        else:
+            records = []
+            plan = _stream_plan(cls)
+            fields = cls.__fields__
+            if cls.__projection__ is not None:
+                record = {key: record[key] for key in fields if key in record}
+            for key in cls.__required_keys__:
+                if key not in record:
+                    records.append(ErrorRecord((key,), "required", "Field is required"))
+            data = None
+            for key, value in record.items():
+                entry = plan.get(key)
+                if entry is None:
+                    if self.strict:
+                        records.append(
+                            ErrorRecord((key,), "undefined", "Field is not defined")
+                        )
+                    continue
+                types, converter, build = entry
+                if converter is not None and type(value) is str:
+                    value = coerce(
+                        converter,
+                        value,
+                        fields[key]._runtime_type_spec(),
+                        (key,),
+                        records,
+                    )
+                    if value is UNDEF:
+                        continue
+                elif (
+                    types is not None
+                    and not isinstance(value, types)
+                    and value not in fields[key].grant
+                ):
+                    records.append(
+                        ErrorRecord(
+                            (key,),
+                            "type",
+                            "{0} is not instance of {1}",
+                            (type(value), fields[key]._runtime_type_spec()),
+                        )
+                    )
+                    continue
+                if converter is not None or build is not None:
+                    if data is None:
+                        data = dict(record)
+                    data[key] = value if build is None else build(value)
+            if not records:
+                return cls._from_trusted(
+                    record if data is None else data, strict=self.strict
+                )
+        failed = group_records(records)
+        for key in failed:
+            self.stats.field(str(key)).trusted_failures += 1
+        return cls.Error(failed)
+
+
+# Per class: key -> (shallow runtime types or None, str converter or None,
+# builder of nested models and lists or None).
+_plans: WeakKeyDictionary[type, dict[str, tuple]] = WeakKeyDictionary()
+
+
+def _stream_plan(cls: type[Model]) -> dict[str, tuple]:
+    """Return the trusted-path checks of each field of ``cls``."""
+
+    plan = _plans.get(cls)
+    if plan is None:
+        if not cls.__prepared__:
+            cls._prepare()
+        plan = {}
+        for key, field in cls.__fields__.items():
+            type_spec = _strip_annotated_type(field._runtime_type_spec())
+            converter = cls.__coercers__.get(key)
+            if converter is None and field.coerce:
+                converter = converter_for(type_spec)
+            types = _shallow_types(type_spec)
+            build = _builder(type_spec)
+            # Validation stores any list as ListOf, typed or not.
+            if build is None and (
+                types is None or any(issubclass(list, type_) for type_ in types)
+            ):
+                build = partial(_build_list, None)
+            plan[key] = (types, converter, build)
+        _plans[cls] = plan
+    return plan
+
+
+def _members(type_spec: Any) -> tuple:
+    type_spec = _strip_annotated_type(type_spec)
+    if isinstance(type_spec, tuple):
+        members = type_spec
+    elif get_origin(type_spec) in (Union, UnionType):
+        members = get_args(type_spec)
+    else:
+        members = (type_spec,)
+    return tuple(_strip_annotated_type(member) for member in members)
+
+
+def _shallow_types(type_spec: Any) -> tuple[type, ...] | None:
+    """Return the classes a top-level value of ``type_spec`` may have.
+
+    ``None`` means the spec cannot be checked without looking inside.
+    """
+
+    from ._model import Model
+
+    types: list[type] = []
+    for member in _members(type_spec):
+        origin = get_origin(member)
+        if isinstance(member, type) and issubclass(member, Model):
+            types.append(Mapping)
+        elif isinstance(member, type):
+            types.append(member)
+        elif isinstance(origin, type):
+            types.append(origin)
+        else:
+            return None
+    return tuple(types)
+
+
+def _builder(type_spec: Any) -> Callable[[Any], Any] | None:
+    """Return a function that builds the models and lists of ``type_spec``.
+
+    Values are wrapped the way validation would wrap them, but without
+    validation. Returns ``None`` for specs without nested models or lists.
+    """
+
+    from ._model import Model
+
+    builders = []
+    for member in _members(type_spec):
+        if isinstance(member, type) and issubclass(member, Model):
+            builders.append(partial(_build_model, member))
+        elif get_origin(member) is list:
+            item_types = get_args(member)
+            builders.append(
+                partial(_build_list, _builder(item_types[0]) if item_types else None)
+            )
+    if len(builders) > 1:
+        # Only validation tells which member a value belongs to, so the
+        # member is chosen the way ``Field`` does.
+        return partial(_build_union, type_spec)
+    return builders[0] if builders else None
+
+
+def _build_model(cls: type[Model], value):
+    if not isinstance(value, Mapping) or isinstance(value, cls):
+        return value
+    data = value
+    for key, (_, _, build) in _stream_plan(cls).items():
+        if build is not None and key in value:
+            if data is value:
+                data = dict(value)
+            data[key] = build(value[key])
+    return cls._from_trusted(data)
+
+
+def _build_union(type_spec: Any, value):
+    """Return ``value`` validated as the first member of ``type_spec`` it fits.
+
+    A value that fits no member is returned as it is.
+    """
+
+    return _check_type_spec(value, type_spec, (), [])
+
+
+def _build_list(build: Callable[[Any], Any] | None, value):
+    from ._field import _tracked_list
+
+    if not isinstance(value, list):
+        return value
+    return _tracked_list(value if build is None else [build(item) for item in value])
+
+
+def _type_record(value, type_spec) -> ErrorRecord:
+    return ErrorRecord(
+        (), "type", "{0} is not instance of {1}", (type(value), type_spec)
+    )
@@ -0,0 +1,353 @@
+"""On-disk cache of resolved model schemas for faster process startup."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import operator
+import os
+import re
+import sys
+import tempfile
+import typing
+from functools import reduce
+from pathlib import Path
+from types import GenericAlias, ModuleType, UnionType
+from typing import TYPE_CHECKING, Any, get_args, get_origin
+
+from ._types import FieldTypeMap
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+#: Bumped whenever the on-disk layout or the meaning of an entry changes.
+CACHE_FORMAT = 3
+
+# dictify modules whose behavior affects how annotations are resolved.
+_DICTIFY_MODULES = ("dictify._field", "dictify._model", "dictify._utils")
+
+# First segments of dotted names in string annotations.
+_NAME = re.compile(r"(?<![\w.])([A-Za-z_]\w*)")
+
+# Loaded entries: class key -> (digest, dependency modules, encoded field types).
+_entries: dict[str, tuple[str, tuple[str, ...], dict[str, Any]]] = {}
+
+# Per-process memo of module source digests, keyed by file path.
+_source_digests: dict[str, str] = {}
+
+# Per-process memo of combined digests, keyed by dependency modules.
+_combined_digests: dict[tuple[str, ...], str | None] = {}
+
+
+def _class_key(cls: type) -> str | None:
+    """Return a stable cache key for ``cls`` or ``None`` if it has none."""
+
+    if "<locals>" in cls.__qualname__:
+        return None
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _source_digest(module_name: str) -> str | None:
+    """Return the SHA-256 digest of a loaded module's source file."""
+
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if path is None:
+        return None
+    digest = _source_digests.get(path)
+    if digest is None:
+        try:
+            digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+        _source_digests[path] = digest
+    return digest
+
+
+def _annotation_modules(type_spec: Any, modules: set[str]):
+    """Collect modules that define the runtime types used by ``type_spec``."""
+
+    if isinstance(type_spec, tuple):
+        for item in type_spec:
+            _annotation_modules(item, modules)
+        return
+    for item in get_args(type_spec):
+        _annotation_modules(item, modules)
+    module = getattr(type_spec, "__module__", None)
+    if isinstance(module, str) and module != "builtins":
+        modules.add(module)
+
+
+def _model_bases(cls: type[Model]) -> list[type[Model]]:
+    from ._model import Model
+
+    return [
+        base
+        for base in cls.__mro__
+        if isinstance(base, type) and issubclass(base, Model)
+    ]
+
+
+def _name_modules(name: str, value: Any, own_module: str, modules: set[str]):
+    """Collect modules an annotation name of ``own_module`` resolves through.
+
+    A module bound to ``name`` counts itself. A class or alias bound under
+    its own name is covered by its ``__module__``. Any other binding, such as
+    ``UserId = int`` imported from another module, counts every loaded module
+    that binds ``name`` to the same object, since any of them may define it.
+    """
+
+    if isinstance(value, ModuleType):
+        modules.add(value.__name__)
+        return
+    if getattr(value, "__name__", None) == name:
+        return
+    for module_name, module in list(sys.modules.items()):
+        # ``vars()`` avoids module ``__getattr__`` hooks that may import.
+        namespace = getattr(module, "__dict__", None)
+        if module_name != own_module and namespace and namespace.get(name) is value:
+            modules.add(module_name)
+
+
+def _dependencies(cls: type[Model], field_types: FieldTypeMap) -> tuple[str, ...]:
+    """Return the sorted module names a cached schema depends on.
+
+    Besides the modules of the class, its bases and the resolved types, these
+    are the modules that names in string annotations resolve through.
+    """
+
+    modules = set(_DICTIFY_MODULES)
+    for base in _model_bases(cls):
+        modules.add(base.__module__)
+        namespace = vars(sys.modules[base.__module__])
+        for annotation in base.__dict__.get("__annotations__", {}).values():
+            if not isinstance(annotation, str):
+                continue
+            for name in _NAME.findall(annotation):
+                if name in namespace:
+                    _name_modules(name, namespace[name], base.__module__, modules)
+    for type_spec in field_types.values():
+        _annotation_modules(type_spec, modules)
+    return tuple(sorted(modules))
+
+
+def _evaluated_annotations(cls: type[Model]) -> str:
+    """Return the annotations of ``cls`` and its bases that are not strings.
+
+    They were evaluated when the class was created, possibly from names of
+    other modules, so their ``repr()`` is part of the entry digest. String
+    annotations are text of sources that are already hashed.
+    """
+
+    parts = []
+    for base in _model_bases(cls):
+        for key, annotation in base.__dict__.get("__annotations__", {}).items():
+            if not isinstance(annotation, str):
+                parts.append(f"{base.__qualname__}.{key}={annotation!r}")
+    return "\n".join(parts)
+
+
+def _entry_digest(cls: type[Model], modules_digest: str) -> str:
+    """Return the digest of a cache entry from its modules and annotations."""
+
+    annotations = _evaluated_annotations(cls)
+    if not annotations:
+        return modules_digest
+    digest = hashlib.sha256(modules_digest.encode())
+    digest.update(annotations.encode())
+    return digest.hexdigest()
+
+
+class _Unsupported(Exception):
+    """A type spec that the cache file cannot describe as plain data."""
+
+
+# Scalar types of ``Literal`` arguments that JSON keeps as they are.
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
+# ``typing`` special forms that may appear in cached type specs.
+_TYPING_FORMS = {
+    name: getattr(typing, name) for name in ("Union", "Optional", "Literal")
+}
+
+
+def _encode(type_spec: Any) -> Any:
+    """Return ``type_spec`` as JSON data, see ``_decode()``.
+
+    Classes are stored by module and qualified name, so loading a cache never
+    runs code. Specs with other objects, such as ``Annotated`` metadata, raise
+    ``_Unsupported`` and their model is analyzed normally.
+    """
+
+    if type_spec is Ellipsis:
+        return ["ellipsis"]
+    if type_spec is type(None):
+        return ["none"]
+    if isinstance(type_spec, tuple):
+        return ["tuple", [_encode(item) for item in type_spec]]
+    if isinstance(type_spec, UnionType):
+        return ["union", [_encode(item) for item in get_args(type_spec)]]
+    origin = get_origin(type_spec)
+    if origin is not None:
+        args = get_args(type_spec)
+        if origin is typing.Literal:
+            if not all(type(arg) in _LITERAL_TYPES for arg in args):
+                raise _Unsupported(type_spec)
+            return ["literal", list(args)]
+        return ["generic", _encode(origin), [_encode(arg) for arg in args]]
+    for name, form in _TYPING_FORMS.items():
+        if type_spec is form:
+            return ["typing", name]
+    if isinstance(type_spec, type) and not isinstance(type_spec, GenericAlias):
+        module = type_spec.__module__
+        qualname = type_spec.__qualname__
+        if "<locals>" in qualname:
+            raise _Unsupported(type_spec)
+        return ["type", module, qualname]
+    raise _Unsupported(type_spec)
+
+
+def _decode(data: Any) -> Any:
+    """Return the type spec described by ``_encode()`` data.
+
+    Classes are looked up in modules that are already imported, and a name
+    that does not lead to a class of that module raises ``_Unsupported``.
+    """
+
+    kind = data[0]
+    if kind == "ellipsis":
+        return Ellipsis
+    if kind == "none":
+        return type(None)
+    if kind == "tuple":
+        return tuple(_decode(item) for item in data[1])
+    if kind == "union":
+        return reduce(operator.or_, (_decode(item) for item in data[1]))
+    if kind == "literal":
+        return _TYPING_FORMS["Literal"][tuple(data[1])]
+    if kind == "generic":
+        return _decode(data[1])[tuple(_decode(arg) for arg in data[2])]
+    if kind == "typing":
+        if data[1] not in _TYPING_FORMS:
+            raise _Unsupported(data)
+        return _TYPING_FORMS[data[1]]
+    if kind == "type":
+        module, qualname = data[1], data[2]
+        value: Any = sys.modules.get(module)
+        for name in qualname.split("."):
+            value = getattr(value, name, None)
+        if (
+            not isinstance(value, type)
+            or value.__module__ != module
+            or value.__qualname__ != qualname
+        ):
+            raise _Unsupported(data)
+        return value
+    raise _Unsupported(data)
+
+
+def _digest(modules: tuple[str, ...]) -> str | None:
+    """Return a combined digest for ``modules`` or ``None`` if any is unhashable."""
+
+    digest = hashlib.sha256(f"{CACHE_FORMAT}:{sys.version_info[:2]}".encode())
+    for module in modules:
+        source_digest = _source_digest(module)
+        if source_digest is None:
+            return None
+        digest.update(f"{module}={source_digest};".encode())
+    return digest.hexdigest()
+
+
+def lookup(cls: type[Model]) -> FieldTypeMap | None:
+    """Return cached field types for ``cls`` when the cache entry is current."""
+
+    key = _class_key(cls)
+    if key is None or key not in _entries:
+        return None
+    digest, modules, encoded = _entries[key]
+    if modules not in _combined_digests:
+        _combined_digests[modules] = _digest(modules)
+    modules_digest = _combined_digests[modules]
+    if modules_digest is None or _entry_digest(cls, modules_digest) != digest:
+        return None
+    try:
+        return {field: _decode(data) for field, data in encoded.items()}
+    except Exception:
+        return None
+
+
+def load(path: str | os.PathLike[str]) -> int:
+    """Load cache entries from ``path`` and return how many were read.
+
+    The file is JSON and only names classes, so loading it cannot run code.
+    Missing, unreadable, or incompatible files and malformed entries are
+    ignored so that a stale or broken cache only costs the regular schema
+    analysis.
+    """
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+    except Exception:
+        return 0
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+        return 0
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return 0
+    count = 0
+    for key, entry in entries.items():
+        if (
+            isinstance(entry, list)
+            and len(entry) == 3
+            and isinstance(entry[0], str)
+            and isinstance(entry[1], list)
+            and all(isinstance(module, str) for module in entry[1])
+            and isinstance(entry[2], dict)
+            and all(isinstance(data, list) and data for data in entry[2].values())
+        ):
+            _entries[key] = (entry[0], tuple(entry[1]), entry[2])
+            count += 1
+    return count
+
+
+def dump(path: str | os.PathLike[str], classes: list[type[Model]]) -> int:
+    """Write prepared schemas for ``classes`` to ``path``.
+
+    The file is replaced atomically so concurrent workers never read a
+    partially written cache. Returns the number of entries written.
+    """
+
+    entries = {}
+    for cls in classes:
+        key = _class_key(cls)
+        if key is None:
+            continue
+        cls._prepare()
+        field_types = dict(cls.__field_types__)
+        modules = _dependencies(cls, field_types)
+        modules_digest = _digest(modules)
+        if modules_digest is None:
+            continue
+        try:
+            encoded = {field: _encode(spec) for field, spec in field_types.items()}
+            # Specs that do not survive the round trip are left to analysis.
+            if {field: _decode(data) for field, data in encoded.items()} != (
+                field_types
+            ):
+                continue
+        except Exception:
+            continue
+        entries[key] = [_entry_digest(cls, modules_digest), list(modules), encoded]
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"format": CACHE_FORMAT, "entries": entries}, file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(entries)
@@ -9,5 +9,9 @@ class _UNDEF:
     def __repr__(self):
         return "UNDEF"
 
+    def __reduce__(self):
+        # Unpickle to the shared module-level instance to keep ``is UNDEF``.
+        return "UNDEF"
+
 
 UNDEF = _UNDEF()
@@ -0,0 +1,164 @@
+"""Incremental reading of top-level JSON arrays from memory-mapped files."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import mmap
+import os
+from collections.abc import Iterator
+from typing import Any
+
+#: Bytes decoded per read; windows grow beyond this for larger elements.
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = frozenset(" \t\n\r")
+
+# Characters that may continue a decoded number, as in ``2.`` | ``5``.
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class _ArrayReader:
+    """Sliding text window over a UTF-8 encoded buffer.
+
+    Only the unconsumed tail of the window is kept when more bytes are
+    decoded, so memory stays proportional to the largest element.
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes, chunk_size: int):
+        self.buffer = buffer
+        self.chunk_size = chunk_size
+        self.text = ""
+        # Character index of the next unread character in ``text``.
+        self.index = 0
+        # Byte offset of ``text[index]`` in ``buffer``.
+        self.offset = 0
+        # Byte offset in ``buffer`` right after the end of ``text``.
+        self.end = 0
+
+    @property
+    def at_eof(self) -> bool:
+        return self.end >= len(self.buffer)
+
+    def fill(self, size: int):
+        """Drop consumed text and decode up to ``size`` more bytes."""
+
+        stop = min(self.end + size, len(self.buffer))
+        chunk = self.buffer[self.end : stop]
+        try:
+            piece = chunk.decode()
+        except UnicodeDecodeError as error:
+            # A multi-byte character may be cut at the end of the chunk.
+            if stop == len(self.buffer) or error.start < len(chunk) - 3:
+                raise
+            chunk = chunk[: error.start]
+            piece = chunk.decode()
+        self.text = self.text[self.index :] + piece
+        self.index = 0
+        self.end += len(chunk)
+
+    def advance(self, index: int):
+        """Move past ``text[self.index:index]`` and keep the byte offset."""
+
+        span = self.text[self.index : index]
+        self.offset += len(span) if span.isascii() else len(span.encode())
+        self.index = index
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or ``""`` at the end."""
+
+        while True:
+            text = self.text
+            index = self.index
+            while index < len(text) and text[index] in _WHITESPACE:
+                index += 1
+            self.offset += index - self.index
+            self.index = index
+            if index < len(text):
+                return text[index]
+            if self.at_eof:
+                return ""
+            self.fill(self.chunk_size)
+
+    def decode(self, decoder: json.JSONDecoder) -> tuple[int, Any]:
+        """Decode the next JSON value and return it with its byte offset."""
+
+        size = self.chunk_size
+        while True:
+            try:
+                value, index = decoder.raw_decode(self.text, self.index)
+            except json.JSONDecodeError as error:
+                # Errors away from the end of the window, except unterminated
+                # strings, cannot be fixed by decoding more bytes.
+                truncated = error.pos >= len(self.text) - 6 or error.msg.startswith(
+                    "Unterminated string"
+                )
+                if self.at_eof or not truncated:
+                    raise self.error(error.msg, error.pos) from None
+            else:
+                # A number is only complete when a character that cannot
+                # continue it follows, as ``2.`` or ``1e`` at the end of the
+                # window may continue in bytes that are not decoded yet. Such
+                # a character also ends ``12x``, whose ``x`` is then reported
+                # as a missing delimiter. Other values end with their own
+                # closing character, or fail to decode when cut.
+                text = self.text
+                end = index
+                while end < len(text) and text[end] in _NUMBER_CHARS:
+                    end += 1
+                if (
+                    self.at_eof
+                    or (index < len(text) and type(value) not in (int, float))
+                    or end < len(text)
+                ):
+                    offset = self.offset
+                    self.advance(index)
+                    return offset, value
+            self.fill(size)
+            size *= 2
+
+    def error(self, message: str, index: int | None = None) -> json.JSONDecodeError:
+        """Return a decode error that reports the absolute byte offset."""
+
+        if index is None:
+            index = self.index
+        offset = self.offset + len(self.text[self.index : index].encode())
+        return json.JSONDecodeError(f"{message} (byte {offset})", self.text, index)
+
+
+def iter_json_array(
+    path: str | os.PathLike[str],
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[int, Any]]:
+    """Yield ``(byte offset, element)`` for each element of a JSON array file.
+
+    The file is memory-mapped and decoded in windows of ``chunk_size`` bytes
+    with ``json.JSONDecoder.raw_decode``, so the whole document is never
+    loaded. Raises ``json.JSONDecodeError`` for malformed JSON.
+    """
+
+    decoder = json.JSONDecoder()
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise json.JSONDecodeError("Expecting '[' (byte 0)", "", 0)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            reader = _ArrayReader(buffer, chunk_size)
+            if buffer[: len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                reader.offset = reader.end = len(codecs.BOM_UTF8)
+            if reader.peek() != "[":
+                raise reader.error("Expecting '['")
+            reader.advance(reader.index + 1)
+            if reader.peek() == "]":
+                reader.advance(reader.index + 1)
+            else:
+                while True:
+                    reader.peek()
+                    yield reader.decode(decoder)
+                    delimiter = reader.peek()
+                    if delimiter not in (",", "]"):
+                        raise reader.error("Expecting ',' delimiter")
+                    reader.advance(reader.index + 1)
+                    if delimiter == "]":
+                        break
+            if reader.peek() != "":
+                raise reader.error("Extra data")
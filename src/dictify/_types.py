@@ -17,6 +17,9 @@ DefaultFactory = Callable[[], Any]
 #: Plain string-keyed data mapping used for validated model data.
 DataDict = dict[str, Any]
 
+#: Plain list of items, spelled out for ``ListOf``, whose ``list`` is a method.
+ItemList = list[Any]
+
 #: Mapping of field names to declared ``Field`` definitions.
 if TYPE_CHECKING:
     type FieldMap = dict[str, Field[Any]]
@@ -26,5 +29,11 @@ else:
 #: Mapping of field names to resolved runtime type annotations.
 FieldTypeMap = dict[str, Any]
 
+#: Mapping of field names to value positions in compact model storage.
+KeyIndex = dict[str, int]
+
+#: Mapping of field names to string converters of coerced fields.
+ConverterMap = dict[str, Callable[[str], Any]]
+
 #: Generic field value type.
 T = TypeVar("T")
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Generator, Mapping
 from types import UnionType
 from typing import Annotated, Any, get_args, get_origin
 
+from ._errors import ErrorPath, ErrorRecord
 from ._sentinel import UNDEF
 
 
@@ -62,9 +63,71 @@ def _normalize_simple_type_spec(type_spec: Any):
     return None
 
 
+def _same_value(first, second) -> bool:
+    """Return whether storing ``second`` over ``first`` would be a no-op."""
+
+    if first is second:
+        return True
+    if type(first) is not type(second):
+        return False
+    try:
+        return bool(first == second)
+    except Exception:
+        return False
+
+
 def _validate_type_spec(value, type_spec):
     """Validate a value against a runtime type specification."""
 
+    records: list[ErrorRecord] = []
+    value = _check_type_spec(value, type_spec, (), records)
+    if records:
+        raise AssertionError(records)
+    return value
+
+
+def _check_type_spec(value, type_spec, path: ErrorPath, records: list[ErrorRecord]):
+    """Check a value against a runtime type specification without raising.
+
+    Problems are appended to ``records``. Returns the value to store, which
+    is a ``Model`` or ``ListOf`` for nested document data.
+    """
+
+    type_spec = _strip_annotated_type(type_spec)
+    if type_spec in (UNDEF, Any):
+        return value
+    if isinstance(type_spec, type) and not isinstance(value, Mapping):
+        if not isinstance(value, type_spec):
+            records.append(_type_record(path, value, type_spec))
+        return value
+    return _run_steps(_type_steps(value, type_spec, path, records))
+
+
+def _run_steps(steps: Generator[Any, Any, Any]):
+    """Drive nested validation steps on an explicit stack.
+
+    A step is a generator that yields the step for a nested value and
+    receives its result, so the depth of a document costs list entries
+    instead of interpreter frames. Returns the result of ``steps``.
+    """
+
+    stack = [steps]
+    result = None
+    while stack:
+        try:
+            step = stack[-1].send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+        else:
+            stack.append(step)
+            result = None
+    return result
+
+
+def _type_steps(value, type_spec, path: ErrorPath, records: list[ErrorRecord]):
+    """Return validation steps for ``value`` as used by ``_run_steps``."""
+
     from ._field import ListOf
     from ._model import Model
 
@@ -75,50 +138,84 @@ def _validate_type_spec(value, type_spec):
 
     origin = get_origin(type_spec)
     if origin is UnionType:
-        errors = []
+        attempts = []
         for option in get_args(type_spec):
-            try:
-                return _validate_type_spec(value, option)
-            except Exception as error:
-                errors.append(error)
-        raise AssertionError(errors)
+            option_records: list[ErrorRecord] = []
+            result = yield _type_steps(value, option, path, option_records)
+            if not option_records:
+                return result
+            attempts.append(option_records)
+        records.append(
+            ErrorRecord(
+                path,
+                "union",
+                "{0} does not match any of {1}",
+                (type(value), type_spec, attempts),
+            )
+        )
+        return value
 
     if origin is list:
-        assert isinstance(value, list), f"{type(value)} is not instance of {list}"
+        if not isinstance(value, list):
+            records.append(_type_record(path, value, list))
+            return value
         item_types = get_args(type_spec)
         if not item_types:
             return ListOf(value)
-        return ListOf([_validate_type_spec(item, item_types[0]) for item in value])
+        item_type = _strip_annotated_type(item_types[0])
+        count = len(records)
+        if item_type in (UNDEF, Any):
+            items = value
+        elif isinstance(item_type, type) and issubclass(item_type, Model):
+            items = []
+            for index, item in enumerate(value):
+                if isinstance(item, Mapping):
+                    model = yield item_type._build_steps(item, (*path, index), records)
+                    items.append(item if model is None else model)
+                else:
+                    if not isinstance(item, item_type):
+                        records.append(_type_record((*path, index), item, item_type))
+                    items.append(item)
+        elif isinstance(item_type, type):
+            items = value
+            for index, item in enumerate(value):
+                if not isinstance(item, item_type):
+                    records.append(_type_record((*path, index), item, item_type))
+        else:
+            items = []
+            for index, item in enumerate(value):
+                items.append(
+                    (yield _type_steps(item, item_type, (*path, index), records))
+                )
+        if len(records) > count:
+            return value
+        return ListOf(items)
 
     if isinstance(type_spec, tuple):
-        model_types = tuple(
-            type_
-            for type_ in type_spec
-            if isinstance(type_, type) and issubclass(type_, Model)
-        )
         if isinstance(value, Mapping):
-            for model_cls in model_types:
-                try:
-                    return model_cls(value)
-                except Exception:
-                    pass
-        assert isinstance(value, type_spec), (
-            f"{type(value)} is not instance of {type_spec}"
-        )
+            for type_ in type_spec:
+                if isinstance(type_, type) and issubclass(type_, Model):
+                    model = yield type_._build_steps(value, path, [])
+                    if model is not None:
+                        return model
+        if not isinstance(value, type_spec):
+            records.append(_type_record(path, value, type_spec))
         return value
 
     if isinstance(type_spec, type) and issubclass(type_spec, Model):
         if isinstance(value, Mapping):
-            return type_spec(value)
-        assert isinstance(value, type_spec), (
-            f"{type(value)} is not instance of {type_spec}"
-        )
-        return value
-
-    if isinstance(type_spec, type):
-        assert isinstance(value, type_spec), (
-            f"{type(value)} is not instance of {type_spec}"
-        )
+            model = yield type_spec._build_steps(value, path, records)
+            return value if model is None else model
+        if not isinstance(value, type_spec):
+            records.append(_type_record(path, value, type_spec))
         return value
 
+    if isinstance(type_spec, type) and not isinstance(value, type_spec):
+        records.append(_type_record(path, value, type_spec))
     return value
+
+
+def _type_record(path: ErrorPath, value, type_spec) -> ErrorRecord:
+    return ErrorRecord(
+        path, "type", "{0} is not instance of {1}", (type(value), type_spec)
+    )
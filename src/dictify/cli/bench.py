@@ -0,0 +1,181 @@
+"""Benchmarks of user Model classes against real sample data."""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from .._model import Model
+from .._utils import _check_type_spec
+from .common import load_model
+
+
+def load_samples(path: Path, limit: int | None = None) -> list[tuple[str, Any]]:
+    """Return ``(line, data)`` pairs from a JSON Lines file."""
+
+    samples = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            samples.append((line, json.loads(line)))
+            if limit is not None and len(samples) >= limit:
+                break
+    return samples
+
+
+def time_calls(func: Callable[[Any], Any], inputs: list[Any], rounds: int) -> list[int]:
+    """Return nanoseconds of each ``func(item)`` call over ``rounds`` passes."""
+
+    timings = []
+    for _ in range(rounds):
+        for item in inputs:
+            start = perf_counter_ns()
+            func(item)
+            timings.append(perf_counter_ns() - start)
+    return timings
+
+
+def percentile(sorted_timings: list[int], fraction: float) -> int:
+    """Return the ``fraction`` percentile of already sorted timings."""
+
+    index = min(len(sorted_timings) - 1, int(len(sorted_timings) * fraction))
+    return sorted_timings[index]
+
+
+def measure_retained(cls: type[Model], inputs: list[Any]) -> tuple[float, float]:
+    """Return retained bytes and memory blocks per instance built from ``inputs``."""
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    instances = [cls(data) for data in inputs]
+    blocks = sys.getallocatedblocks() - blocks
+    del instances
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        size = tracemalloc.get_traced_memory()[0]
+        instances = [cls(data) for data in inputs]
+        size = tracemalloc.get_traced_memory()[0] - size
+        del instances
+    finally:
+        tracemalloc.stop()
+    return size / len(inputs), blocks / len(inputs)
+
+
+def profile_fields(
+    cls: type[Model], inputs: Iterable[Any]
+) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+    """Time each top-level field check and each sync validator.
+
+    Returns nanosecond timings keyed by field name and by
+    ``field.validator[position]``. Field timings include nested models and
+    validators.
+    """
+
+    fields = cls.__fields__
+    field_timings: dict[str, list[int]] = {}
+    validator_timings: dict[str, list[int]] = {}
+    for data in inputs:
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                continue
+            start = perf_counter_ns()
+            field._check(value, (key,), [])
+            field_timings.setdefault(key, []).append(perf_counter_ns() - start)
+
+            value = _check_type_spec(value, field._runtime_type_spec(), (key,), [])
+            for position, function in enumerate(field._functions):
+                label = f"{key}.{function.name}[{position}]"
+                start = perf_counter_ns()
+                try:
+                    function(field, value)
+                except Exception:
+                    pass
+                validator_timings.setdefault(label, []).append(
+                    perf_counter_ns() - start
+                )
+    return field_timings, validator_timings
+
+
+def run(
+    spec: str,
+    samples_path: Path,
+    rounds: int = 3,
+    limit: int | None = None,
+    top: int = 5,
+) -> None:
+    """Benchmark ``spec`` against ``samples_path`` and print a report."""
+
+    cls = load_model(spec)
+    samples = load_samples(samples_path, limit)
+    valid: list[tuple[str, Any]] = []
+    first_error = None
+    for line, data in samples:
+        try:
+            cls(data)
+        except (Model.Error, AssertionError) as error:
+            first_error = first_error or error
+            continue
+        valid.append((line, data))
+    print(
+        f"model: {spec}  samples: {len(samples)}  invalid: {len(samples) - len(valid)}"
+    )
+    if isinstance(first_error, Model.Error):
+        print(f"first invalid sample: {first_error.flatten()}")
+    elif first_error is not None:
+        print(f"first invalid sample: {first_error!r}")
+    if not valid:
+        raise SystemExit("error: no valid samples to benchmark")
+
+    lines = [line for line, _ in valid]
+    inputs = [data for _, data in valid]
+    instances = [cls(data) for data in inputs]
+    pairs = list(zip(instances, inputs))
+    operations = {
+        "construct": time_calls(cls, inputs, rounds),
+        "dict": time_calls(Model.dict, instances, rounds),
+        "update": time_calls(lambda pair: pair[0].update(pair[1]), pairs, rounds),
+        "to_json": time_calls(
+            lambda instance: json.dumps(instance.dict(), default=str),
+            instances,
+            rounds,
+        ),
+        "from_json": time_calls(lambda line: cls(json.loads(line)), lines, rounds),
+    }
+
+    print(f"rounds: {rounds}")
+    print(f"{'operation':<10} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10}")
+    for name, timings in operations.items():
+        timings.sort()
+        rate = len(timings) / (sum(timings) / 1e9)
+        p50 = percentile(timings, 0.5) / 1000
+        p99 = percentile(timings, 0.99) / 1000
+        print(f"{name:<10} {rate:12,.0f} {p50:10.1f} {p99:10.1f}")
+
+    size, blocks = measure_retained(cls, inputs)
+    print(f"retained per instance: {size:,.0f} B in {blocks:.1f} blocks")
+
+    field_timings, validator_timings = profile_fields(cls, inputs)
+    for title, timings in (
+        ("slowest fields", field_timings),
+        ("slowest validators", validator_timings),
+    ):
+        if not timings:
+            continue
+        total = sum(sum(values) for values in timings.values())
+        ranked = sorted(timings.items(), key=lambda item: sum(item[1]), reverse=True)
+        print(f"{title}:")
+        for label, values in ranked[:top]:
+            share = sum(values) / total * 100
+            mean = sum(values) / len(values) / 1000
+            print(f"  {label:<32} {share:5.1f}%  {mean:8.2f} us")
@@ -0,0 +1,30 @@
+"""Shared helpers for the installed dictify CLI commands."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from typing import Any
+
+from .._model import Model
+
+
+def load_model(spec: str) -> type[Model]:
+    """Import a Model class from a ``package.module:ClassName`` spec.
+
+    The current directory is importable, so local modules work without
+    installing them.
+    """
+
+    module_name, _, qualname = spec.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"Expected 'package.module:ClassName', got {spec!r}")
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    if not (isinstance(target, type) and issubclass(target, Model)):
+        raise TypeError(f"{spec} is not a Model subclass")
+    return target
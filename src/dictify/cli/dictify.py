@@ -53,6 +53,78 @@ def ai_skill_install() -> None:
     print(f"Installed Dictify skill to {destination}")
 
 
+@app.command(name="bench")
+def bench(
+    *,
+    model: str,
+    samples: Path,
+    rounds: int = 3,
+    limit: int | None = None,
+    top: int = 5,
+) -> None:
+    """Benchmark a Model class against JSON Lines sample data.
+
+    Reports ops/sec and p50/p99 latency for construction, ``dict()``,
+    ``update()`` and JSON round-trips, memory retained per instance, and the
+    slowest top-level fields and validators.
+
+    Parameters
+    ----------
+    model:
+        Model class as ``package.module:ClassName``.
+    samples:
+        JSON Lines file with one sample document per line.
+    rounds:
+        Passes over the samples for each timed operation.
+    limit:
+        Maximum number of samples to read.
+    top:
+        Number of slowest fields and validators to list.
+    """
+
+    from .bench import run
+
+    run(model, samples, rounds=rounds, limit=limit, top=top)
+
+
+@app.command(name="validate")
+def validate(
+    paths: list[str],
+    *,
+    model: str,
+    workers: int = 1,
+    report: Path | None = None,
+    max_errors: int = 100,
+) -> None:
+    """Validate JSON and JSON Lines files against a Model class.
+
+    Files are validated in parallel by a pool of worker processes. A summary
+    line is printed as each file finishes, and the command exits with status
+    1 when any record is invalid or any file cannot be read.
+
+    Parameters
+    ----------
+    paths:
+        Files, directories, or glob patterns such as ``"lake/**/*.jsonl"``.
+        Directories are searched for ``.json``, ``.jsonl`` and ``.ndjson``
+        files.
+    model:
+        Model class as ``package.module:ClassName``.
+    workers:
+        Number of worker processes.
+    report:
+        JSON Lines file receiving one entry per invalid record.
+    max_errors:
+        Maximum number of report entries per file.
+    """
+
+    from .validate import run
+
+    code = run(model, paths, workers=workers, report=report, max_errors=max_errors)
+    if code:
+        raise SystemExit(code)
+
+
 def main() -> None:
     """Run the installed Dictify CLI."""
 
@@ -0,0 +1,220 @@
+"""Parallel validation of JSON and JSON Lines files against a Model class."""
+
+from __future__ import annotations
+
+import codecs
+import glob
+import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from .._model import Model
+from .common import load_model
+
+#: File suffixes collected from directories.
+SUFFIXES = (".json", ".jsonl", ".ndjson")
+
+
+@dataclass
+class FileResult:
+    """Validation summary of one file, as sent back by a worker."""
+
+    path: str
+    records: int = 0
+    invalid: int = 0
+    seconds: float = 0.0
+    #: Report entries for the first invalid records.
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    #: Reason the file could not be read to the end, if any.
+    failure: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0 and self.failure is None
+
+
+def collect_files(patterns: list[str]) -> list[Path]:
+    """Expand directories and glob patterns into a sorted list of files."""
+
+    files: set[Path] = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            files.update(
+                item
+                for item in path.rglob("*")
+                if item.suffix in SUFFIXES and item.is_file()
+            )
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(
+                Path(item)
+                for item in glob.glob(pattern, recursive=True)
+                if os.path.isfile(item)
+            )
+    return sorted(files)
+
+
+def iter_documents(path: Path) -> Iterator[tuple[str, int, Any]]:
+    """Yield ``(location kind, location, document)`` for records in ``path``.
+
+    JSON Lines files report line numbers, and a line that is not valid JSON
+    yields its decode error as the document. JSON files holding an array
+    report byte offsets of elements, and any other JSON file is one record.
+    """
+
+    if path.suffix == ".json":
+        if _first_significant_byte(path) == b"[":
+            from .._stream import iter_json_array
+
+            for offset, document in iter_json_array(path):
+                yield "offset", offset, document
+            return
+        with open(path, encoding="utf-8-sig") as file:
+            yield "offset", 0, json.load(file)
+        return
+
+    with open(path, encoding="utf-8") as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield "line", number, json.loads(line)
+            except json.JSONDecodeError as error:
+                yield "line", number, error
+
+
+def _first_significant_byte(path: Path, chunk_size: int = 4096) -> bytes:
+    """Return the first byte of ``path`` after a UTF-8 BOM and whitespace.
+
+    Returns ``b""`` for a file that holds nothing else.
+    """
+
+    with open(path, "rb") as file:
+        chunk = file.read(chunk_size)
+        if chunk.startswith(codecs.BOM_UTF8):
+            chunk = chunk[len(codecs.BOM_UTF8) :]
+        while chunk:
+            chunk = chunk.lstrip(b" \t\n\r")
+            if chunk:
+                return chunk[:1]
+            chunk = file.read(chunk_size)
+    return b""
+
+
+def validate_file(spec: str, path: str, max_errors: int = 100) -> FileResult:
+    """Validate every record of ``path`` against the Model named by ``spec``.
+
+    Runs in worker processes, so it takes plain arguments and never raises
+    for bad data.
+    """
+
+    cls = load_model(spec)
+    result = FileResult(path)
+    start = perf_counter()
+    try:
+        for kind, location, document in iter_documents(Path(path)):
+            result.records += 1
+            try:
+                if isinstance(document, Exception):
+                    raise document
+                if not isinstance(document, dict):
+                    raise TypeError(f"{type(document)} is not instance of {dict}")
+                cls(document)
+            except Model.Error as error:
+                messages: Any = error.flatten()
+            except Exception as error:
+                messages = {"": [str(error)]}
+            else:
+                continue
+            result.invalid += 1
+            if len(result.errors) < max_errors:
+                result.errors.append({"file": path, kind: location, "errors": messages})
+    except (OSError, ValueError) as error:
+        result.failure = str(error)
+    result.seconds = perf_counter() - start
+    return result
+
+
+def run(
+    spec: str,
+    patterns: list[str],
+    workers: int = 1,
+    report: Path | None = None,
+    max_errors: int = 100,
+) -> int:
+    """Validate files matching ``patterns`` and return the exit code.
+
+    Per-file summaries are printed as files finish, followed by totals.
+    Error entries are written to ``report`` as JSON Lines.
+    """
+
+    load_model(spec)
+    files = collect_files(patterns)
+    if not files:
+        print("No files to validate.")
+        return 2
+
+    start = perf_counter()
+    total = len(files)
+    results: list[FileResult] = []
+    records = 0
+    report_file = open(report, "w", encoding="utf-8") if report else None
+    try:
+        for result in _results(spec, files, workers, max_errors):
+            results.append(result)
+            records += result.records
+            elapsed = perf_counter() - start
+            status = "ok" if result.ok else "FAIL"
+            line = (
+                f"[{len(results)}/{total}] {status:<4} {result.path}  "
+                f"{result.records:,} records  {result.invalid:,} invalid  "
+                f"{result.seconds:.2f} s  ({records / elapsed:,.0f} records/s)"
+            )
+            if result.failure:
+                line += f"  error: {result.failure}"
+            print(line, flush=True)
+            if report_file is not None:
+                for entry in result.errors:
+                    report_file.write(json.dumps(entry, default=str) + "\n")
+                if result.failure:
+                    entry = {"file": result.path, "failure": result.failure}
+                    report_file.write(json.dumps(entry) + "\n")
+    finally:
+        if report_file is not None:
+            report_file.close()
+
+    elapsed = perf_counter() - start
+    invalid = sum(result.invalid for result in results)
+    failed = sum(not result.ok for result in results)
+    print(
+        f"files: {total}  failed: {failed}  records: {records:,}  "
+        f"invalid: {invalid:,}  {elapsed:.2f} s  "
+        f"({records / elapsed:,.0f} records/s)"
+    )
+    if report is not None:
+        print(f"report: {report}")
+    return 1 if failed else 0
+
+
+def _results(
+    spec: str, files: list[Path], workers: int, max_errors: int
+) -> Iterator[FileResult]:
+    """Yield file results in completion order, in-process for one worker."""
+
+    if workers <= 1:
+        for path in files:
+            yield validate_file(spec, str(path), max_errors)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures: list[Future[FileResult]] = [
+            pool.submit(validate_file, spec, str(path), max_errors) for path in files
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -6,6 +6,7 @@ import json
 import re
 import uuid
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Annotated, Any, cast
 
 import pytest
@@ -418,3 +419,1269 @@ def test_subclass():
     html = HTML()
     with pytest.raises(Model.Error):
         html["content_type"] = 1
+
+
+def test_lazy_model_defers_definition_checks():
+    class LazyUser(Model, lazy=True):
+        name: str = cast(Any, Field(default=0))
+
+    assert LazyUser.__prepared__ is False
+    assert "name" in LazyUser.__fields__
+
+    with pytest.raises(Field.DefineError):
+        LazyUser()
+
+
+def test_lazy_model_prepares_on_first_instance():
+    class LazyBase(Model, lazy=True):
+        name: str = cast(Any, Field(required=True))
+
+    class LazyChild(LazyBase):
+        age: int = cast(Any, Field(default=0))
+
+    assert LazyChild.__lazy__ is True
+    child = LazyChild({"name": "child"})
+
+    assert LazyBase.__prepared__ is True
+    assert LazyChild.__prepared__ is True
+    assert LazyChild.__field_types__ == {"name": str, "age": int}
+    with pytest.raises(Model.Error):
+        cast(Any, child).age = "0"
+
+
+def test_prepare_all_prepares_pending_subclasses():
+    class LazyNote(Model, lazy=True):
+        title: str = cast(Any, Field(required=True))
+
+    LazyNote.prepare_all()
+
+    assert LazyNote.__prepared__ is True
+    assert cast(Any, LazyNote.title)._annotation_type is str
+
+
+def _import_models_module(tmp_path, monkeypatch, source: str):
+    import importlib
+    import sys
+
+    module_path = tmp_path / "cached_models.py"
+    module_path.write_text(source, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop("cached_models", None)
+    importlib.invalidate_caches()
+    return importlib.import_module("cached_models")
+
+
+CACHED_MODELS_SOURCE = """
+from __future__ import annotations
+
+from dictify import Field, Model
+
+
+class CachedBase(Model):
+    pass
+
+
+class CachedUser(CachedBase):
+    name: str = Field(required=True)
+    tags: list[str] = Field(default=list)
+"""
+
+
+def test_schema_cache_skips_type_hint_resolution(tmp_path, monkeypatch):
+    from dictify import _schema_cache
+
+    monkeypatch.setattr(_schema_cache, "_entries", {})
+    monkeypatch.setattr(_schema_cache, "_combined_digests", {})
+    module = _import_models_module(tmp_path, monkeypatch, CACHED_MODELS_SOURCE)
+    cache_path = tmp_path / "schema.cache"
+    assert module.CachedBase.save_schema_cache(cache_path) == 2
+
+    assert Model.load_schema_cache(cache_path) == 2
+
+    def fail_resolve(cls):
+        raise AssertionError(f"{cls.__name__} was resolved without the cache")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Model, "_resolve_field_types", classmethod(fail_resolve))
+        module = _import_models_module(tmp_path, monkeypatch, CACHED_MODELS_SOURCE)
+
+    assert module.CachedUser.__field_types__ == {"name": str, "tags": list[str]}
+    with pytest.raises(Model.Error):
+        module.CachedUser({"name": 1})
+
+
+def test_schema_cache_is_ignored_after_source_change(tmp_path, monkeypatch):
+    from dictify import _schema_cache
+
+    monkeypatch.setattr(_schema_cache, "_entries", {})
+    monkeypatch.setattr(_schema_cache, "_source_digests", {})
+    monkeypatch.setattr(_schema_cache, "_combined_digests", {})
+    module = _import_models_module(tmp_path, monkeypatch, CACHED_MODELS_SOURCE)
+    cache_path = tmp_path / "schema.cache"
+    module.CachedBase.save_schema_cache(cache_path)
+    Model.load_schema_cache(cache_path)
+
+    monkeypatch.setattr(_schema_cache, "_source_digests", {})
+    monkeypatch.setattr(_schema_cache, "_combined_digests", {})
+    changed = CACHED_MODELS_SOURCE.replace("name: str", "name: int")
+    module = _import_models_module(tmp_path, monkeypatch, changed)
+
+    assert module.CachedUser.__field_types__["name"] is int
+    assert Model.load_schema_cache(tmp_path / "missing.cache") == 0
+
+
+@pytest.mark.parametrize("future", [True, False])
+def test_schema_cache_is_ignored_after_alias_change(tmp_path, monkeypatch, future):
+    import sys
+
+    from dictify import _schema_cache
+
+    monkeypatch.setattr(_schema_cache, "_entries", {})
+    monkeypatch.setattr(_schema_cache, "_source_digests", {})
+    monkeypatch.setattr(_schema_cache, "_combined_digests", {})
+    source = (
+        "from __future__ import annotations\n" * future
+        + "from cached_aliases import UserId\n"
+        + "from dictify import Field, Model\n\n"
+        + "class CachedBase(Model):\n    pass\n\n"
+        + "class CachedAccount(CachedBase):\n    id: UserId = Field(required=True)\n"
+    )
+    (tmp_path / "cached_aliases.py").write_text("UserId = int\n")
+    module = _import_models_module(tmp_path, monkeypatch, source)
+    cache_path = tmp_path / "schema.cache"
+    assert module.CachedBase.save_schema_cache(cache_path) == 2
+    Model.load_schema_cache(cache_path)
+
+    monkeypatch.setattr(_schema_cache, "_source_digests", {})
+    monkeypatch.setattr(_schema_cache, "_combined_digests", {})
+    (tmp_path / "cached_aliases.py").write_text("UserId = str\n")
+    sys.modules.pop("cached_aliases", None)
+    module = _import_models_module(tmp_path, monkeypatch, source)
+
+    assert module.CachedAccount.__field_types__["id"] is str
+    assert module.CachedAccount({"id": "abc"})["id"] == "abc"
+    sys.modules.pop("cached_aliases", None)
+
+
+def test_schema_cache_is_plain_data(tmp_path, monkeypatch):
+    import pickle
+
+    from dictify import _schema_cache
+
+    monkeypatch.setattr(_schema_cache, "_entries", {})
+    monkeypatch.setattr(_schema_cache, "_combined_digests", {})
+    module = _import_models_module(tmp_path, monkeypatch, CACHED_MODELS_SOURCE)
+    cache_path = tmp_path / "schema.cache"
+    module.CachedBase.save_schema_cache(cache_path)
+    data = json.loads(cache_path.read_text())
+    entry = data["entries"]["cached_models:CachedUser"]
+    assert entry[2]["tags"] == [
+        "generic",
+        ["type", "builtins", "list"],
+        [["type", "builtins", "str"]],
+    ]
+
+    # A name that is not a class of its module is not used.
+    entry[2]["name"] = ["type", "os", "system"]
+    cache_path.write_text(json.dumps(data))
+    assert Model.load_schema_cache(cache_path) == 2
+    assert _schema_cache.lookup(module.CachedUser) is None
+
+    cache_path.write_bytes(pickle.dumps({"format": 1, "entries": {}}))
+    assert Model.load_schema_cache(cache_path) == 0
+
+
+class PickledUser(Model):
+    name: str = cast(Any, Field(required=True).verify(lambda value: len(value) < 10))
+    nickname: str = cast(Any, Field())
+    tags: list[str] = cast(Any, Field(default=list))
+
+
+class TrustedPickledUser(PickledUser, pickle_validate=False):
+    pass
+
+
+def test_model_pickle_round_trip():
+    import pickle
+
+    user = PickledUser({"name": "user", "tags": ["a"]}, strict=False)
+    user["extra"] = 1
+
+    restored = pickle.loads(pickle.dumps(user))
+
+    assert type(restored) is PickledUser
+    assert restored == user
+    assert "nickname" not in restored
+    assert isinstance(restored["tags"], ListOf)
+    assert restored._strict is False
+    assert pickle.loads(pickle.dumps(UNDEF)) is UNDEF
+
+
+class OrderedUser(Model):
+    tags: list[str] = cast(Any, Field(default=list))
+    age: int = cast(Any, Field(default=0))
+    name: str = cast(Any, Field(required=True))
+
+
+def test_model_data_key_order():
+    import copy
+    import pickle
+
+    assert list(OrderedUser({"name": "a"})) == ["tags", "age", "name"]
+    user = OrderedUser({"name": "a", "age": 3})
+    assert list(user) == ["tags", "name", "age"]
+    assert list(copy.copy(user)) == ["tags", "name", "age"]
+    assert list(pickle.loads(pickle.dumps(user))) == ["tags", "name", "age"]
+    assert list(OrderedUser._from_trusted({"age": 3, "name": "a"})) == [
+        "tags",
+        "age",
+        "name",
+    ]
+
+
+class SessionUser(PickledUser):
+    def __init__(self, name: str, session: str):
+        super().__init__({"name": name})
+        self._session = session
+        self._opened = False
+
+
+def test_model_pickle_keeps_subclass_state():
+    import pickle
+
+    user = SessionUser("user", "token")
+    user._opened = True
+    restored = pickle.loads(pickle.dumps(user))
+
+    assert type(restored) is SessionUser
+    assert restored == user
+    assert (restored._session, restored._opened) == ("token", True)
+
+
+def test_model_pickle_without_validation(monkeypatch):
+    import pickle
+
+    user = TrustedPickledUser({"name": "user"})
+    payload = pickle.dumps(user)
+
+    def fail_validate(self, value):
+        raise AssertionError("validation should be skipped")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Field, "validate", fail_validate)
+        restored = pickle.loads(payload)
+
+    assert restored == user
+    with pytest.raises(Model.Error):
+        restored.name = "too-long-for-field"
+
+
+def test_model_pickle_rejects_changed_field_layout(monkeypatch):
+    import pickle
+
+    payload = pickle.dumps(PickledUser({"name": "user"}))
+    monkeypatch.setattr(PickledUser, "__layout_id__", 0)
+
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(payload)
+
+
+async def _id_exists(value):
+    return value.startswith("id-")
+
+
+class AsyncAuthor(Model):
+    id: str = cast(Any, Field(required=True).verify_async(_id_exists))
+
+
+class AsyncPost(Model):
+    title: str = cast(Any, Field(required=True))
+    author: AsyncAuthor = cast(Any, Field(required=True))
+    reviewers: list[AsyncAuthor] = cast(Any, Field(default=list))
+
+
+def test_model_avalidate_runs_async_validators():
+    import asyncio
+
+    post = asyncio.run(AsyncPost.avalidate({"title": "Post", "author": {"id": "id-1"}}))
+    assert post.author.id == "id-1"
+
+    # Async validators do not run on sync construction.
+    AsyncPost({"title": "Post", "author": {"id": "missing"}})
+
+    with pytest.raises(Model.Error) as error:
+        asyncio.run(
+            AsyncPost.avalidate(
+                {
+                    "title": "Post",
+                    "author": {"id": "missing"},
+                    "reviewers": [{"id": "id-2"}, {"id": "missing"}],
+                }
+            )
+        )
+    assert set(error.value.args[0]) == {"author", "reviewers"}
+
+
+def test_model_avalidate_limits_concurrency_and_times_out():
+    import asyncio
+
+    running = 0
+    peak = 0
+
+    async def slow_check(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 if value != "slow" else 1)
+        running -= 1
+        return True
+
+    class Checked(Model):
+        a: str = cast(Any, Field().verify_async(slow_check))
+        b: str = cast(Any, Field().verify_async(slow_check))
+        c: str = cast(Any, Field().verify_async(slow_check))
+
+    asyncio.run(Checked.avalidate({"a": "a", "b": "b", "c": "c"}, concurrency=1))
+    assert peak == 1
+
+    with pytest.raises(Model.Error) as error:
+        asyncio.run(Checked.avalidate({"a": "a", "b": "slow"}, timeout=0.05))
+    assert list(error.value.args[0]) == ["b"]
+
+
+def test_field_avalidate():
+    import asyncio
+
+    field = Field(grant=[None]).instance(str).verify_async(_id_exists)
+
+    assert asyncio.run(field.avalidate("id-1")) == "id-1"
+    assert asyncio.run(field.avalidate(None)) is None
+    with pytest.raises(Field.VerifyError):
+        asyncio.run(field.avalidate("missing"))
+
+
+def test_model_patch_merges_nested_models():
+    note = Note(
+        {
+            "title": "Title",
+            "content": "Content",
+            "user": User({"name": "user1"}),
+            "comments": [{"content": "first", "user": {"name": "user2"}}],
+        }
+    )
+    user = note.user
+
+    note.patch({"user": {"name": "renamed"}, "content": None, "comments": []})
+
+    assert note.user is user
+    assert note.user.name == "renamed"
+    assert "content" not in note
+    assert note.comments == []
+
+    note.patch({"datetime": None})
+    assert isinstance(note.datetime, datetime)
+
+
+def test_model_patch_is_atomic():
+    note = Note({"title": "Title", "content": "Content", "user": {"name": "user1"}})
+    data = note.dict()
+
+    with pytest.raises(Model.Error) as error:
+        note.patch({"content": "New", "user": {"name": 1}, "title": None})
+    assert set(error.value.args[0]) == {"user", "title"}
+    assert note.dict() == data
+
+    # post_validate() rejects equal title and content, so everything rolls back.
+    with pytest.raises(AssertionError):
+        note.patch({"content": "Title", "user": {"name": "user2"}})
+    assert note.dict() == data
+
+
+def test_model_patch_merges_plain_mappings_and_extras():
+    class Settings(Model):
+        options: Any = cast(Any, Field(default=dict))
+
+    settings = Settings({"options": {"a": 1, "b": {"c": 2, "d": 3}}}, strict=False)
+    settings["extra"] = 1
+
+    settings.patch({"options": {"a": None, "b": {"c": None, "e": 4}}, "extra": None})
+
+    assert settings.options == {"b": {"d": 3, "e": 4}}
+    assert "extra" not in settings
+
+    with pytest.raises(Model.Error):
+        Settings().patch({"undefined": None})
+
+
+def test_model_change_tracking():
+    note = Note(
+        {
+            "title": "Title",
+            "content": "Content",
+            "user": {"name": "user1"},
+            "comments": [{"content": "first", "user": {"name": "user2"}}],
+        }
+    )
+    assert note.dirty_paths() == set()
+
+    note.title = "Title"
+    note.content = "New content"
+    note.user.name = "renamed"
+    note.comments[0].content = "edited"
+    assert note.dirty_paths() == {"content", "user.name", "comments.0.content"}
+    assert note.changes(old=True)["content"] == ("Content", "New content")
+
+    note.content = "Content"
+    del note["datetime"]
+    assert "content" not in note.dirty_paths()
+    assert "datetime" in note.dirty_paths()
+
+    note.mark_clean()
+    assert note.dirty_paths() == set()
+    assert note.user.dirty_paths() == set()
+
+    del note.content
+    assert note.changes() == {"content": UNDEF}
+
+
+class TaggedNote(Model):
+    tags: list[str] = cast(Any, Field(default=list))
+    notes = Field()
+    labels: list = cast(Any, Field(default=list))
+
+
+def test_model_change_tracking_of_untyped_lists():
+    for note in (
+        TaggedNote({"notes": ["a"]}),
+        cast(TaggedNote, next(TaggedNote.from_stream([{"notes": ["a"]}], 0))),
+    ):
+        assert isinstance(note.tags, ListOf) and isinstance(note.notes, ListOf)
+        note.tags.append("b")
+        note.notes.insert(0, "z")
+        note.labels.append(1)
+        assert note.changes() == {"tags.0": "b", "notes": ["z", "a"], "labels.0": 1}
+
+
+def test_listof_change_tracking():
+    values = ListOf([1, 2, 3], int)
+
+    values[-1] = 4
+    values.append(5)
+    assert values.changes(old=True) == {"2": (3, 4), "3": (UNDEF, 5)}
+
+    values.insert(0, 0)
+    assert values.changes(old=True) == {"": ([1, 2, 3], values)}
+
+    values.mark_clean()
+    assert values.dirty_paths() == set()
+
+    with pytest.raises(AssertionError):
+        values.extend([6, "7"])
+    assert values == [0, 1, 2, 4, 5]
+
+
+def test_model_error_records():
+    with pytest.raises(Model.Error) as error:
+        Note(
+            {
+                "content": 1,
+                "user": {"name": "user1"},
+                "comments": [
+                    {"content": "first", "user": {"name": "user2"}},
+                    {"content": "second", "user": {}},
+                ],
+                "extra": True,
+            }
+        )
+
+    assert set(error.value.args[0]) == {"title", "content", "comments", "extra"}
+    codes = {record.location: record.code for record in error.value.records}
+    assert codes == {
+        "title": "required",
+        "content": "type",
+        "comments.1.user.name": "required",
+        "extra": "undefined",
+    }
+    assert error.value.flatten()["comments.1.user.name"] == ["Field is required"]
+
+
+def test_field_error_records():
+    field = Field().instance(cast(Any, int | str)).verify(lambda value: value != 0)
+
+    with pytest.raises(Field.VerifyError) as error:
+        field.value = 1.5
+    assert [record.code for record in error.value.records] == ["union"]
+
+    with pytest.raises(Field.VerifyError) as error:
+        field.value = 0
+    assert [record.code for record in error.value.records] == ["verify"]
+
+
+class TreeNode(Model, max_depth=5_000):
+    name: str = cast(Any, Field(required=True))
+    children: list[TreeNode] = cast(Any, Field(default=list))
+    owner: Person = cast(Any, Field())
+
+
+class Person(Model):
+    name: str = cast(Any, Field(required=True))
+
+
+def test_model_recursive_schema():
+    tree = TreeNode(
+        {
+            "name": "root",
+            "owner": {"name": "user1"},
+            "children": [{"name": "leaf", "children": []}],
+        }
+    )
+    assert isinstance(tree.children[0], TreeNode)
+    assert isinstance(tree.owner, Person)
+
+    with pytest.raises(Model.Error) as error:
+        TreeNode({"name": "root", "children": [{"children": []}]})
+    assert [record.location for record in error.value.records] == ["children.0.name"]
+
+
+def test_model_validates_deep_data_iteratively():
+    data: dict[str, Any] = {"name": "leaf"}
+    for _ in range(2_000):
+        data = {"name": "node", "children": [data]}
+
+    tree = TreeNode(data)
+    assert tree.children[0].children[0].name == "node"
+    native = tree.dict()
+    for _ in range(2_000):
+        assert type(native) is dict and type(native["children"]) is list
+        native = native["children"][0]
+    assert native == {"name": "leaf", "children": []}
+    assert tree == TreeNode(data) and tree != TreeNode({"name": "node"})
+
+    leaf = tree
+    while leaf.children:
+        leaf = leaf.children[0]
+    leaf.name = "renamed"
+    assert list(tree.changes()) == [".".join(["children.0"] * 2_000) + ".name"]
+    tree.mark_clean()
+    assert tree.dirty_paths() == set()
+
+    class Shallow(Model, max_depth=6):
+        name: str = cast(Any, Field(required=True))
+        children: list[Shallow] = cast(Any, Field(default=list))
+
+    with pytest.raises(Model.Error) as error:
+        Shallow(data)
+    assert [record.code for record in error.value.records] == ["depth"]
+    assert error.value.records[0].path == ("children", 0) * 4
+
+
+class CompactUser(User, compact=True):
+    pass
+
+
+def test_compact_model_layout():
+    user = CompactUser({"name": "user1"})
+    assert not hasattr(user, "_bound_fields")
+    assert user == {"id": user.id, "name": "user1"}
+    assert list(user) == ["id", "name"]
+    assert user.get("missing") is None
+
+    user.name = "user2"
+    assert user["name"] == "user2"
+    assert user.changes() == {"name": "user2"}
+    with pytest.raises(AttributeError):
+        user.extra = True
+    with pytest.raises(Model.Error):
+        del user.name
+
+    loose = CompactUser({"name": "user1", "extra": 1}, strict=False)
+    assert loose.extra == 1
+    del loose["extra"]
+    assert "extra" not in loose
+    assert len(loose) == 2
+
+
+def test_model_defaults_are_lazy():
+    calls = []
+
+    def make_tags():
+        calls.append(1)
+        return []
+
+    class Post(Model):
+        title: str = cast(Any, Field(default=""))
+        tags: list = cast(Any, Field(default=make_tags))
+        meta: dict = cast(Any, Field(default={"draft": True}))
+
+    # Definition checks may call the factory; construction from data that
+    # sets "tags" must not.
+    calls.clear()
+    post = Post({"tags": ["a"]})
+    assert calls == []
+    assert post == {"title": "", "tags": ["a"], "meta": {"draft": True}}
+
+    first, second = Post(), Post()
+    assert len(calls) == 2
+    assert first.tags is not second.tags
+    assert first.meta is second.meta is cast(Any, Post.meta).default
+    assert first._bound_fields == {}
+    assert first._bound_fields["tags"].value is first.tags
+    assert len(calls) == 2
+
+
+class Query(Model, coerce=True):
+    page: int = cast(Any, Field(default=1))
+    ratio: float | None = cast(Any, Field(default=None))
+    active: bool = cast(Any, Field(default=False))
+    since: datetime | None = cast(Any, Field(default=None))
+    token: uuid.UUID | None = cast(Any, Field(default=None))
+    name: str = cast(Any, Field(default=""))
+    raw: int = cast(Any, Field(default=0, coerce=False))
+
+
+def test_model_coerce_strings():
+    token = uuid.uuid4()
+    query = Query(
+        {
+            "page": "3",
+            "ratio": "0.5",
+            "active": "yes",
+            "since": "2024-01-02T03:04:05",
+            "token": str(token),
+            "name": "42",
+        }
+    )
+    assert query == {
+        "page": 3,
+        "ratio": 0.5,
+        "active": True,
+        "since": datetime(2024, 1, 2, 3, 4, 5),
+        "token": token,
+        "name": "42",
+        "raw": 0,
+    }
+    cast(Any, query).page = "4"
+    assert query.page == 4
+
+    with pytest.raises(Model.Error) as error:
+        Query({"page": "x", "active": "maybe", "raw": "1"})
+    assert {record.location: record.code for record in error.value.records} == {
+        "page": "coerce",
+        "active": "coerce",
+        "raw": "type",
+    }
+    assert error.value.flatten()["page"] == ["Cannot convert 'x' to <class 'int'>"]
+
+
+def test_field_coerce():
+    from decimal import Decimal
+
+    assert Field(coerce=True).instance(Decimal).validate("1.10") == Decimal("1.10")
+    field = Field(coerce=True, grant=["n/a"]).instance(int).verify(lambda v: v > 0)
+    assert field.validate("5") == 5
+    assert field.validate("n/a") == "n/a"
+    with pytest.raises(Field.VerifyError):
+        field.validate("-1")
+
+
+class Listing(Model):
+    price: int = cast(Any, Field(required=True).min(0).max(1_000))
+    title: str = cast(Any, Field(required=True).nonempty().max_len(8).noneof(["test"]))
+    status: str = cast(Any, Field(default="open").anyof(["open", "closed"]))
+    tags: list[str] = cast(Any, Field(default=list).max_len(3).unique_items())
+    rating: float = cast(Any, Field(default=0.0).between(0, 5))
+
+
+def test_field_constraints():
+    listing = Listing({"price": 10, "title": "Lamp", "tags": ["a", "b"]})
+    assert listing.status == "open"
+
+    with pytest.raises(Model.Error) as error:
+        Listing(
+            {
+                "price": -1,
+                "title": "",
+                "status": "sold",
+                "tags": ["a", "a", "b", "c"],
+                "rating": 6.0,
+            }
+        )
+    assert [(record.location, record.code) for record in error.value.records] == [
+        ("price", "min"),
+        ("title", "nonempty"),
+        ("status", "anyof"),
+        ("tags", "max_len"),
+        ("tags", "unique_items"),
+        ("rating", "between"),
+    ]
+    assert error.value.flatten()["price"] == ["-1 is less than 0"]
+
+    assert [constraint.spec for constraint in cast(Any, Listing.title).constraints] == [
+        ("nonempty", ()),
+        ("max_len", (8,)),
+        ("noneof", (["test"],)),
+    ]
+    assert Field().unique_items().validate([[1], [2]]) == [[1], [2]]
+    with pytest.raises(Field.VerifyError):
+        Field().unique_items().min_len(1).validate([{}, {}])
+    with pytest.raises(Field.DefineError):
+        Field(default=-1).min(0)
+
+
+def test_field_adaptive_order():
+    from dictify._adaptive import CHECKPOINT
+
+    calls = []
+
+    def costly(value):
+        calls.append(value)
+        return True
+
+    field = Field(adaptive=True).instance(str).verify(costly).max_len(3)
+    with pytest.raises(Field.VerifyError) as error:
+        field.validate("long")
+    assert [record.code for record in error.value.records] == ["max_len"]
+
+    for _ in range(CHECKPOINT):
+        try:
+            field.validate("long")
+        except Field.VerifyError:
+            pass
+    assert [stats["validator"] for stats in field.adaptive_stats()] == [
+        "max_len",
+        "verify",
+    ]
+    calls.clear()
+    with pytest.raises(Field.VerifyError):
+        field.validate("long")
+    assert calls == []
+    assert field.validate("ok") == "ok"
+    assert calls == ["ok"]
+
+    # The reported error follows the learned order, which is fixed between
+    # checkpoints, so a value failing several validators gets the same error.
+    field = Field(adaptive=True).instance(str).verify(lambda v: "@" in v).max_len(3)
+    for _ in range(CHECKPOINT - 1):
+        try:
+            field.validate("long@")
+        except Field.VerifyError:
+            pass
+    codes = set()
+    for _ in range(3):
+        with pytest.raises(Field.VerifyError) as error:
+            field.validate("long")
+        codes.add(error.value.records[0].code)
+    assert codes == {"max_len"}
+    assert field.adaptive_stats()[0]["validator"] == "max_len"
+
+    # Default fields still run every validator and collect every error.
+    field = Field().instance(str).verify(lambda value: False).max_len(3)
+    with pytest.raises(Field.VerifyError) as error:
+        field.validate("long")
+    assert len(error.value.records) == 2
+
+
+class StreamLine(Model):
+    sku: str = cast(Any, Field(required=True))
+    quantity: int = cast(Any, Field(default=1).min(1))
+
+
+class StreamOrder(Model):
+    id: int = cast(Any, Field(required=True))
+    lines: list[StreamLine] = cast(Any, Field(default=list))
+    note: str | None = cast(Any, Field(default=None))
+
+
+def test_model_from_stream():
+    records = [
+        {"id": 1, "lines": [{"sku": "a", "quantity": 2}]},
+        {"id": "2"},
+        {"lines": [], "extra": True},
+        {"id": 4, "lines": [{"sku": "b", "quantity": 0}]},
+    ]
+
+    stream = StreamOrder.from_stream(records, sample_rate=0.0)
+    first, *results = list(stream)
+    assert isinstance(first, StreamOrder)
+    assert isinstance(first.lines, ListOf)
+    assert isinstance(first.lines[0], StreamLine)
+    assert first == StreamOrder(records[0])
+    assert [type(result) for result in results] == [
+        Model.Error,
+        Model.Error,
+        StreamOrder,  # Nested validators only run on sampled records.
+    ]
+    assert stream.stats.records == 4
+    assert stream.stats.sampled == 0
+    assert stream.stats.invalid == 2
+    assert {
+        key: drift.trusted_failures for key, drift in stream.stats.fields.items()
+    } == {
+        "id": 2,
+        "extra": 1,
+    }
+
+    stream = StreamOrder.from_stream(records, sample_rate=1.0)
+    assert [isinstance(result, Model.Error) for result in stream] == [
+        False,
+        True,
+        True,
+        True,
+    ]
+    stats = stream.stats
+    assert stats.sampled == 4
+    assert stats.fields["lines"].codes == {"min": 1}
+    assert stats.failure_rate("id") == 0.5
+    assert stats.alerts(0.3) == {"id": 0.5}
+    assert stats.as_dict()["fields"]["extra"]["codes"] == {"undefined": 1}
+
+
+class StreamCat(Model):
+    meow: bool = cast(Any, Field(default=True))
+
+
+class StreamDog(Model):
+    bark: bool = cast(Any, Field(default=True))
+
+
+class StreamPet(Model):
+    pet: StreamCat | StreamDog = cast(Any, Field(required=True))
+
+
+class StreamCount(Model):
+    count: int = cast(Any, Field(default=0, coerce=True))
+
+
+def test_model_from_stream_field_coercion():
+    stream = StreamCount.from_stream([{"count": "3"}], sample_rate=0)
+    assert [cast(StreamCount, count).count for count in stream] == [3]
+    assert stream.stats.invalid == 0
+    assert stream.stats.fields == {}
+
+
+def test_model_from_stream_union_members():
+    import dataclasses
+
+    records = [{"pet": {"meow": False}}, {"pet": {"bark": False}}]
+    trusted = list(StreamPet.from_stream(records, sample_rate=0))
+    assert trusted == [StreamPet(record) for record in records]
+    assert [type(cast(StreamPet, pet).pet) for pet in trusted] == [StreamCat, StreamDog]
+
+    @dataclasses.dataclass
+    class PetRow:
+        pet: Any
+
+    pet = StreamPet.from_dataclass(PetRow({"bark": False}), trusted=True)
+    assert type(pet.pet) is StreamDog
+
+
+def test_metrics():
+    from threading import Thread
+
+    from dictify import Metrics, set_metrics
+
+    metrics = Metrics(buckets=[1.0])
+    previous = set_metrics(metrics)
+    try:
+        threads = [Thread(target=User, args=({"name": "user1"},)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with pytest.raises(Model.Error):
+            User({"name": 1})
+        user = User({"name": "user1"})
+        user.name = "user2"
+        user.update({"name": "user3"})
+        values = ListOf([], str)
+        values.append("a")
+        with pytest.raises(AssertionError):
+            values.append(1)
+    finally:
+        set_metrics(previous)
+    User({"name": "user4"})
+
+    user_name = f"{User.__module__}.User"
+    list_name = f"{ListOf.__module__}.ListOf"
+    snapshot = metrics.snapshot()
+    assert snapshot["instances"] == {user_name: 5}
+    init = snapshot["operations"][user_name]["init"]
+    assert (init["count"], init["failed"]) == (6, 1)
+    assert init["buckets"]["+Inf"] == 6
+    assert set(snapshot["operations"][user_name]) == {"init", "setitem", "update"}
+    assert snapshot["operations"][list_name]["item"]["failed"] == 1
+    assert snapshot["failures"] == {
+        list_name: {"": {"invalid": 1}},
+        user_name: {"name": {"type": 1}},
+    }
+
+    module = f'module="{User.__module__}",model="User"'
+    text = metrics.to_prometheus()
+    assert f"dictify_instances_total{{{module}}} 5" in text
+    assert f'dictify_failures_total{{{module},field="name",code="type"}} 1' in text
+    assert (
+        f'dictify_validation_seconds_bucket{{{module},operation="init",le="+Inf"}} 6'
+        in text
+    )
+    assert f'dictify_validation_seconds_count{{{module},operation="update"}} 1' in text
+
+    # Models with the same name in different modules are counted apart.
+    Other = type("User", (Model,), {"__module__": "other.models"})
+    metrics = Metrics()
+    previous = set_metrics(metrics)
+    try:
+        for _ in range(3):
+            User({"name": "user1"})
+        for _ in range(5):
+            Other({})
+    finally:
+        set_metrics(previous)
+    assert metrics.snapshot()["instances"] == {user_name: 3, "other.models.User": 5}
+    text = metrics.to_prometheus()
+    assert f"dictify_instances_total{{{module}}} 3" in text
+    assert 'dictify_instances_total{module="other.models",model="User"} 5' in text
+
+
+def test_model_reuse():
+    query = Query({"page": "2", "name": "search"})
+    query.name = "changed"
+    assert Query.reuse(query, {"active": "yes"}) is query
+    assert query == Query({"active": True})
+    assert query.page == 1
+    assert query.changes() == {}
+
+    user = CompactUser({"name": "user1"})
+    first_id = user.id
+    CompactUser.reuse(user, {"name": "user2"})
+    assert user == {"id": user.id, "name": "user2"}
+    assert user.id != first_id
+
+    for data in ({"name": 1}, {}):
+        with pytest.raises(Model.Error):
+            CompactUser.reuse(user, data)
+    assert user.name == "user2"
+
+    loose = User({"name": "user1", "extra": 1}, strict=False)
+    User.reuse(loose, {"name": "user2", "other": 2})
+    assert loose.name == "user2"
+    assert loose.other == 2
+    assert "extra" not in loose
+
+    class Range(Model):
+        low: int = cast(Any, Field(default=0).instance(int))
+        high: int = cast(Any, Field(required=True).instance(int))
+
+        def post_validate(self):
+            if self.low > self.high:
+                raise ValueError("low is above high")
+
+    for compact in (False, True):
+        Bounds = type("Bounds", (Range,), {}, compact=compact)
+        bounds = Bounds({"low": 1, "high": 5})
+        bounds.high = 6
+        with pytest.raises(ValueError):
+            Bounds.reuse(bounds, {"low": 9, "high": 7})
+        assert dict(bounds) == {"low": 1, "high": 6}
+        assert (bounds.low, bounds.high) == (1, 6)
+        assert bounds.changes() == {"high": 6}
+        Bounds.reuse(bounds, {"high": 2})
+        assert (bounds.low, bounds.high) == (0, 2)
+
+
+def test_model_attribute_reads_are_cached():
+    note = Note({"title": "Title", "content": "Content", "user": {"name": "user1"}})
+    assert note.title == "Title"
+    assert vars(note)["title"] == "Title"
+    assert "datetime" not in vars(note)
+    assert note.datetime is note["datetime"]
+    assert "datetime" in vars(note)
+
+    note["title"] = "Renamed"
+    assert note.title == "Renamed"
+    note.update({"title": "Updated"})
+    assert note.title == "Updated"
+    note.patch({"content": None, "title": "Patched"})
+    assert note.title == "Patched"
+    with pytest.raises(AttributeError):
+        note.content
+    note.content = "Back"
+    assert note.content == "Back"
+    del note.content
+    assert not hasattr(note, "content")
+    Note.reuse(note, {"title": "Reused", "user": {"name": "user2"}})
+    assert (note.title, note.user.name) == ("Reused", "user2")
+
+    user = CompactUser({"name": "user1"})
+    assert user.name == "user1"
+    assert "name" not in vars(user)
+
+
+class PathLine(Model):
+    price: float = cast(Any, Field(default=0.0))
+    tags: dict = cast(Any, Field(default=dict))
+
+
+class PathOrder(Model):
+    lines: list[PathLine] = cast(Any, Field(default=list))
+    limit: float = cast(Any, Field(default=100.0))
+
+    def post_validate(self):
+        assert sum(line.price for line in self.lines) <= self.limit
+
+
+def test_model_get_and_set_path():
+    order = PathOrder({"lines": [{"price": 10.0}, {"price": 20.0, "tags": {"a": 1}}]})
+    assert order.get_path("lines.1.price") == 20.0
+    assert order.get_path(("lines", 1, "tags", "a")) == 1
+    assert order.get_path("lines.5.price", None) is None
+    with pytest.raises(KeyError, match="lines.5.price"):
+        order.get_path("lines.5.price")
+
+    order.set_path("lines.1.price", 30.0)
+    assert order.lines[1].price == 30.0
+    assert order.dirty_paths() == {"lines.1.price"}
+
+    tags = order.lines[1].tags
+    order.set_path("lines.1.tags.b", 2)
+    assert order.lines[1].tags == {"a": 1, "b": 2}
+    assert tags == {"a": 1}
+
+    with pytest.raises(Model.Error) as error:
+        order.set_path("lines.0.price", "free")
+    record = error.value.records[0]
+    assert record.location == "lines.0.price"
+    assert order.get_path(record.path) == 10.0
+
+    with pytest.raises(AssertionError):
+        order.set_path("lines.0.price", 500.0)
+    assert order.lines[0].price == 10.0
+
+    with pytest.raises(KeyError):
+        order.set_path("lines.9.price", 1.0)
+
+    # Whole items are validated against the item type of the field.
+    with pytest.raises(Model.Error) as error:
+        order.set_path("lines.0", {"price": "free"})
+    assert error.value.records[0].location == "lines.0.price"
+    assert order.lines[0].price == 10.0
+    order.set_path("lines.0", {"price": 5.0})
+    assert isinstance(order.lines[0], PathLine)
+    assert order.lines[0].price == 5.0
+
+
+def test_model_project():
+    import pickle
+
+    Summary = Note.project("user", "title")
+    assert Note.project("title", "user") is Summary
+    assert list(Summary.__fields__) == ["title", "user"]
+    assert not issubclass(Summary, Note)
+
+    data = {"title": "Same", "content": "Same", "user": {"name": "user1"}}
+    summary = Summary(data, strict=True)
+    assert dict(summary) == {"title": "Same", "user": summary.user}
+    assert summary.user.name == "user1"
+    restored = pickle.loads(pickle.dumps(summary))
+    assert type(restored) is Summary
+    assert restored == summary
+
+    with pytest.raises(Model.Error) as error:
+        Summary({"content": 1, "user": {}})
+    assert {record.location for record in error.value.records} == {
+        "title",
+        "user.name",
+    }
+    with pytest.raises(KeyError):
+        Note.project("missing")
+
+    # Trusted stream records drop the keys of the source model too.
+    for strict in (True, False):
+        (trusted,) = Summary.from_stream([data], sample_rate=0, strict=strict)
+        assert isinstance(trusted, Summary)
+        assert dict(trusted) == {"title": "Same", "user": trusted.user}
+        assert trusted.user.name == "user1"
+
+
+class AuditEntry(Model, deferred=True):
+    actor: str = cast(Any, Field(required=True))
+    action: str = cast(Any, Field(default="read"))
+    tags: list[str] = cast(Any, Field(default=list))
+
+    def post_validate(self):
+        assert self.get("action") != "forbidden"
+
+
+def test_model_deferred_validation():
+    entry = AuditEntry({"actor": "user1", "tags": "not a list", "extra": 1})
+    assert entry._unchecked is not None
+    # Membership checks keys only, even for invalid or undeclared values.
+    assert all(key in entry for key in ("actor", "action", "tags", "extra"))
+    assert "missing" not in entry
+    assert entry._unchecked == {"actor": "user1", "tags": "not a list", "extra": 1}
+    assert entry.get("missing", "none") == "none"
+    assert entry.get("action") == "read"
+    with pytest.raises(Model.Error):
+        entry.get("tags", [])
+    assert entry.actor == "user1"
+    assert entry["action"] == "read"
+    with pytest.raises(Model.Error) as error:
+        entry.tags
+    assert error.value.records[0].location == "tags"
+    with pytest.raises(Model.Error) as error:
+        entry.validate_all()
+    assert {record.location for record in error.value.records} == {"tags", "extra"}
+    with pytest.raises(Model.Error):
+        dict(entry)
+
+    entry = AuditEntry({"actor": "user1", "tags": ["a"]})
+    assert dict(entry) == {"actor": "user1", "action": "read", "tags": ["a"]}
+    assert entry._unchecked is None
+    entry.action = "write"
+    assert entry.dirty_paths() == {"action"}
+
+    entry = AuditEntry({"actor": "user1", "action": "forbidden"})
+    with pytest.raises(AssertionError):
+        list(entry)
+    with pytest.raises(Model.Error, match="required"):
+        AuditEntry({}).validate_all()
+
+
+def test_model_dataclasses():
+    import dataclasses
+
+    @dataclasses.dataclass(slots=True)
+    class NoteRow:
+        title: str
+        user: User
+        content: str = ""
+        pinned: bool = False
+
+    note = Note({"title": "Title", "user": {"name": "user1"}})
+    row = note.to_dataclass(NoteRow)
+    assert (row.title, row.user, row.content) == ("Title", note.user, "")
+    note.content = "Content"
+    assert note.to_dataclass(NoteRow).content == "Content"
+
+    NoteData = Note.dataclass_type()
+    assert Note.dataclass_type() is NoteData
+    assert dataclasses.fields(cast(Any, NoteData))[0].name == "title"
+    assert not hasattr(NoteData(title="x", user=note.user), "__dict__")
+    data = Note({"title": "Title", "user": {"name": "user1"}}).to_dataclass(NoteData)
+    assert data.content is UNDEF
+    restored = Note.from_dataclass(data)
+    assert "content" not in restored
+    trusted = Note.from_dataclass(data, trusted=True)
+    assert trusted == restored
+
+    with pytest.raises(Model.Error):
+        Note.from_dataclass(NoteRow(title=cast(Any, 1), user=note.user))
+    with pytest.raises(TypeError):
+        note.to_dataclass(dict)
+
+
+def test_model_iter_json_array(tmp_path):
+    elements = [
+        {"name": "user1"},
+        {"name": "ユーザー" * 50},
+        {"id": "not uuid", "name": "user3"},
+        7,
+        {"name": "x" * 300},
+    ]
+    text = "[\n" + ",\n".join(json.dumps(item, ensure_ascii=False) for item in elements)
+    path = tmp_path / "users.json"
+    path.write_bytes((text + "\n]\n").encode())
+
+    results = list(User.iter_json_array(path, chunk_size=16))
+    content = path.read_bytes()
+    offsets = [offset for offset, _ in results]
+    assert offsets == [
+        content.index(json.dumps(item, ensure_ascii=False).encode())
+        for item in elements
+    ]
+    assert [type(result) for _, result in results] == [
+        User,
+        User,
+        Model.Error,
+        Model.Error,
+        User,
+    ]
+    assert cast(User, results[1][1]).name == "ユーザー" * 50
+
+    path.write_text('[{"name": "user1"}, {"name": }]')
+    with pytest.raises(json.JSONDecodeError, match="byte 29"):
+        list(User.iter_json_array(path))
+
+
+def test_iter_json_array_numbers_across_windows(tmp_path):
+    from dictify import _stream
+
+    text = "[2.5, 1e3, -7, 12.25E-1, 30]"
+    path = tmp_path / "numbers.json"
+    path.write_text(text)
+    # Every window size cuts some number, like ``2.`` | ``5``, somewhere.
+    for chunk_size in range(1, len(text) + 1):
+        values = [value for _, value in _stream.iter_json_array(path, chunk_size)]
+        assert values == [2.5, 1e3, -7, 1.225, 30], chunk_size
+
+    # Characters that cannot continue a number end it without decoding more.
+    path.write_text("[12x, " + "1, " * 10_000 + "1]")
+    with pytest.raises(json.JSONDecodeError, match="delimiter \\(byte 3\\)") as error:
+        list(_stream.iter_json_array(path, 4))
+    assert len(error.value.doc) < 16
+
+
+def test_cli_bench_reports_operations(tmp_path, capsys):
+    from dictify.cli import bench
+
+    samples = tmp_path / "users.jsonl"
+    samples.write_text('{"name": "user1"}\n{"name": 1}\n')
+
+    bench.run(f"{__name__}:User", samples, rounds=1)
+    output = capsys.readouterr().out
+    assert "samples: 2  invalid: 1" in output
+    for operation in ("construct", "dict", "update", "to_json", "from_json"):
+        assert operation in output
+    assert "slowest fields:" in output
+
+    with pytest.raises(ValueError):
+        bench.run("dictify.Model", tmp_path)
+
+
+def test_cli_validate_files(tmp_path, capsys):
+    from dictify.cli import validate
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "ok.jsonl").write_text('{"name": "user1"}\n\n{"name": "user2"}\n')
+    (tmp_path / "sub" / "bad.json").write_text('[{"name": "user1"}, {"name": 1}, 2]')
+    (tmp_path / "broken.jsonl").write_text('{"name": "user1"}\n{"name"\n')
+    report = tmp_path / "report.jsonl"
+
+    code = validate.run(f"{__name__}:User", [str(tmp_path)], workers=2, report=report)
+    output = capsys.readouterr().out
+    assert code == 1
+    assert "files: 3  failed: 2  records: 7  invalid: 3" in output
+
+    entries = [json.loads(line) for line in report.read_text().splitlines()]
+    locations = sorted(
+        (Path(entry["file"]).name, entry.get("line", entry.get("offset")))
+        for entry in entries
+    )
+    assert locations == [("bad.json", 20), ("bad.json", 33), ("broken.jsonl", 2)]
+
+    assert validate.run(f"{__name__}:User", [str(tmp_path / "*.jsonl")]) == 1
+    assert validate.run(f"{__name__}:User", [str(tmp_path / "ok.jsonl")]) == 0
+
+
+def test_cli_validate_skips_bom_and_leading_whitespace(tmp_path):
+    from dictify.cli import validate
+
+    padding = "\ufeff" + " \n" * 100
+    array = tmp_path / "array.json"
+    array.write_text(padding + '[{"name": "user1"}, 2]', encoding="utf-8")
+    documents = list(validate.iter_documents(array))
+    assert [document for _, _, document in documents] == [{"name": "user1"}, 2]
+    assert documents[0][1] == len(padding.encode()) + 1
+
+    single = tmp_path / "single.json"
+    single.write_text(padding + '{"name": "user1"}', encoding="utf-8")
+    assert list(validate.iter_documents(single)) == [("offset", 0, {"name": "user1"})]
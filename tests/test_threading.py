@@ -0,0 +1,147 @@
+"""Concurrency stress tests for shared model classes and threadsafe models."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+import pytest
+
+from dictify import Field, ListOf, Model
+
+THREADS = 16
+ROUNDS = 200
+
+
+class Address(Model):
+    city: str = cast(Any, Field(required=True))
+    zip: str = cast(Any, Field(default="00000").match(r"\d{5}$"))
+
+
+class Customer(Model):
+    name: str = cast(Any, Field(required=True).verify(lambda value: len(value) < 20))
+    age: int = cast(Any, Field(default=0).verify(lambda value: value >= 0))
+    address: Address = cast(Any, Field(required=True))
+    tags: list[str] = cast(Any, Field(default=list))
+
+
+class Counter(Model, threadsafe=True):
+    low: int = cast(Any, Field(default=0))
+    high: int = cast(Any, Field(default=0))
+    events: list[int] = cast(Any, Field(default=list))
+
+    def post_validate(self):
+        high = self.get("high", 0)
+        # Let other threads run: none may change the model until this returns.
+        time.sleep(0)
+        assert self.get("low", 0) <= high == self.get("high", 0)
+
+
+def _run_threads(target, *args):
+    barrier = threading.Barrier(THREADS)
+
+    def worker(index):
+        barrier.wait()
+        return target(index, *args)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return list(pool.map(worker, range(THREADS)))
+
+
+def test_shared_model_class_validates_from_many_threads():
+    def build(index):
+        results = []
+        for round_ in range(ROUNDS):
+            name = f"user-{index}-{round_}"
+            customer = Customer(
+                {
+                    "name": name,
+                    "age": round_,
+                    "address": {"city": f"city-{index}"},
+                    "tags": [name],
+                }
+            )
+            assert customer.name == name
+            assert customer.address.city == f"city-{index}"
+            assert customer.tags == [name]
+            with pytest.raises(Model.Error):
+                Customer({"name": name, "age": -1, "address": {"city": "x"}})
+            results.append(customer.dict())
+        return results
+
+    results = _run_threads(build)
+
+    for index, customers in enumerate(results):
+        assert [customer["age"] for customer in customers] == list(range(ROUNDS))
+        assert {customer["address"]["city"] for customer in customers} == {
+            f"city-{index}"
+        }
+
+
+def test_lazy_model_prepares_once_under_concurrent_first_use():
+    prepared = []
+
+    class LazyCustomer(Customer, lazy=True):
+        nickname: str = cast(Any, Field(default=""))
+
+    original = LazyCustomer._resolve_field_types.__func__
+
+    def counting_resolve(cls):
+        prepared.append(cls)
+        return original(cls)
+
+    cast(Any, LazyCustomer)._resolve_field_types = classmethod(counting_resolve)
+
+    def build(index):
+        return LazyCustomer({"name": f"user-{index}", "address": {"city": "x"}})
+
+    customers = _run_threads(build)
+
+    assert prepared == [LazyCustomer]
+    assert len({customer.name for customer in customers}) == THREADS
+
+
+def _mutate_concurrently(counter: Counter):
+    """Write consistent pairs from all threads while taking snapshots."""
+
+    def bump(index):
+        snapshots = []
+        for round_ in range(ROUNDS):
+            value = index * ROUNDS + round_ + 1
+            counter.update({"high": value, "low": value - 1})
+            counter.events.append(index)
+            snapshots.append(counter.dict())
+        return snapshots
+
+    for snapshots in _run_threads(bump):
+        for snapshot in snapshots:
+            assert snapshot["low"] == snapshot["high"] - 1
+
+
+def test_threadsafe_model_serializes_mutations():
+    counter = Counter({"events": []})
+
+    _mutate_concurrently(counter)
+
+    assert counter.low == counter.high - 1
+    assert counter.high % ROUNDS == 0
+    assert len(counter.events) == THREADS * ROUNDS
+    assert sorted(counter.events) == sorted(
+        index for index in range(THREADS) for _ in range(ROUNDS)
+    )
+    assert isinstance(counter.events, ListOf)
+
+
+def test_threadsafe_model_is_picklable():
+    counter = Counter({"high": 1, "events": [1, 2]})
+
+    restored = pickle.loads(pickle.dumps(counter))
+
+    assert restored == counter
+    _mutate_concurrently(restored)
+    assert restored.low == restored.high - 1
+    assert len(restored.events) == THREADS * ROUNDS + 2
+    assert counter == {"low": 0, "high": 1, "events": [1, 2]}